@@ -0,0 +1,230 @@
+"""Criticality of every node in the dependency graph
+
+For each node, finds what fails if that node fails: the number of nodes
+which transitively depend on it, the sectors of the dependencies lost and
+the longest chain of failures. Also computes betweenness centrality (the
+number of shortest dependency paths between other nodes which pass through
+a node) with Brandes' algorithm, from the same breadth-first searches.
+
+Each search runs a whole frontier at a time with NumPy, reusing buffers so
+its cost depends on the size of the cascade, not of the network. Sources are
+split across a pool of worker processes, which share the graph by fork.
+
+Results replace the contents of sos_i_node_criticality, see migration 007.
+"""
+from __future__ import print_function
+import argparse
+import datetime
+import multiprocessing
+import numpy
+from dotenv import load_dotenv, find_dotenv
+import app.db
+from app.graph import edge_ranges, load_graph
+from data_import.bulk import CopyWriter
+from data_import.progress import Progress
+
+CRITICALITY_COLUMNS = (
+    "node_id",
+    "downstream_count",
+    "sector_count",
+    "sectors",
+    "max_depth",
+    "betweenness",
+    "computed_at"
+)
+
+
+class SearchState(object):
+    """Buffers for breadth-first searches over a graph, reset after each
+    search by clearing only the entries it touched
+    """
+    def __init__(self, graph):
+        n = len(graph)
+        self.graph = graph
+        self.depth = numpy.full(n, -1, dtype=numpy.int64)
+        self.sigma = numpy.zeros(n)
+        self.delta = numpy.zeros(n)
+        self.betweenness = numpy.zeros(n)
+
+    def search(self, source):
+        """Search from one source, adding its contribution to betweenness
+
+        Returns (downstream count, sector codes, max depth).
+        """
+        graph = self.graph
+        depth, sigma, delta = self.depth, self.sigma, self.delta
+        depth[source] = 0
+        sigma[source] = 1
+
+        frontier = numpy.array([source], dtype=numpy.int64)
+        reached = [frontier]
+        # (from, to) of edges on shortest paths, one array pair per level
+        levels = []
+        sector_codes = []
+        level = 0
+        while True:
+            counts = graph.indptr[frontier + 1] - graph.indptr[frontier]
+            edges = edge_ranges(graph.indptr[frontier], graph.indptr[frontier + 1])
+            if len(edges) == 0:
+                break
+            level += 1
+            sources = numpy.repeat(frontier, counts)
+            targets = graph.indices[edges]
+            sector_codes.append(graph.edge_sectors[edges])
+
+            unseen = depth[targets] < 0
+            depth[targets[unseen]] = level
+            on_path = depth[targets] == level
+            sources, targets = sources[on_path], targets[on_path]
+            numpy.add.at(sigma, targets, sigma[sources])
+
+            frontier = numpy.unique(targets)
+            if len(frontier) == 0:
+                break
+            levels.append((sources, targets))
+            reached.append(frontier)
+
+        for sources, targets in reversed(levels):
+            numpy.add.at(delta, sources, sigma[sources] / sigma[targets] * (1 + delta[targets]))
+
+        touched = numpy.concatenate(reached)
+        dependents = touched[1:]
+        self.betweenness[dependents] += delta[dependents]
+
+        depth[touched] = -1
+        sigma[touched] = 0
+        delta[touched] = 0
+
+        if sector_codes:
+            sectors = numpy.unique(numpy.concatenate(sector_codes))
+        else:
+            sectors = numpy.zeros(0, dtype=numpy.int64)
+        return len(dependents), sectors, len(levels)
+
+
+def node_criticality(graph, sources):
+    """Search from each of `sources` (node indices)
+
+    Returns (downstream counts, lists of sector codes, max depths) for each
+    source, and the betweenness contribution of these sources to all nodes.
+    """
+    state = SearchState(graph)
+    downstream = numpy.zeros(len(sources), dtype=numpy.int64)
+    max_depth = numpy.zeros(len(sources), dtype=numpy.int64)
+    sectors = []
+    for i, source in enumerate(sources):
+        downstream[i], source_sectors, max_depth[i] = state.search(source)
+        sectors.append(source_sectors)
+    return downstream, sectors, max_depth, state.betweenness
+
+
+_worker_graph = None
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+def _criticality_chunk(sources):
+    return node_criticality(_worker_graph, sources)
+
+
+def all_node_criticality(graph, workers=None, chunks_per_worker=4, progress=None):
+    """Criticality of every node in a graph
+
+    Nodes with no dependents are skipped: nothing else fails with them and
+    they lie on no path. With `workers` of 1 runs in this process, otherwise
+    in a pool of `workers` processes (default, one per CPU).
+
+    Returns arrays of (downstream count, sector code lists, max depth,
+    betweenness), one value per node in graph order.
+    """
+    n = len(graph)
+    downstream = numpy.zeros(n, dtype=numpy.int64)
+    max_depth = numpy.zeros(n, dtype=numpy.int64)
+    betweenness = numpy.zeros(n)
+    sectors = [numpy.zeros(0, dtype=numpy.int64)] * n
+
+    sources = numpy.nonzero(numpy.diff(graph.indptr) > 0)[0]
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    chunks = numpy.array_split(sources, max(1, workers * chunks_per_worker))
+    chunks = [chunk for chunk in chunks if len(chunk)]
+
+    if workers == 1:
+        results = (node_criticality(graph, chunk) for chunk in chunks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(graph, ))
+        results = pool.imap(_criticality_chunk, chunks)
+
+    for chunk, (chunk_downstream, chunk_sectors, chunk_depth, chunk_betweenness) in zip(chunks, results):
+        downstream[chunk] = chunk_downstream
+        max_depth[chunk] = chunk_depth
+        for source, source_sectors in zip(chunk, chunk_sectors):
+            sectors[source] = source_sectors
+        betweenness += chunk_betweenness
+        if progress is not None:
+            progress.written(len(chunk))
+
+    if pool is not None:
+        pool.close()
+        pool.join()
+    return downstream, sectors, max_depth, betweenness
+
+
+def array_literal(values):
+    """Format a list of strings as a postgres array literal
+    """
+    return "{" + ",".join(
+        '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"')) for value in values) + "}"
+
+
+def save_criticality(conn, graph, downstream, sectors, max_depth, betweenness):
+    """Replace the contents of sos_i_node_criticality, in one transaction
+    """
+    now = datetime.datetime.now().isoformat()
+    with conn.cursor() as cur:
+        cur.execute("TRUNCATE sos_i_node_criticality")
+    writer = CopyWriter(conn, "sos_i_node_criticality", CRITICALITY_COLUMNS,
+                        commit_each_batch=False)
+    for i, node_id in enumerate(graph.node_ids):
+        names = [graph.sectors[code] for code in sectors[i] if graph.sectors[code] is not None]
+        writer.add((
+            int(node_id),
+            int(downstream[i]),
+            len(names),
+            array_literal(names),
+            int(max_depth[i]),
+            float(betweenness[i]),
+            now
+        ))
+    writer.close()
+    return writer.rows_written
+
+
+def main():
+    """Rank all nodes by criticality:
+
+        python -m analysis.criticality
+
+    Run again after importing nodes or adding edges.
+    """
+    parser = argparse.ArgumentParser(description="Compute criticality of every node")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    load_dotenv(find_dotenv())
+    conn = app.db.connect()
+
+    graph = load_graph(conn)
+    print("Loaded {} nodes, {} edges".format(len(graph), graph.edge_count()))
+    progress = Progress("sources")
+    results = all_node_criticality(graph, workers=args.workers, progress=progress)
+    progress.finish()
+    count = save_criticality(conn, graph, *results)
+    print("Saved criticality of {} nodes".format(count))
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""Hazard exposure: which nodes and edges a hazard footprint reaches
+
+A footprint is either vector - GeoJSON, or any format fiona reads, such as a
+shapefile - or a raster, such as a flood depth grid read with rasterio.
+
+- vector footprints are intersected with node and edge locations in the
+  database (see `app.hazard`), using the GIST indexes
+- rasters are sampled at every node location: nodes are grouped by raster
+  block and each block is read as a window once, so the whole raster is
+  never held in memory; a node is exposed where the value is at least
+  `threshold`
+
+Exposed nodes can be fed into cascade propagation over the dependency graph
+(see `app.graph`) to find what fails in turn.
+
+fiona and rasterio are only needed for the formats which use them.
+"""
+from __future__ import print_function
+import argparse
+import csv
+import io
+import json
+import numpy
+from dotenv import load_dotenv, find_dotenv
+import app.db
+from app.graph import load_graph
+from app.hazard import exposure_summary, footprint_geometries, get_exposed_edges, get_exposed_nodes
+
+RASTER_EXTENSIONS = (".tif", ".tiff", ".img", ".vrt", ".asc", ".nc")
+
+
+def read_footprint(path):
+    """Read a vector footprint as a list of GeoJSON geometries in WGS84
+    """
+    if path.endswith(".json") or path.endswith(".geojson"):
+        with open(path) as footprint_file:
+            return footprint_geometries(json.load(footprint_file))
+
+    import fiona
+    from fiona.transform import transform_geom
+    geometries = []
+    with fiona.open(path) as collection:
+        crs = collection.crs_wkt or collection.crs
+        for feature in collection:
+            if feature["geometry"] is None:
+                continue
+            geometry = dict(feature["geometry"])
+            if crs:
+                geometry = transform_geom(crs, "EPSG:4326", geometry)
+            geometries.append(geometry)
+    return geometries
+
+
+def load_node_coords(conn):
+    """Load (node ids, types, lon/lat array) for all nodes
+    """
+    with conn.cursor() as cur:
+        buf = io.StringIO()
+        cur.copy_expert("""COPY (
+            SELECT node_id, ST_X(location::geometry), ST_Y(location::geometry), type
+            FROM sos_i_nodes
+            WHERE location IS NOT NULL
+        ) TO STDOUT WITH CSV""", buf)
+
+    buf.seek(0)
+    node_ids, coords, types = [], [], []
+    for node_id, lon, lat, node_type in csv.reader(buf):
+        node_ids.append(int(node_id))
+        coords.append((float(lon), float(lat)))
+        types.append(node_type or None)
+    return numpy.array(node_ids, dtype=numpy.int64), types, numpy.array(coords).reshape(-1, 2)
+
+
+def raster_cells(dataset, lonlat):
+    """Find the (row, col) of each lon/lat point in a raster dataset, or -1
+    for points outside it
+    """
+    xs, ys = lonlat[:, 0], lonlat[:, 1]
+    if dataset.crs is not None and dataset.crs.to_epsg() != 4326:
+        from rasterio.warp import transform
+        xs, ys = transform("EPSG:4326", dataset.crs, xs, ys)
+        xs, ys = numpy.asarray(xs), numpy.asarray(ys)
+
+    cols, rows = ~dataset.transform * (xs, ys)
+    rows = numpy.floor(rows).astype(numpy.int64)
+    cols = numpy.floor(cols).astype(numpy.int64)
+    outside = (rows < 0) | (rows >= dataset.height) | (cols < 0) | (cols >= dataset.width)
+    rows[outside] = -1
+    cols[outside] = -1
+    return rows, cols
+
+
+def sample_raster(path, lonlat, band=1):
+    """Sample a raster band at each of an (n, 2) array of lon/lat points
+
+    Points are grouped by the raster's internal blocks, and each block that
+    contains points is read as one window. Returns an array of values, NaN
+    outside the raster or where the raster has no data.
+    """
+    import rasterio
+    from rasterio.windows import Window
+
+    values = numpy.full(len(lonlat), numpy.nan)
+    with rasterio.open(path) as dataset:
+        rows, cols = raster_cells(dataset, lonlat)
+        inside = numpy.nonzero(rows >= 0)[0]
+        block_height, block_width = dataset.block_shapes[band - 1]
+        block_rows = rows[inside] // block_height
+        block_cols = cols[inside] // block_width
+        nodata = dataset.nodatavals[band - 1]
+
+        order = numpy.lexsort((block_cols, block_rows))
+        inside, block_rows, block_cols = inside[order], block_rows[order], block_cols[order]
+        blocks = numpy.column_stack((block_rows, block_cols))
+        starts = numpy.nonzero(numpy.any(numpy.diff(blocks, axis=0) != 0, axis=1))[0] + 1
+        for points in numpy.split(numpy.arange(len(inside)), starts):
+            if len(points) == 0:
+                continue
+            row_off = block_rows[points[0]] * block_height
+            col_off = block_cols[points[0]] * block_width
+            window = Window(col_off, row_off,
+                            min(block_width, dataset.width - col_off),
+                            min(block_height, dataset.height - row_off))
+            data = dataset.read(band, window=window)
+            point_index = inside[points]
+            sampled = data[rows[point_index] - row_off, cols[point_index] - col_off].astype(float)
+            if nodata is not None:
+                sampled[sampled == nodata] = numpy.nan
+            values[point_index] = sampled
+    return values
+
+
+def raster_exposed_nodes(conn, path, threshold, band=1):
+    """Get (node_id, type) of nodes where a raster is at least `threshold`
+    """
+    node_ids, types, lonlat = load_node_coords(conn)
+    values = sample_raster(path, lonlat, band=band)
+    exposed = numpy.nonzero(values >= threshold)[0]
+    return [(int(node_ids[i]), types[i]) for i in exposed]
+
+
+def main():
+    """Find nodes and edges exposed to a hazard footprint:
+
+        python -m analysis.hazard flood_extent.geojson
+        python -m analysis.hazard flood_extent.shp --cascade
+        python -m analysis.hazard flood_depth.tif --threshold 0.5 --output exposure.json
+
+    Rasters are sampled at node locations only.
+    """
+    parser = argparse.ArgumentParser(description="Overlay a hazard footprint on nodes and edges")
+    parser.add_argument("path_to_file")
+    parser.add_argument("--threshold", type=float, default=0,
+                        help="raster value at or above which a node is exposed")
+    parser.add_argument("--band", type=int, default=1,
+                        help="raster band to sample")
+    parser.add_argument("--cascade", action="store_true",
+                        help="also find nodes which fail in turn")
+    parser.add_argument("--output", default=None,
+                        help="write the full summary as JSON to this file")
+    args = parser.parse_args()
+
+    load_dotenv(find_dotenv())
+    conn = app.db.connect()
+
+    if args.path_to_file.lower().endswith(RASTER_EXTENSIONS):
+        nodes = raster_exposed_nodes(conn, args.path_to_file, args.threshold, band=args.band)
+        edges = None
+    else:
+        geometries = read_footprint(args.path_to_file)
+        nodes = get_exposed_nodes(conn, geometries)
+        edges = get_exposed_edges(conn, geometries)
+
+    graph = load_graph(conn) if args.cascade else None
+    summary = exposure_summary(nodes, edges, graph=graph)
+    conn.close()
+
+    print("{} nodes exposed".format(summary["nodes"]["count"]))
+    for node_type, count in sorted(summary["nodes"]["by_type"].items(), key=lambda item: -item[1]):
+        print("    {}: {}".format(node_type, count))
+    if "edges" in summary:
+        print("{} edges exposed".format(summary["edges"]["count"]))
+        for sector, totals in sorted(summary["edges"]["by_sector"].items(), key=lambda item: str(item[0])):
+            print("    {}: {} ({:.0f}m)".format(sector, totals["count"], totals["length"]))
+    if "cascade" in summary:
+        print("{} more nodes fail in turn, in sectors: {}".format(
+            summary["cascade"]["count"], ", ".join(str(s) for s in summary["cascade"]["sectors"])))
+
+    if args.output is not None:
+        with open(args.output, "w") as output_file:
+            json.dump(summary, output_file)
+
+if __name__ == '__main__':
+    main()
@@ -1,33 +1,95 @@
 """Web frontend - flask app
 """
 from dotenv import load_dotenv, find_dotenv
-from flask import Flask, request, make_response, render_template, safe_join, abort, jsonify
+from flask import Flask, Response, g, request, make_response, safe_join, abort, stream_with_context, url_for
+import flask
+import datetime
 import json
 import os
-import psycopg2
-import psycopg2.extras
 import sys
+from werkzeug.http import http_date
 # todo: fix absolute/relative import (from app.node should work?)
-from node import Node, get_nodes
+from area import get_area, get_areas
+from cache import get_cache
+from changes import get_changes, get_version
+from criticality import get_ranking
+from db import get_pool
+from node import Node, bulk_edit_nodes, clear_lookups, get_nodes, get_nodes_geojson, iter_nodes
 from node_type import get_node_types
-from edge import Edge, get_edges
+from source import get_source_by_short_name
+from edge import Edge, get_edges, get_edges_geojson, iter_edges
+from export import FORMATS as EXPORT_FORMATS, export_chunks
+from features import stream_feature_collection
+from graph import get_graph
+from metrics import current as metrics_current, finish_request, registry, start_request, timed
+from job import STATUSES as JOB_STATUSES, cancel_job, get_job, get_jobs, submit_job
+from hazard import exposure_summary, footprint_geometries, get_exposed_edges, get_exposed_nodes
+from query import next_after_id
+from tiles import TilesUnavailable, get_edge_tile, get_node_tile, valid_tile
 
 # load environment variables
 load_dotenv(find_dotenv())
 
 PY3 = (sys.version_info[0] == 3)
 DEBUG = (os.environ.get("DEBUG") == "true")
+# build collection GeoJSON in postgres rather than from python objects
+GEOJSON_FROM_DATABASE = (os.environ.get("GEOJSON_FROM_DATABASE") == "true")
 SITE_ROOT = os.path.realpath(os.path.dirname(__file__))
 DATA_DIR = os.path.join(SITE_ROOT, "data")
+# rows per page in HTML lists
+PAGE_SIZE = 500
+# send per-phase timings in a Server-Timing header
+SERVER_TIMING = (os.environ.get("SERVER_TIMING") == "true")
 
 app = Flask(__name__)
 app.debug = DEBUG
 
+def render_template(template_name, **context):
+    """Render a template, timed as the "render" phase of the request
+    """
+    with timed("render"):
+        return flask.render_template(template_name, **context)
+
+def jsonify(*args, **kwargs):
+    """Build a JSON response, timed as the "serialize" phase of the request
+    """
+    with timed("serialize"):
+        return flask.jsonify(*args, **kwargs)
+
+@app.before_request
+def start_timing():
+    start_request()
+
+@app.after_request
+def finish_timing(response):
+    """Add a Server-Timing header if configured, and report timings once
+    the response has been sent
+
+    Streamed responses only include phases up to the first chunk in the
+    header, but their metrics cover the whole response.
+    """
+    timings = metrics_current()
+    if SERVER_TIMING and timings is not None:
+        response.headers["Server-Timing"] = timings.server_timing()
+
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    method = request.method
+    status = response.status_code
+    response.call_on_close(lambda: finish_request(route, method, status))
+    return response
+
+@app.route("/metrics")
+def metrics():
+    """Request and SQL latency histograms, in the Prometheus text format
+    """
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
+
 @app.route("/")
 def hello():
-    """Render index.html page at site root
+    """Render index.html page at site root, with the map of nodes and edges
+    drawn from vector tiles
     """
-    return render_template("index.html")
+    return render_template("index.html", node_types=get_node_types(get_conn()))
 
 @app.errorhandler(404)
 def page_not_found(error):
@@ -44,34 +106,232 @@ def server_error(error):
     return render_template('500.html'), 500
 
 def get_conn():
-    return psycopg2.connect("dbname=vagrant user=vagrant", cursor_factory=psycopg2.extras.DictCursor)
+    """Get a database connection for this request
+
+    The connection is checked out of the pool on first use and returned when
+    the request ends, so calling this again within a request is cheap.
+    """
+    if "conn" not in g:
+        with timed("connect"):
+            g.conn = get_pool().getconn()
+    return g.conn
+
+@app.teardown_appcontext
+def return_conn(error):
+    """Return this request's connection, if any, to the pool
+    """
+    conn = g.pop("conn", None)
+    if conn is not None:
+        get_pool().putconn(conn)
+
+@app.route("/status/pool.json")
+def pool_status():
+    """Connection pool stats
+    """
+    return jsonify(get_pool().stats())
+
+def list_arg(name):
+    """Read a comma-separated list from request args
+    """
+    value = request.args.get(name)
+    if not value:
+        return None
+    return value.split(",")
+
+def int_arg(name, default=None):
+    value = request.args.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        abort(400)
+
+def limit_arg(default=None):
+    """Read a `limit` of at least 1 from request args
+    """
+    limit = int_arg("limit", default)
+    if limit is not None and limit < 1:
+        abort(400)
+    return limit
+
+def bbox_arg():
+    """Read `bbox=min_lon,min_lat,max_lon,max_lat` from request args
+    """
+    value = request.args.get("bbox")
+    if not value:
+        return None
+    try:
+        bbox = tuple(float(part) for part in value.split(","))
+    except ValueError:
+        abort(400)
+    if len(bbox) != 4:
+        abort(400)
+    return bbox
+
+def datetime_arg(name):
+    """Read an ISO 8601 date or datetime (UTC) from request args, as an
+    aware datetime in UTC
+    """
+    value = request.args.get(name)
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            parsed = datetime.datetime.strptime(value.rstrip("Z"), fmt)
+            return parsed.replace(tzinfo=datetime.timezone.utc)
+        except ValueError:
+            pass
+    abort(400)
+
+def node_filters(default_limit=None):
+    """Node filters and pagination from request args
+    """
+    return {
+        "area": request.args.get("area"),
+        "bbox": bbox_arg(),
+        "node_types": list_arg("type"),
+        "statuses": list_arg("status"),
+        "updated_since": datetime_arg("updated_since"),
+        "min_downstream": int_arg("min_downstream"),
+        "after_id": int_arg("after_id"),
+        "limit": limit_arg(default_limit)
+    }
+
+def edge_filters(default_limit=None):
+    """Edge filters and pagination from request args
+    """
+    return {
+        "bbox": bbox_arg(),
+        "sectors": list_arg("sector"),
+        "updated_since": datetime_arg("updated_since"),
+        "after_id": int_arg("after_id"),
+        "limit": limit_arg(default_limit)
+    }
+
+def next_page_url(endpoint, after_id):
+    """URL for the next page of a list, keeping the other request args
+    """
+    if after_id is None:
+        return None
+    args = request.args.to_dict()
+    args["after_id"] = after_id
+    return url_for(endpoint, **args)
+
+def stream_features(items, limit):
+    """Stream a FeatureCollection of nodes or edges, ending with the cursor
+    for the next page
+    """
+    page = {"count": 0, "last_id": None}
+
+    def features():
+        for item in items:
+            page["count"] += 1
+            page["last_id"] = item.id
+            yield item.as_geojson_feature_dict()
+
+    def members():
+        return {"next_after_id": next_after_id(page["last_id"], page["count"], limit)}
+
+    return stream_feature_collection(features(), members=members)
+
+def cached_collection(namespace, version, build):
+    """Serve a JSON collection through the response cache
+
+    `version` is the (change_id, changed_at) of the latest change to the
+    data (see `changes.get_version`), and `build` returns the body as an
+    iterable of text chunks.
+    Responses carry an ETag and Last-Modified; a request whose If-None-Match
+    matches gets a 304 without the body being built, and a cached body with
+    a matching ETag is served without querying the rows.
+    """
+    cache = get_cache()
+    key = cache.key(namespace, request.args.items(multi=True))
+    etag = cache.etag(key, version)
+    _, changed_at = version
+    last_modified = http_date(changed_at) if changed_at is not None else None
+
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        entry = cache.get(key, etag)
+        if entry is not None:
+            response = Response(entry["body"], mimetype="application/json")
+        else:
+            chunks = cache.tee(key, etag, last_modified, build())
+            response = Response(chunks, mimetype="application/json")
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.headers["Last-Modified"] = last_modified
+    # clients may keep the body, but should revalidate before using it
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 @app.route("/nodes.html")
 def nodes_page():
-    """List nodes
+    """List nodes, a page at a time, or the most critical nodes first with
+    `sort=criticality`
     """
+    filters = node_filters(default_limit=PAGE_SIZE)
+    sort = request.args.get("sort")
+    if sort not in (None, "criticality") or (sort and filters["after_id"] is not None):
+        abort(400)
+
     with get_conn() as conn:
-        # todo: include search/filter form, GET variables
-        nodes = get_nodes(conn)
+        nodes = get_nodes(conn, sort=sort, **filters)
 
-    return render_template("node_list.html", nodes=nodes)
+    next_url = None
+    if sort is None:
+        last_id = nodes[-1].id if nodes else None
+        next_url = next_page_url("nodes_page", next_after_id(last_id, len(nodes), filters["limit"]))
+    return render_template("node_list.html", nodes=nodes, next_url=next_url)
 
 @app.route("/nodes.json")
 def nodes_json():
     """Serve json data from postgres
+
+    Accepts area, bbox, type, status, updated_since, min_downstream,
+    after_id and limit args; the collection ends with `next_after_id`, the cursor for the next
+    page.
+
+    Streamed from a server-side cursor, so memory use stays constant
+    whatever the size of the area. With GEOJSON_FROM_DATABASE, postgres
+    builds the whole FeatureCollection and the text is passed straight
+    through.
+
+    Responses are cached, see `cached_collection`.
     """
-    # todo: push getting nodes down into app.node
-    # utility method to get NodeCollection.asJSON()
-    with get_conn() as conn:
-        area_name = request.args.get('area')
-        nodes = get_nodes(conn, area=area_name)
-        features = [node.as_geojson_feature_dict() for node in nodes]
+    filters = node_filters()
 
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features
-        }
-    return jsonify(geojson)
+    def build():
+        if GEOJSON_FROM_DATABASE:
+            return [get_nodes_geojson(get_conn(), **filters)]
+        return stream_with_context(generate())
+
+    def generate():
+        nodes = iter_nodes(get_conn(), **filters)
+        for chunk in stream_features(nodes, filters["limit"]):
+            yield chunk
+
+    version = get_version(get_conn(), criticality=filters["min_downstream"] is not None)
+    return cached_collection("nodes", version, build)
+
+@app.route("/criticality.json")
+def criticality_json():
+    """Rank nodes by criticality, as last computed by `analysis.criticality`
+
+    Accepts `limit` (default 100), `type`, `sector` and `area` args.
+    """
+    with get_conn() as conn:
+        ranking = get_ranking(
+            conn,
+            limit=limit_arg(100),
+            node_types=list_arg("type"),
+            sector=request.args.get("sector"),
+            area=request.args.get("area")
+        )
+    return jsonify(nodes=ranking)
 
 @app.route("/nodes/<node_id>.html")
 def node_page(node_id):
@@ -92,6 +352,92 @@ def node_json(node_id):
     node, node_types = get_node_and_types(node_id)
     return jsonify(node=node, node_types=node_types)
 
+@app.route("/nodes/<int:node_id>/cascade.json")
+def node_cascade(node_id):
+    """List the nodes which would fail, directly or in turn, if a node failed
+
+    Each failed node has its depth (hops from this node), the node through
+    which it failed and the sector of that dependency. Takes an optional
+    `max_depth`.
+    """
+    graph = get_graph(get_conn())
+    try:
+        cascade = graph.cascade_dict(node_id, max_depth=int_arg("max_depth"))
+    except KeyError:
+        abort(404)
+    return jsonify(cascade)
+
+@app.route("/hazard/exposure.json", methods=['POST'])
+def hazard_exposure():
+    """Find nodes and edges exposed to a hazard footprint
+
+    Takes a GeoJSON geometry, Feature or FeatureCollection in WGS84 as the
+    request body. Returns exposed nodes grouped by type and edges grouped by
+    sector, and with `cascade=true`, the nodes which would fail in turn.
+    """
+    geojson = request.get_json(silent=True)
+    if not isinstance(geojson, dict):
+        abort(400)
+    try:
+        geometries = footprint_geometries(geojson)
+    except ValueError:
+        abort(400)
+
+    conn = get_conn()
+    nodes = get_exposed_nodes(conn, geometries)
+    edges = get_exposed_edges(conn, geometries)
+    graph = None
+    if request.args.get("cascade") == "true":
+        graph = get_graph(conn)
+    return jsonify(exposure_summary(nodes, edges, graph=graph))
+
+@app.route("/nodes/bulk.json", methods=['POST'])
+def nodes_bulk_edit():
+    """Change status and/or edit fields of many nodes at once
+
+    Takes a JSON body like:
+
+        {
+            "filter": {"area": "uk", "source": "osm_extract", "type": ["school"],
+                       "id": [1, 2, 3], "status": ["staged"]},
+            "status": "approved",
+            "fields": {"condition": "good"}
+        }
+
+    where at least one filter is required. Status changes follow the same
+    rules as for single nodes. Returns the number of nodes matched, updated,
+    unchanged and forbidden.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+    filters = data.get("filter") or {}
+    if not isinstance(filters, dict):
+        abort(400)
+
+    conn = get_conn()
+    try:
+        data_source_id = None
+        if filters.get("source"):
+            data_source_id = get_source_by_short_name(conn, filters["source"]).id
+        counts = bulk_edit_nodes(
+            conn,
+            area=filters.get("area"),
+            data_source_id=data_source_id,
+            node_types=filters.get("type"),
+            node_ids=filters.get("id"),
+            statuses=filters.get("status"),
+            status=data.get("status"),
+            fields=data.get("fields")
+        )
+    except ValueError as error:
+        conn.rollback()
+        return jsonify(error=str(error)), 400
+
+    conn.commit()
+    clear_lookups()
+    return jsonify(counts)
+
 @app.route("/nodes/<node_id>.html", methods=['POST'])
 def node_change(node_id):
     """Endpoint for update/delete
@@ -102,6 +448,7 @@ def node_change(node_id):
     if data.get("x-method") == "DELETE":
         with get_conn() as conn:
             node.delete(conn)
+        clear_lookups()
 
         return render_template("generic_deleted.html", type="Node")
 
@@ -119,6 +466,7 @@ def node_change(node_id):
 
         with get_conn() as conn:
             node.save(conn)
+        clear_lookups()
         return render_template("node_single_edit.html", node=node, node_types=node_types)
 
 def get_node_and_types(node_id):
@@ -142,39 +490,205 @@ def get_node_and_types(node_id):
 def areas_page():
     """List available areas
     """
-    # todo: create table, select
-    areas = ["gaza", "uk"]
+    areas = get_areas(get_conn())
     return render_template("area_list.html", areas=areas)
 
 @app.route("/areas/<area_name>")
 def area_page(area_name):
     """Area details
     """
-    return render_template("area_single.html", area=area_name)
+    area = get_area(get_conn(), area_name)
+    if area is None:
+        abort(404)
+    return render_template("area_single.html", area=area)
 
 @app.route("/edges.html")
 def edges_page():
-    """List edges
+    """List edges, a page at a time
     """
+    filters = edge_filters(default_limit=PAGE_SIZE)
     with get_conn() as conn:
-        # todo: include search/filter form, GET variables
-        edges = get_edges(conn)
+        edges = get_edges(conn, **filters)
 
-    return render_template("edge_list.html", edges=edges)
+    last_id = edges[-1].id if edges else None
+    next_url = next_page_url("edges_page", next_after_id(last_id, len(edges), filters["limit"]))
+    return render_template("edge_list.html", edges=edges, next_url=next_url)
 
 @app.route("/edges.json")
 def edges_json():
-    """List edges as geojson
+    """List edges as geojson, streamed from a server-side cursor, or built
+    by postgres with GEOJSON_FROM_DATABASE
+
+    Accepts bbox, sector, updated_since, after_id and limit args. Responses
+    are cached, see `cached_collection`.
     """
-    with get_conn() as conn:
-        edges = get_edges(conn)
-        features = [edge.as_geojson_feature_dict() for edge in edges]
+    filters = edge_filters()
 
-        geojson = {
-            "type": "FeatureCollection",
-            "features": features
-        }
-    return jsonify(geojson)
+    def build():
+        if GEOJSON_FROM_DATABASE:
+            return [get_edges_geojson(get_conn(), **filters)]
+        return stream_with_context(generate())
+
+    def generate():
+        edges = iter_edges(get_conn(), **filters)
+        for chunk in stream_features(edges, filters["limit"]):
+            yield chunk
+
+    version = get_version(get_conn())
+    return cached_collection("edges", version, build)
+
+@app.route("/changes.json")
+def changes_json():
+    """Nodes and edges changed since a cursor, for clients to update cached
+    collections without downloading them again
+
+    Pass the `cursor` from the last response as `since`, with the same
+    `area`, `type` and `status` filters as for /nodes.json and `sector` as
+    for /edges.json. Without `since`, returns a cursor to start from, with
+    `reset` true; `reset` is also true when the client must reload
+    everything. See `changes.get_changes`.
+    """
+    changes = get_changes(
+        get_conn(),
+        since=int_arg("since"),
+        area=request.args.get("area"),
+        node_types=list_arg("type"),
+        statuses=list_arg("status"),
+        sectors=list_arg("sector")
+    )
+    return jsonify(changes)
+
+@app.route("/export/<layer>")
+def export_layer(layer):
+    """Export all nodes or edges as GeoParquet (`format=parquet`, the
+    default), an Arrow IPC file (`format=arrow`) or FlatGeobuf (`format=fgb`)
+
+    Accepts the same filters as /nodes.json or /edges.json, without
+    pagination, and for nodes `flatten_properties=true` to export each
+    property as its own column. Streamed from a server-side cursor, see
+    `export.export_chunks`.
+    """
+    if layer not in ("nodes", "edges"):
+        abort(404)
+    fmt = request.args.get("format", "parquet")
+    flatten_properties = request.args.get("flatten_properties") == "true"
+    if fmt not in EXPORT_FORMATS or (flatten_properties and layer != "nodes"):
+        abort(400)
+
+    filters = node_filters() if layer == "nodes" else edge_filters()
+    filters.update(after_id=None, limit=None)
+    chunks = export_chunks(get_conn(), layer, fmt, filters, flatten_properties=flatten_properties)
+    response = Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[fmt]["mimetype"])
+    response.headers["Content-Disposition"] = 'attachment; filename="{}{}"'.format(
+        layer, EXPORT_FORMATS[fmt]["extension"])
+    return response
+
+@app.route("/jobs.json", methods=['POST'])
+def job_submit():
+    """Queue a background job, run by `python -m jobs.worker`
+
+    Takes a JSON body like:
+
+        {"type": "osm_import", "args": {"path": "/data/monaco-latest.osm.pbf",
+                                        "source": "osm_extract", "area": "monaco",
+                                        "workers": 4}}
+
+    See `job.JOB_TYPES` for the job types and their args. Returns the job,
+    with status 201.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        abort(400)
+
+    conn = get_conn()
+    try:
+        job = submit_job(conn, data.get("type"), data.get("args") or {})
+    except ValueError as error:
+        conn.rollback()
+        return jsonify(error=str(error)), 400
+
+    conn.commit()
+    return jsonify(job), 201
+
+@app.route("/jobs.json")
+def jobs_json():
+    """List jobs, oldest first, with their status and progress
+
+    Filter by comma-separated `status` and `type`, or by data `source` short
+    name; paginate with `after_id` and `limit`.
+    """
+    statuses = list_arg("status")
+    if statuses is not None and not set(statuses) <= set(JOB_STATUSES):
+        abort(400)
+    conn = get_conn()
+    data_source_id = None
+    if request.args.get("source"):
+        try:
+            data_source_id = get_source_by_short_name(conn, request.args["source"]).id
+        except ValueError:
+            abort(400)
+    limit = limit_arg(100)
+    jobs = get_jobs(
+        conn,
+        statuses=statuses,
+        job_types=list_arg("type"),
+        data_source_id=data_source_id,
+        after_id=int_arg("after_id"),
+        limit=limit
+    )
+    after_id = next_after_id(jobs[-1]["job_id"] if jobs else None, len(jobs), limit)
+    return jsonify(jobs=jobs, next=next_page_url("jobs_json", after_id))
+
+@app.route("/jobs/<int:job_id>.json")
+def job_json(job_id):
+    """A single job, with its progress and, once finished, its output
+    """
+    job = get_job(get_conn(), job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job)
+
+@app.route("/jobs/<int:job_id>/cancel.json", methods=['POST'])
+def job_cancel(job_id):
+    """Cancel a queued or running job
+
+    Running jobs are marked cancelling until their worker has stopped them.
+    Returns 409 if the job has already finished.
+    """
+    conn = get_conn()
+    if get_job(conn, job_id) is None:
+        abort(404)
+    job = cancel_job(conn, job_id)
+    conn.commit()
+    if job is None:
+        return jsonify(error="Job has already finished"), 409
+    return jsonify(job)
+
+@app.route("/tiles/<layer>/<int:z>/<int:x>/<int:y>.mvt")
+def tile(layer, z, x, y):
+    """Serve a vector tile of nodes or edges
+
+    Nodes can be filtered by comma-separated `type` and `status`, edges by
+    `sector`. Responds 501 if the database's PostGIS is too old to encode
+    tiles.
+    """
+    if not valid_tile(z, x, y) or layer not in ("nodes", "edges"):
+        abort(404)
+
+    conn = get_conn()
+    try:
+        if layer == "nodes":
+            data = get_node_tile(conn, z, x, y,
+                                 node_types=list_arg("type"), statuses=list_arg("status"))
+        else:
+            data = get_edge_tile(conn, z, x, y, sectors=list_arg("sector"))
+    except TilesUnavailable as error:
+        conn.rollback()
+        return jsonify(error=str(error)), 501
+
+    response = make_response(data)
+    response.headers["Content-Type"] = "application/vnd.mapbox-vector-tile"
+    return response
 
 if __name__ == "__main__":
     app.run(port=5050)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Regions and areas
 """
+from cache import lookup_cache
 
 class Area:
     """A geographical area
@@ -8,18 +9,37 @@ class Area:
     At a first approximation, these are used to classify data into areas of
     interest: the Gaza strip, South-East England
 
-    Initially corresponding to text field in sos_i_nodes
-    TODO: make more general and detailed with sos_lu_areas table
+    Initially corresponding to text field in sos_i_nodes, summarised in the
+    sos_lu_areas lookup table with a count of nodes and their bounding box
+    (min_lon, min_lat, max_lon, max_lat)
     """
-    def __init__(self, name):
+    def __init__(self, name, node_count=0, bbox=None):
         self.name = name
+        self.node_count = node_count
+        self.bbox = bbox
 
+@lookup_cache
 def get_areas(conn):
-    """Get list of areas available
+    """Get list of areas available, from the sos_lu_areas lookup table
     """
-    sql = """SELECT DISTINCT area
-    FROM sos_i_nodes
+    sql = """SELECT area, node_count, min_lon, min_lat, max_lon, max_lat
+    FROM sos_lu_areas
+    ORDER BY area
     """
     cur = conn.cursor()
     cur.execute(sql)
-    return [Area(row[0]) for row in cur]
+    areas = []
+    for row in cur:
+        bbox = None
+        if row[2] is not None:
+            bbox = (row[2], row[3], row[4], row[5])
+        areas.append(Area(row[0], row[1], bbox))
+    return areas
+
+def get_area(conn, name):
+    """Get an area by name, or None if there is no such area
+    """
+    for area in get_areas(conn):
+        if area.name == name:
+            return area
+    return None
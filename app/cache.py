@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Server-side cache of collection responses
+
+Cached responses are validated against a version of the data they were built
+from - the id and time of the latest entry in the change log (migration 010),
+which is a single index lookup - so a stale entry is never served even if
+another process has written to the database. Writes through `Node` and
+`Edge` also invalidate their namespace directly, by bumping a generation
+number which is part of every cache key.
+
+Entries are kept in an in-process LRU, or in redis when APP_CACHE_REDIS_URL
+is set, so that several app processes share one cache.
+
+Small lookups (e.g. the list of node types) are cached separately with
+`lookup_cache`, for a fixed time.
+"""
+from __future__ import print_function
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+class LRUBackend(object):
+    """In-process least-recently-used store, limited by total size in bytes
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._size = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        size = len(entry["body"])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old["body"])
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted["body"])
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size}
+
+class RedisBackend(object):
+    """Store shared between processes, in redis
+
+    Entries expire after `ttl` seconds; redis should be configured with a
+    maxmemory policy such as allkeys-lru to bound its size.
+    """
+    def __init__(self, url, ttl=24 * 60 * 60, prefix="nismod_int:"):
+        import redis
+        self._redis = redis.StrictRedis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        data = self._redis.get(self.prefix + key)
+        if data is None:
+            return None
+        return json.loads(data.decode("utf-8"))
+
+    def set(self, key, entry):
+        self._redis.setex(self.prefix + key, self.ttl, json.dumps(entry))
+
+    def incr(self, key):
+        return self._redis.incr(self.prefix + key)
+
+    def counter(self, key):
+        value = self._redis.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    def stats(self):
+        return {"backend": "redis"}
+
+class ResponseCache(object):
+    """Cache of response bodies, keyed by namespace and query arguments
+
+    Each entry holds the body with the ETag and Last-Modified it was served
+    with; `get` only returns an entry if its ETag matches the current one.
+    Bodies larger than `max_entry_bytes` are not cached.
+    """
+    def __init__(self, backend, max_entry_bytes=16 * 1024 * 1024):
+        self.backend = backend
+        self.max_entry_bytes = max_entry_bytes
+
+    def key(self, namespace, args):
+        """Cache key for a namespace (e.g. "nodes") and a dict or list of
+        (name, value) query arguments, including the namespace generation
+        """
+        if isinstance(args, dict):
+            args = args.items()
+        generation = self.backend.counter("generation:" + namespace)
+        return "{}:{}:{}".format(namespace, generation, json.dumps(sorted(args)))
+
+    def etag(self, key, version):
+        """Strong ETag for a cache key and a (change_id, changed_at) version
+        of the data
+        """
+        change_id, changed_at = version
+        text = "{}|{}|{}".format(key, change_id, changed_at.isoformat() if changed_at else "")
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get(self, key, etag):
+        entry = self.backend.get(key)
+        if entry is None or entry["etag"] != etag:
+            return None
+        return entry
+
+    def set(self, key, etag, last_modified, body):
+        self.backend.set(key, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body
+        })
+
+    def invalidate(self, namespace):
+        """Drop all entries in a namespace
+        """
+        self.backend.incr("generation:" + namespace)
+
+    def tee(self, key, etag, last_modified, chunks):
+        """Pass through chunks of a streamed body, caching the whole body
+        once the stream is complete
+        """
+        parts = []
+        size = 0
+        for chunk in chunks:
+            if parts is not None:
+                parts.append(chunk)
+                size += len(chunk)
+                if size > self.max_entry_bytes:
+                    parts = None
+            yield chunk
+        if parts is not None:
+            self.set(key, etag, last_modified, "".join(parts))
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Get the process-wide response cache, configured from APP_CACHE_*
+    environment variables
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            redis_url = os.environ.get("APP_CACHE_REDIS_URL")
+            if redis_url:
+                backend = RedisBackend(redis_url)
+            else:
+                max_mb = float(os.environ.get("APP_CACHE_MAX_MB", 64))
+                backend = LRUBackend(max_bytes=int(max_mb * 1024 * 1024))
+            max_entry_mb = float(os.environ.get("APP_CACHE_MAX_ENTRY_MB", 16))
+            _cache = ResponseCache(backend, max_entry_bytes=int(max_entry_mb * 1024 * 1024))
+    return _cache
+
+def invalidate(namespace):
+    get_cache().invalidate(namespace)
+
+def lookup_cache(fn):
+    """Cache the result of a lookup function of (conn, *args) in this
+    process, for APP_LOOKUP_TTL seconds (default 60)
+
+    The cached function has a `clear` method to drop cached results.
+    """
+    values = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(conn, *args):
+        ttl = float(os.environ.get("APP_LOOKUP_TTL", 60))
+        now = time.time()
+        with lock:
+            cached = values.get(args)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        value = fn(conn, *args)
+        with lock:
+            values[args] = (now, value)
+        return value
+
+    def clear():
+        with lock:
+            values.clear()
+
+    wrapper.clear = clear
+    return wrapper
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Changes to nodes and edges since a cursor, for clients to sync cached
+collections (see migration 010)
+
+A cursor is a transaction id: changes made by transactions from `since` up
+to the oldest transaction still running. Those transactions have all
+finished, so a change can never be committed behind a cursor that has
+already been handed out.
+
+Changed nodes and edges are sent as they are now. Ids which were deleted,
+or which no longer match the client's filters, are sent as tombstones, so
+the client can remove them.
+"""
+from __future__ import print_function
+from edge import get_edges
+from node import get_nodes
+
+# above this many changed nodes or edges, clients reload everything
+MAX_CHANGES = 10000
+
+def current_cursor(conn):
+    """Cursor for changes from now on: the oldest running transaction
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+        return cur.fetchone()[0]
+
+def get_version(conn, criticality=False):
+    """Get the (change_id, changed_at) of the latest change to nodes or
+    edges, to validate cached responses
+
+    This is a single index lookup however a collection is filtered, so any
+    change to nodes or edges changes the version of every cached collection.
+    With `criticality`, for responses which filter on it, changed_at is no
+    earlier than when criticality was last computed. Both are None if the
+    log is empty.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""SELECT change_id, changed_at
+            FROM sos_i_changes
+            ORDER BY change_id DESC
+            LIMIT 1""")
+        row = cur.fetchone()
+        change_id, changed_at = row if row is not None else (None, None)
+        if criticality:
+            cur.execute("SELECT max(computed_at) FROM sos_i_node_criticality")
+            computed_at = cur.fetchone()[0]
+            if computed_at is not None and (changed_at is None or computed_at > changed_at):
+                changed_at = computed_at
+    return change_id, changed_at
+
+def prune_changes(conn, keep_days=30):
+    """Delete changes older than `keep_days` from the log. Clients with a
+    cursor from before then must reload. The caller commits.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT sos_prune_changes(%s * interval '1 day')", (keep_days, ))
+
+def changed_ids(conn, since, until, max_changes=MAX_CHANGES):
+    """Get the ids of nodes and edges changed by transactions from `since`
+    up to `until`, as {"nodes": [...], "edges": [...]}, or None if the
+    changes cannot be listed and clients must reload: the log does not go
+    back that far, a table was truncated, or more than `max_changes` nodes
+    and edges changed.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT txid FROM sos_i_changes_start")
+        start = cur.fetchone()[0]
+        if since < start:
+            return None
+
+        cur.execute("""SELECT layer, id, bool_or(operation = 'T')
+            FROM sos_i_changes
+            WHERE txid >= %s AND txid < %s
+            GROUP BY layer, id
+            LIMIT %s""", (since, until, max_changes + 1))
+        if cur.rowcount > max_changes:
+            return None
+        changed = {"nodes": [], "edges": []}
+        for layer, change_id, truncated in cur:
+            if truncated:
+                return None
+            changed[layer].append(change_id)
+    return changed
+
+def get_changes(conn, since=None, area=None, node_types=None, statuses=None, sectors=None,
+                max_changes=MAX_CHANGES):
+    """Get nodes and edges changed since a cursor
+
+    Returns a dict with:
+
+    - cursor: to pass as `since` next time
+    - reset: true if the client must reload all nodes and edges, when there
+      is no `since`, it is not a cursor the log can answer, or there are
+      more than `max_changes` changes
+    - nodes, edges: FeatureCollections of changed nodes and edges which
+      match the filters, as in /nodes.json and /edges.json
+    - deleted_nodes, deleted_edges: ids of changed nodes and edges which
+      were deleted or no longer match the filters
+    """
+    until = current_cursor(conn)
+    result = {
+        "cursor": str(until),
+        "reset": False,
+        "nodes": {"type": "FeatureCollection", "features": []},
+        "edges": {"type": "FeatureCollection", "features": []},
+        "deleted_nodes": [],
+        "deleted_edges": []
+    }
+
+    changed = None
+    if since is not None and since <= until:
+        changed = changed_ids(conn, since, until, max_changes=max_changes)
+    if changed is None:
+        result["reset"] = True
+        return result
+
+    if changed["nodes"]:
+        nodes = get_nodes(conn, area=area, node_types=node_types, statuses=statuses,
+                          node_ids=changed["nodes"])
+        result["nodes"]["features"] = [node.as_geojson_feature_dict() for node in nodes]
+        result["deleted_nodes"] = sorted(set(changed["nodes"]) - set(nodes.ids.tolist()))
+    if changed["edges"]:
+        edges = get_edges(conn, sectors=sectors, edge_ids=changed["edges"])
+        result["edges"]["features"] = [edge.as_geojson_feature_dict() for edge in edges]
+        result["deleted_edges"] = sorted(set(changed["edges"]) - set(edges.ids.tolist()))
+    return result
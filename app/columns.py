@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Compact columns for collections of rows held in memory
+
+Used by `NodeCollection` and `EdgeCollection` in place of lists of objects:
+
+- `StringColumn` holds all strings as UTF-8 in one buffer, with offsets
+- `Categorical` holds a small integer code per row into a list of values,
+  for columns with few distinct values such as type, status or sector
+
+Each has a `Builder` to append values one row at a time, without holding a
+python object per row.
+"""
+from __future__ import print_function
+import array
+import numpy
+
+class StringColumn(object):
+    """Strings stored end to end in a single UTF-8 buffer
+
+    The string at index i is `data[offsets[i]:offsets[i + 1]]`. None is
+    stored as an empty string.
+    """
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def take(self, index):
+        """New column of the strings at an array of indices
+        """
+        index = numpy.asarray(index, dtype=numpy.int64)
+        starts = self.offsets[index]
+        lengths = self.offsets[index + 1] - starts
+        offsets = numpy.zeros(len(index) + 1, dtype=numpy.int64)
+        numpy.cumsum(lengths, out=offsets[1:])
+        positions = numpy.repeat(starts - offsets[:-1], lengths) + numpy.arange(offsets[-1])
+        buf = numpy.frombuffer(self.data, dtype=numpy.uint8)
+        return StringColumn(buf[positions].tobytes(), offsets)
+
+    def nbytes(self):
+        return len(self.data) + self.offsets.nbytes
+
+    class Builder(object):
+        def __init__(self):
+            self._data = bytearray()
+            self._offsets = array.array("q", [0])
+
+        def append(self, value):
+            if value is not None:
+                if not isinstance(value, bytes):
+                    value = value.encode("utf-8")
+                self._data.extend(value)
+            self._offsets.append(len(self._data))
+
+        def build(self):
+            return StringColumn(bytes(self._data), numpy.frombuffer(self._offsets, dtype=numpy.int64))
+
+class Categorical(object):
+    """Values stored as integer codes into a list of distinct values
+
+    A code of -1 stands for None.
+    """
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        code = self.codes[i]
+        if code < 0:
+            return None
+        return self.categories[code]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def isin(self, values):
+        """Boolean mask of rows with one of `values`
+        """
+        wanted = [code for code, category in enumerate(self.categories) if category in values]
+        return numpy.isin(self.codes, wanted)
+
+    def take(self, index):
+        return Categorical(self.codes[index], self.categories)
+
+    def counts(self):
+        """Dict of number of rows with each value, leaving out None
+        """
+        counts = numpy.bincount(self.codes[self.codes >= 0], minlength=len(self.categories))
+        return dict(zip(self.categories, counts.tolist()))
+
+    def nbytes(self):
+        return self.codes.nbytes
+
+    class Builder(object):
+        def __init__(self):
+            self._codes = array.array("h")
+            self._lookup = {}
+            self._categories = []
+
+        def append(self, value):
+            if value is None:
+                self._codes.append(-1)
+                return
+            code = self._lookup.get(value)
+            if code is None:
+                code = len(self._categories)
+                self._lookup[value] = code
+                self._categories.append(value)
+            self._codes.append(code)
+
+        def build(self):
+            return Categorical(numpy.frombuffer(self._codes, dtype=numpy.int16), self._categories)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Node criticality, as computed in batch by `analysis.criticality`
+"""
+from __future__ import print_function
+from query import where_clause
+
+def get_ranking(conn, limit=100, node_types=None, sector=None, area=None):
+    """Get the most critical nodes, most dependents first
+
+    Returns a list of dicts with the node's id, name, type and area, and its
+    downstream_count, sector_count, sectors, max_depth and betweenness.
+    """
+    where, params = where_clause([
+        ("n.type = ANY(%s)", node_types),
+        ("%s = ANY(c.sectors)", sector),
+        ("n.area = %s", area)
+    ])
+    with conn.cursor() as cur:
+        cur.execute("""SELECT
+            n.node_id,
+            n.node_name,
+            n.type,
+            n.area,
+            c.downstream_count,
+            c.sector_count,
+            c.sectors,
+            c.max_depth,
+            c.betweenness
+        FROM sos_i_node_criticality AS c
+        JOIN sos_i_nodes AS n ON n.node_id = c.node_id{}
+        ORDER BY c.downstream_count DESC, c.betweenness DESC, n.node_id
+        LIMIT %s""".format(where), params + [limit])
+
+        return [dict(row) for row in cur]
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Database connections and connection pooling
+"""
+from __future__ import print_function
+import os
+import threading
+import time
+import psycopg2
+import psycopg2.extras
+from metrics import TimingCursor
+
+def connection_params():
+    """Database connection parameters from the environment
+    """
+    return {
+        "host": os.environ.get("APP_PG_HOST"),
+        "database": os.environ.get("APP_PG_DATABASE", "vagrant"),
+        "user": os.environ.get("APP_PG_USER", "vagrant"),
+        "password": os.environ.get("APP_PG_PASSWORD"),
+        "port": os.environ.get("APP_PG_PORT")
+    }
+
+def connect():
+    """Open a new connection using DictCursor, as the app expects, with
+    statements timed (see `metrics.TimingCursor`)
+    """
+    return psycopg2.connect(cursor_factory=TimingCursor, **connection_params())
+
+class PoolError(Exception):
+    """Raise when no connection can be checked out of the pool
+    """
+
+class ConnectionPool(object):
+    """A thread-safe pool of database connections
+
+    Connections are opened on demand up to `max_size`; callers wait up to
+    `checkout_timeout` seconds for one to be returned beyond that. Idle
+    connections above `min_size` are closed once they have been idle for
+    `idle_timeout` seconds. A connection which has been idle for more than
+    `check_interval` seconds is checked with `SELECT 1` before being handed
+    out, and replaced if the check fails.
+
+    `connect` is any function returning a new connection, so other pooling
+    can be plugged in by replacing the pool returned from `get_pool`.
+    """
+    def __init__(self, connect=connect, min_size=1, max_size=10, idle_timeout=300,
+                 check_interval=30, checkout_timeout=10):
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self.checkout_timeout = checkout_timeout
+
+        self._lock = threading.Condition()
+        # list of (connection, time returned), most recently returned last
+        self._idle = []
+        self._in_use = 0
+        self._counts = {
+            "opened": 0,
+            "closed": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "failed_checks": 0
+        }
+
+    def getconn(self):
+        """Check out a connection
+        """
+        deadline = time.time() + self.checkout_timeout
+        with self._lock:
+            self._counts["checkouts"] += 1
+            while not self._idle and self._in_use >= self.max_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._counts["timeouts"] += 1
+                    raise PoolError("No database connection available after {}s".format(
+                        self.checkout_timeout))
+                self._counts["waits"] += 1
+                self._lock.wait(remaining)
+
+            self._in_use += 1
+            if self._idle:
+                conn, returned_at = self._idle.pop()
+            else:
+                conn, returned_at = None, None
+
+        try:
+            if conn is not None and not self._is_healthy(conn, returned_at):
+                self._close(conn)
+                conn = None
+            if conn is None:
+                conn = self._connect()
+                self._count("opened")
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+        return conn
+
+    def putconn(self, conn):
+        """Return a connection to the pool, rolling back any open transaction
+        """
+        keep = not conn.closed
+        if keep:
+            try:
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                keep = False
+
+        now = time.time()
+        with self._lock:
+            self._in_use -= 1
+            if keep:
+                self._idle.append((conn, now))
+            expired = self._expire_idle(now)
+            self._lock.notify()
+
+        if not keep:
+            self._close(conn)
+        for idle_conn in expired:
+            self._close(idle_conn)
+
+    def stats(self):
+        """Current size and lifetime counts of the pool
+        """
+        with self._lock:
+            stats = {
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size
+            }
+            stats.update(self._counts)
+        return stats
+
+    def closeall(self):
+        with self._lock:
+            idle = [conn for conn, _ in self._idle]
+            self._idle = []
+        for conn in idle:
+            self._close(conn)
+
+    def _expire_idle(self, now):
+        """Remove connections idle for longer than idle_timeout, keeping at
+        least min_size connections open. Call holding the lock.
+        """
+        expired = []
+        # oldest first
+        while self._idle and len(self._idle) + self._in_use > self.min_size:
+            conn, returned_at = self._idle[0]
+            if now - returned_at < self.idle_timeout:
+                break
+            self._idle.pop(0)
+            expired.append(conn)
+        return expired
+
+    def _is_healthy(self, conn, returned_at):
+        if conn.closed:
+            return False
+        if time.time() - returned_at < self.check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            self._count("failed_checks")
+            return False
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+        self._count("closed")
+
+    def _count(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Get the process-wide connection pool, configured from APP_PG_POOL_*
+    environment variables
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                min_size=int(os.environ.get("APP_PG_POOL_MIN", 1)),
+                max_size=int(os.environ.get("APP_PG_POOL_MAX", 10)),
+                idle_timeout=float(os.environ.get("APP_PG_POOL_IDLE_TIMEOUT", 300)),
+                check_interval=float(os.environ.get("APP_PG_POOL_CHECK_INTERVAL", 30)),
+                checkout_timeout=float(os.environ.get("APP_PG_POOL_CHECKOUT_TIMEOUT", 10))
+            )
+    return _pool
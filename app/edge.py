@@ -2,11 +2,22 @@
 """Edges and dependencies in the infrastructure network
 """
 from __future__ import print_function
+import array
 import datetime
+import json
+import numpy
+from cache import invalidate
+from columns import Categorical, StringColumn
+from metrics import timed
+from query import BBOX_SQL, page_clause, where_clause
 
-class Edge:
+UTC = datetime.timezone.utc
+
+class Edge(object):
     """An edge
     """
+    __slots__ = ("id", "name", "from_node_id", "to_node_id", "sector", "last_updated", "geojson")
+
     def __init__(self, data=None):
         self.id = None
         self.name = ""
@@ -37,7 +48,9 @@ class Edge:
         self.sector = data["sector"]
 
     def geometry(self):
-        return self.geojson
+        if not self.geojson:
+            return None
+        return json.loads(self.geojson)
 
     def as_geojson_feature_dict(self):
         return {
@@ -63,6 +76,7 @@ class Edge:
         else:
             self._save_new(conn)
         conn.commit()
+        invalidate("edges")
         return self
 
     def _update(self, conn):
@@ -97,22 +111,205 @@ class Edge:
 
         return self
 
-def get_edges(conn):
-    """Get a list of edges
+EDGES_SQL = """SELECT
+    edge_id,
+    edge_name,
+    from_node_id,
+    to_node_id,
+    sector,
+    last_updated,
+    st_asgeojson(location) AS geojson
+FROM sos_i_edges"""
+
+def edge_query(bbox=None, sectors=None, updated_since=None, edge_ids=None, after_id=None, limit=None):
+    """Build the WHERE/ORDER BY/LIMIT SQL and params for filtering edges
+
+    - bbox: (min lon, min lat, max lon, max lat), using the GIST index
+    - sectors: list of allowed sectors
+    - updated_since: datetime, only edges updated after it
+    - edge_ids: list of edge ids
+    - after_id, limit: keyset pagination by edge_id
     """
-    with conn.cursor() as cur:
-        sql = """SELECT
-            edge_id,
-            edge_name,
-            from_node_id,
-            to_node_id,
-            sector,
-            last_updated,
-            st_asgeojson(location) AS geojson
-        FROM sos_i_edges"""
+    where, params = where_clause([
+        (BBOX_SQL, None if bbox is None else tuple(bbox)),
+        ("sector = ANY(%s)", sectors),
+        ("last_updated > %s", updated_since),
+        ("edge_id = ANY(%s)", edge_ids),
+        ("edge_id > %s", after_id)
+    ])
+    page, page_params = page_clause("edge_id", after_id, limit)
+    return where + page, params + page_params
+
+EDGE_COLUMNS_SQL = """SELECT
+    edge_id,
+    from_node_id,
+    to_node_id,
+    edge_name,
+    sector,
+    extract(epoch FROM last_updated)::bigint,
+    st_asgeojson(location)
+FROM sos_i_edges"""
+
+class EdgeCollection(object):
+    """Edges held as columns, rather than as a list of `Edge`
+
+    - ids, from_node_ids, to_node_ids: NumPy arrays
+    - names, geojson: `StringColumn`s
+    - sectors: a `Categorical` column
+    - last_updated: seconds since the epoch, as int64
+
+    As with `NodeCollection`, indexing with an int gives an `Edge`, and with
+    a slice, boolean mask or array of indices gives a new collection.
+    """
+    def __init__(self, ids, from_node_ids, to_node_ids, names, sectors, last_updated, geojson):
+        self.ids = ids
+        self.from_node_ids = from_node_ids
+        self.to_node_ids = to_node_ids
+        self.names = names
+        self.sectors = sectors
+        self.last_updated = last_updated
+        self.geojson = geojson
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from an iterable of rows of EDGE_COLUMNS_SQL, one row at a
+        time
+        """
+        ids = array.array("q")
+        from_node_ids = array.array("q")
+        to_node_ids = array.array("q")
+        last_updated = array.array("q")
+        names = StringColumn.Builder()
+        sectors = Categorical.Builder()
+        geojson = StringColumn.Builder()
+        for row in rows:
+            ids.append(row[0])
+            from_node_ids.append(row[1])
+            to_node_ids.append(row[2])
+            names.append(row[3])
+            sectors.append(row[4])
+            last_updated.append(row[5] if row[5] is not None else 0)
+            geojson.append(row[6])
+
+        return cls(
+            numpy.frombuffer(ids, dtype=numpy.int64),
+            numpy.frombuffer(from_node_ids, dtype=numpy.int64),
+            numpy.frombuffer(to_node_ids, dtype=numpy.int64),
+            names.build(),
+            sectors.build(),
+            numpy.frombuffer(last_updated, dtype=numpy.int64),
+            geojson.build())
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.edge(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, numpy.integer)):
+            return self.edge(key)
+        return self.take(numpy.arange(len(self))[key])
 
-        cur.execute(sql)
+    def edge(self, i):
+        """The edge at index i, as an `Edge`
+        """
+        if i < 0:
+            i += len(self)
+        edge = Edge()
+        edge.id = int(self.ids[i])
+        edge.from_node_id = int(self.from_node_ids[i])
+        edge.to_node_id = int(self.to_node_ids[i])
+        edge.name = self.names[i]
+        edge.sector = self.sectors[i]
+        edge.last_updated = datetime.datetime.fromtimestamp(int(self.last_updated[i]), UTC)
+        edge.geojson = self.geojson[i]
+        return edge
 
-        edges = [Edge(f) for f in cur]
+    def take(self, index):
+        """New collection of the edges at an array of indices
+        """
+        return EdgeCollection(
+            self.ids[index],
+            self.from_node_ids[index],
+            self.to_node_ids[index],
+            self.names.take(index),
+            self.sectors.take(index),
+            self.last_updated[index],
+            self.geojson.take(index))
+
+    def touching(self, node_ids):
+        """Boolean mask of edges from or to any of `node_ids`
+        """
+        return numpy.isin(self.from_node_ids, node_ids) | numpy.isin(self.to_node_ids, node_ids)
+
+    def nbytes(self):
+        """Approximate memory used by the columns, in bytes
+        """
+        return sum(column.nbytes if isinstance(column, numpy.ndarray) else column.nbytes()
+                   for column in (self.ids, self.from_node_ids, self.to_node_ids, self.names,
+                                  self.sectors, self.last_updated, self.geojson))
+
+def get_edges(conn, chunk_size=2000, **filters):
+    """Get edges as an `EdgeCollection`, filtered as by `edge_query`
+
+    Rows are fetched `chunk_size` at a time from a server-side cursor and
+    added straight to the columns. Must be used inside a transaction.
+    """
+    with conn.cursor(name="get_edges") as cur:
+        cur.itersize = chunk_size
+        sql, params = edge_query(**filters)
+        cur.execute(EDGE_COLUMNS_SQL + sql, params)
+
+        with timed("hydrate"):
+            edges = EdgeCollection.from_rows(cur)
 
     return edges
+
+def iter_edges(conn, chunk_size=2000, **filters):
+    """Iterate over edges, fetching `chunk_size` rows at a time from a
+    server-side cursor
+    """
+    with conn.cursor(name="iter_edges") as cur:
+        cur.itersize = chunk_size
+        sql, params = edge_query(**filters)
+        cur.execute(EDGES_SQL + sql, params)
+
+        for row in cur:
+            yield Edge(row)
+
+EDGE_FEATURE_SQL = """json_build_object(
+    'type', 'Feature',
+    'geometry', ST_AsGeoJSON(location)::json,
+    'properties', json_build_object(
+        'id', edge_id,
+        'name', COALESCE(edge_name, ''),
+        'sector', sector,
+        'from_node_id', from_node_id,
+        'to_node_id', to_node_id,
+        'last_updated', to_char(last_updated AT TIME ZONE 'UTC', 'Dy, DD Mon YYYY HH24:MI:SS "+0000"')
+    )
+)"""
+
+def get_edges_geojson(conn, **filters):
+    """Get edges as a GeoJSON FeatureCollection, built by the database
+
+    Returns the JSON text as it comes from postgres. Features match
+    `Edge.as_geojson_feature_dict`. With a `limit`, the collection has a
+    `next_after_id` member for the next page.
+    """
+    with conn.cursor() as cur:
+        sql, params = edge_query(**filters)
+        limit = filters.get("limit")
+        cur.execute("""SELECT json_build_object(
+            'type', 'FeatureCollection',
+            'features', COALESCE(json_agg(feature ORDER BY edge_id), '[]'::json),
+            'next_after_id', CASE WHEN count(*) = %s THEN max(edge_id) END
+        )::text
+        FROM (
+            SELECT edge_id, {} AS feature
+            FROM sos_i_edges{}
+        ) AS page""".format(EDGE_FEATURE_SQL, sql), [limit] + params)
+
+        return cur.fetchone()[0]
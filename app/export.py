@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""Export nodes and edges in binary columnar formats
+
+- parquet: GeoParquet, with geometry as WKB and "geo" metadata
+- arrow: Arrow IPC file format (Feather v2), which readers can memory-map,
+  with geometry as WKB tagged as geoarrow.wkb
+- fgb: FlatGeobuf, written with GDAL's ogr
+
+Rows are fetched from a server-side cursor `batch_size` at a time and each
+fetch is written as one record batch, so memory use does not grow with the
+size of the network. `export_chunks` yields the output as it is written, for
+streaming responses; FlatGeobuf is written to a temporary file first, as
+GDAL builds the spatial index once all features are known.
+
+Node `properties` are exported as JSON text, or with `flatten_properties`
+as one text column per key, named "properties.<key>".
+
+pyarrow is needed for parquet and arrow, and GDAL's python bindings for
+fgb; each is only imported when its format is used.
+"""
+from __future__ import print_function
+import datetime
+import io
+import json
+import os
+import shutil
+import tempfile
+from edge import edge_query
+from node import node_query
+
+FORMATS = {
+    "parquet": {"extension": ".parquet", "mimetype": "application/vnd.apache.parquet"},
+    "arrow": {"extension": ".arrow", "mimetype": "application/vnd.apache.arrow.file"},
+    "fgb": {"extension": ".fgb", "mimetype": "application/octet-stream"}
+}
+
+GEOMETRY_SQL = "ST_AsBinary(location::geometry)"
+
+# (name, SQL expression, kind) of each exported column
+NODE_COLUMNS = (
+    ("node_id", "node_id", "int"),
+    ("node_name", "node_name", "text"),
+    ("type", "type", "text"),
+    ("area", "area", "text"),
+    ("function", "function", "text"),
+    ("condition", "condition", "text"),
+    ("status", "status::text", "text"),
+    ("data_source_id", "data_source_id", "int"),
+    ("ref_key", "ref_key", "text"),
+    ("last_updated", "last_updated", "timestamp"),
+    ("properties", "properties::text", "text"),
+    ("geometry", GEOMETRY_SQL, "geometry")
+)
+
+EDGE_COLUMNS = (
+    ("edge_id", "edge_id", "int"),
+    ("edge_name", "edge_name", "text"),
+    ("sector", "sector", "text"),
+    ("from_node_id", "from_node_id", "int"),
+    ("to_node_id", "to_node_id", "int"),
+    ("data_source_id", "data_source_id", "int"),
+    ("ref_key", "ref_key", "text"),
+    ("last_updated", "last_updated", "timestamp"),
+    ("geometry", GEOMETRY_SQL, "geometry")
+)
+
+LAYERS = {
+    "nodes": {"table": "sos_i_nodes", "columns": NODE_COLUMNS, "query": node_query, "geometry": "Point"},
+    "edges": {"table": "sos_i_edges", "columns": EDGE_COLUMNS, "query": edge_query, "geometry": "LineString"}
+}
+
+def property_keys(conn, where, params):
+    """Get the sorted distinct keys of node properties matching a WHERE clause
+    """
+    with conn.cursor() as cur:
+        cur.execute("""SELECT DISTINCT key
+            FROM (
+                SELECT jsonb_object_keys(properties) AS key
+                FROM sos_i_nodes{}
+            ) AS keys
+            ORDER BY key""".format(where), params)
+        return [row[0] for row in cur]
+
+def export_columns(conn, layer, filters, flatten_properties=False):
+    """Get the (name, SQL, kind) columns to export, and the params of their
+    SQL
+    """
+    columns = LAYERS[layer]["columns"]
+    if not flatten_properties:
+        return list(columns), []
+    if layer != "nodes":
+        raise ValueError("Only nodes have properties to flatten")
+
+    where, params = node_query(**dict(filters, sort=None, after_id=None, limit=None))
+    keys = property_keys(conn, where, params)
+    flattened = [column for column in columns if column[0] != "properties"]
+    geometry = flattened.pop()
+    flattened.extend(("properties." + key, "properties->>%s", "text") for key in keys)
+    flattened.append(geometry)
+    return flattened, keys
+
+def iter_batches(conn, layer, columns, column_params, filters, batch_size=50000):
+    """Iterate over lists of rows of the export columns, `batch_size` rows at
+    a time, from a server-side cursor
+    """
+    sql, params = LAYERS[layer]["query"](**filters)
+    select = "SELECT {} FROM {}".format(
+        ", ".join(expression for _, expression, _ in columns), LAYERS[layer]["table"])
+    with conn.cursor(name="export_" + layer) as cur:
+        cur.itersize = batch_size
+        cur.execute(select + sql, column_params + params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
+def arrow_schema(columns, fmt, geometry_type):
+    import pyarrow
+
+    types = {
+        "int": pyarrow.int64(),
+        "text": pyarrow.string(),
+        "timestamp": pyarrow.timestamp("us", tz="UTC"),
+        "geometry": pyarrow.binary()
+    }
+    fields = []
+    for name, _, kind in columns:
+        metadata = None
+        if kind == "geometry" and fmt == "arrow":
+            metadata = {"ARROW:extension:name": "geoarrow.wkb", "ARROW:extension:metadata": "{}"}
+        fields.append(pyarrow.field(name, types[kind], metadata=metadata))
+
+    metadata = None
+    if fmt == "parquet":
+        # GeoParquet; with no "crs", coordinates are lon/lat (OGC:CRS84)
+        metadata = {"geo": json.dumps({
+            "version": "1.0.0",
+            "primary_column": "geometry",
+            "columns": {"geometry": {"encoding": "WKB", "geometry_types": [geometry_type]}}
+        })}
+    return pyarrow.schema(fields, metadata=metadata)
+
+class ArrowWriter(object):
+    """Write record batches as GeoParquet or an Arrow IPC file
+    """
+    def __init__(self, out, columns, fmt, geometry_type):
+        import pyarrow
+        self._pyarrow = pyarrow
+        self._kinds = [kind for _, _, kind in columns]
+        self.schema = arrow_schema(columns, fmt, geometry_type)
+        if fmt == "parquet":
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(out, self.schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(out, self.schema)
+
+    def write(self, rows):
+        arrays = []
+        for i, (field, kind) in enumerate(zip(self.schema, self._kinds)):
+            values = [row[i] for row in rows]
+            if kind == "geometry":
+                values = [bytes(value) if value is not None else None for value in values]
+            arrays.append(self._pyarrow.array(values, type=field.type))
+        self._writer.write_batch(self._pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def finish(self):
+        """Write the footer and close, yielding once done
+        """
+        self._writer.close()
+        yield
+
+    def close(self):
+        """Nothing to clean up: the output belongs to the caller
+        """
+        pass
+
+class FlatGeobufWriter(object):
+    """Write features to a FlatGeobuf file with ogr, copied to `out` on
+    `finish`. The temporary file is removed by `close`.
+    """
+    def __init__(self, out, columns, layer, geometry_type):
+        from osgeo import ogr, osr
+        self._ogr = ogr
+        self._out = out
+        self._columns = columns
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, layer + ".fgb")
+
+        srs = osr.SpatialReference()
+        srs.ImportFromEPSG(4326)
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+        self._dataset = ogr.GetDriverByName("FlatGeobuf").CreateDataSource(self._path)
+        wkb_type = ogr.wkbPoint if geometry_type == "Point" else ogr.wkbLineString
+        self._layer = self._dataset.CreateLayer(layer, srs, wkb_type)
+        field_types = {"int": ogr.OFTInteger64, "text": ogr.OFTString, "timestamp": ogr.OFTDateTime}
+        for name, _, kind in columns:
+            if kind != "geometry":
+                self._layer.CreateField(ogr.FieldDefn(name, field_types[kind]))
+
+    def write(self, rows):
+        definition = self._layer.GetLayerDefn()
+        for row in rows:
+            feature = self._ogr.Feature(definition)
+            field = 0
+            for (_, _, kind), value in zip(self._columns, row):
+                if kind == "geometry":
+                    if value is not None:
+                        feature.SetGeometry(self._ogr.CreateGeometryFromWkb(bytes(value)))
+                    continue
+                if value is None:
+                    feature.SetFieldNull(field)
+                elif kind == "timestamp":
+                    feature.SetField(field, value.astimezone(datetime.timezone.utc).isoformat())
+                else:
+                    feature.SetField(field, value)
+                field += 1
+            self._layer.CreateFeature(feature)
+
+    def finish(self, chunk_size=1024 * 1024):
+        """Close the file and copy it to `out`, yielding after each chunk
+        """
+        # dropping the references closes the dataset, writing the index
+        self._layer = None
+        self._dataset = None
+        try:
+            with open(self._path, "rb") as fgb_file:
+                while True:
+                    data = fgb_file.read(chunk_size)
+                    if not data:
+                        break
+                    self._out.write(data)
+                    yield
+        finally:
+            self.close()
+
+    def close(self):
+        """Remove the temporary file, whether or not it was finished
+        """
+        self._layer = None
+        self._dataset = None
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+def export_writer(out, columns, layer, fmt):
+    geometry_type = LAYERS[layer]["geometry"]
+    if fmt == "fgb":
+        return FlatGeobufWriter(out, columns, layer, geometry_type)
+    return ArrowWriter(out, columns, fmt, geometry_type)
+
+def export(conn, layer, fmt, out, filters=None, flatten_properties=False, batch_size=50000,
+           progress=None):
+    """Write nodes or edges matching filters (as for `node_query` or
+    `edge_query`) to a binary file-like object. Returns the number of rows.
+
+    Each batch written is counted in `progress`, if given (see
+    `data_import.progress.Progress`).
+    """
+    count = 0
+    for rows in _export(conn, layer, fmt, out, filters, flatten_properties, batch_size):
+        count += rows
+        if progress is not None and rows:
+            progress.written(rows)
+    return count
+
+class ChunkSink(io.RawIOBase):
+    """Write-only file-like object which keeps written bytes until they
+    are taken with `drain`
+    """
+    def __init__(self):
+        super(ChunkSink, self).__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def export_chunks(conn, layer, fmt, filters=None, flatten_properties=False, batch_size=50000):
+    """Export as `export`, yielding the output bytes as they are written
+    """
+    sink = ChunkSink()
+    parts = _export(conn, layer, fmt, sink, filters, flatten_properties, batch_size)
+    try:
+        for _ in parts:
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        # e.g. the client went away: stop the export and clean up now
+        parts.close()
+
+def _export(conn, layer, fmt, out, filters, flatten_properties, batch_size):
+    """Write the export to `out`, yielding the number of rows in each batch
+    once it is written, then 0 as each part of the end of the file is written
+
+    The writer is closed however the export ends, including when the
+    generator is closed part way through.
+    """
+    if layer not in LAYERS:
+        raise ValueError("Unknown layer: {}".format(layer))
+    if fmt not in FORMATS:
+        raise ValueError("Unknown export format: {}".format(fmt))
+    filters = dict(filters or {})
+    columns, column_params = export_columns(conn, layer, filters, flatten_properties)
+    writer = export_writer(out, columns, layer, fmt)
+    try:
+        for rows in iter_batches(conn, layer, columns, column_params, filters, batch_size):
+            writer.write(rows)
+            yield len(rows)
+        for _ in writer.finish():
+            yield 0
+    finally:
+        writer.close()
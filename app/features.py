@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""GeoJSON output
+"""
+from __future__ import print_function
+import json
+import time
+from metrics import current
+
+def stream_feature_collection(features, features_per_chunk=500, members=None):
+    """Serialize an iterable of feature dicts as a GeoJSON FeatureCollection,
+    yielding the text a chunk at a time
+
+    Features are encoded one by one as they are consumed, so the whole
+    collection is never held in memory. `members`, if given, is called once
+    all features are written and returns a dict of extra members to add to
+    the collection (e.g. a cursor for the next page).
+
+    Time spent encoding is added to the "serialize" phase of the request.
+    """
+    timings = current()
+    encoding = 0
+    yield '{"type":"FeatureCollection","features":['
+
+    chunk = []
+    first = True
+    for feature in features:
+        start = time.time()
+        encoded = json.dumps(feature, separators=(",", ":"))
+        encoding += time.time() - start
+        if first:
+            first = False
+        else:
+            encoded = "," + encoded
+        chunk.append(encoded)
+
+        if len(chunk) >= features_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+
+    if chunk:
+        yield "".join(chunk)
+    if timings is not None:
+        timings.add("serialize", encoding)
+
+    closing = ']'
+    if members is not None:
+        for key, value in sorted(members().items()):
+            closing += ',{}:{}'.format(json.dumps(key), json.dumps(value))
+    yield closing + '}'
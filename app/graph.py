@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Dependency graph of nodes and edges, held in memory for analysis
+
+An edge from node A to node B means B depends on A, so if A fails, B fails.
+The graph is stored in compressed sparse row (CSR) form: the out-edges of
+the node at index i are `indices[indptr[i]:indptr[i + 1]]`, where nodes are
+indexed in order of node_id. Node types and edge sectors are stored as
+integer codes into lists of names.
+
+The process-wide graph from `get_graph` is loaded once, then refreshed from
+rows with a newer last_updated; deletions are detected by comparing row
+counts and trigger a full reload.
+"""
+from __future__ import print_function
+import csv
+import io
+import os
+import threading
+import time
+import numpy
+
+class DependencyGraph(object):
+    """A directed graph of dependencies between nodes, in CSR form
+
+    Keeps the node and edge rows it was built from (as arrays), so it can be
+    rebuilt with changed rows merged in.
+    """
+    def __init__(self, nodes, edges, types, sectors):
+        node_ids, node_types = nodes
+        edge_ids, from_ids, to_ids, edge_sectors = edges
+
+        order = numpy.argsort(node_ids, kind="stable")
+        self.node_ids = node_ids[order]
+        self.node_types = node_types[order]
+        self.types = types
+        self.sectors = sectors
+
+        # drop edges to or from unknown nodes, then sort by from node
+        from_index = self._lookup(from_ids)
+        to_index = self._lookup(to_ids)
+        known = (from_index >= 0) & (to_index >= 0)
+        order = numpy.argsort(from_index[known], kind="stable")
+        self.edge_ids = edge_ids[known][order]
+        self.edge_sectors = edge_sectors[known][order]
+        self.indices = to_index[known][order]
+        counts = numpy.bincount(from_index[known], minlength=len(self.node_ids))
+        self.indptr = numpy.zeros(len(self.node_ids) + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=self.indptr[1:])
+
+        # rows as loaded, including dangling edges, for merging on refresh
+        self._edge_rows = edges
+        self.nodes_version = (0, None)
+        self.edges_version = (0, None)
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def edge_count(self):
+        return len(self.indices)
+
+    def _lookup(self, ids):
+        """Map node ids to indices, or -1 where a node id is unknown
+        """
+        ids = numpy.asarray(ids, dtype=numpy.int64)
+        if len(self.node_ids) == 0:
+            return numpy.full(len(ids), -1, dtype=numpy.int64)
+        index = numpy.minimum(numpy.searchsorted(self.node_ids, ids), len(self.node_ids) - 1)
+        return numpy.where(self.node_ids[index] == ids, index, -1)
+
+    def index_of(self, node_id):
+        index = self._lookup([node_id])[0]
+        if index < 0:
+            raise KeyError(node_id)
+        return index
+
+    def cascade(self, node_id, max_depth=None):
+        """Find all nodes which transitively depend on a node, or on any of a
+        list of nodes which fail together
+
+        Runs a breadth-first search a whole frontier at a time. Returns a
+        dict of arrays, in order of depth:
+
+        - node_id: failed nodes, not including the starting nodes
+        - depth: number of hops from the starting nodes
+        - parent_id: the node through which each node failed
+        - sector: sector code of the edge through which each node failed
+
+        Raises KeyError if a single node is not in the graph; unknown nodes
+        in a list are ignored.
+        """
+        if numpy.ndim(node_id) == 0:
+            start = numpy.array([self.index_of(node_id)], dtype=numpy.int64)
+        else:
+            start = self._lookup(node_id)
+            start = numpy.unique(start[start >= 0])
+
+        visited = numpy.zeros(len(self.node_ids), dtype=bool)
+        visited[start] = True
+
+        found, depths, parents, sectors = [], [], [], []
+        frontier = start
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            depth += 1
+            edges = edge_ranges(self.indptr[frontier], self.indptr[frontier + 1])
+            sources = numpy.repeat(frontier, self.indptr[frontier + 1] - self.indptr[frontier])
+            targets = self.indices[edges]
+
+            new = ~visited[targets]
+            # first edge reaching each newly failed node
+            frontier, first = numpy.unique(targets[new], return_index=True)
+            visited[frontier] = True
+
+            found.append(frontier)
+            depths.append(numpy.full(len(frontier), depth, dtype=numpy.int64))
+            parents.append(sources[new][first])
+            sectors.append(self.edge_sectors[edges][new][first])
+
+        if not found:
+            found = depths = parents = sectors = [numpy.zeros(0, dtype=numpy.int64)]
+        index = numpy.concatenate(found)
+        return {
+            "node_id": self.node_ids[index],
+            "depth": numpy.concatenate(depths),
+            "parent_id": self.node_ids[numpy.concatenate(parents)],
+            "sector": numpy.concatenate(sectors)
+        }
+
+    def cascade_dict(self, node_id, max_depth=None):
+        """Cascade from a node or list of nodes as a JSON-serializable dict
+        """
+        result = self.cascade(node_id, max_depth=max_depth)
+        index = self._lookup(result["node_id"])
+        sector_codes = numpy.unique(result["sector"])
+        return {
+            "node_id": node_id,
+            "count": len(index),
+            "max_depth": int(result["depth"].max()) if len(index) else 0,
+            "sectors": [self.sectors[code] for code in sector_codes],
+            "nodes": [
+                {
+                    "node_id": int(failed_id),
+                    "depth": int(depth),
+                    "parent_id": int(parent_id),
+                    "type": self.types[type_code],
+                    "sector": self.sectors[sector_code]
+                }
+                for failed_id, depth, parent_id, type_code, sector_code in zip(
+                    result["node_id"], result["depth"], result["parent_id"],
+                    self.node_types[index], result["sector"])
+            ]
+        }
+
+def edge_ranges(starts, ends):
+    """Concatenate the ranges starts[i]:ends[i] into one index array
+    """
+    lengths = ends - starts
+    total = lengths.sum()
+    if total == 0:
+        return numpy.zeros(0, dtype=numpy.int64)
+    offsets = numpy.repeat(starts - numpy.cumsum(lengths) + lengths, lengths)
+    return offsets + numpy.arange(total)
+
+def _copy_rows(conn, sql, params):
+    """Fetch rows of a query with COPY, as lists of strings
+    """
+    with conn.cursor() as cur:
+        query = cur.mogrify(sql, params).decode("utf-8")
+        buf = io.StringIO()
+        cur.copy_expert("COPY ({}) TO STDOUT WITH CSV".format(query), buf)
+    buf.seek(0)
+    return list(csv.reader(buf))
+
+def _codes(values, names):
+    """Encode values as indices into names, adding any new names
+    """
+    lookup = dict((name, code) for code, name in enumerate(names))
+    codes = numpy.empty(len(values), dtype=numpy.int32)
+    for i, value in enumerate(values):
+        value = value or None
+        if value not in lookup:
+            lookup[value] = len(names)
+            names.append(value)
+        codes[i] = lookup[value]
+    return codes
+
+NODES_VERSION_SQL = "SELECT count(*), max(last_updated) FROM sos_i_nodes"
+
+EDGES_VERSION_SQL = """SELECT count(*), max(last_updated)
+FROM sos_i_edges
+WHERE from_node_id IS NOT NULL AND to_node_id IS NOT NULL"""
+
+def _version(conn, sql):
+    """(count, max(last_updated)) of the rows in the graph
+    """
+    with conn.cursor() as cur:
+        cur.execute(sql)
+        count, last_updated = cur.fetchone()
+    return count, last_updated
+
+def _load_nodes(conn, since, types):
+    sql = "SELECT node_id, type FROM sos_i_nodes"
+    params = []
+    if since is not None:
+        sql += " WHERE last_updated >= %s"
+        params.append(since)
+    rows = _copy_rows(conn, sql, params)
+    node_ids = numpy.array([int(row[0]) for row in rows], dtype=numpy.int64)
+    return node_ids, _codes([row[1] for row in rows], types)
+
+def _load_edges(conn, since, sectors):
+    sql = """SELECT edge_id, from_node_id, to_node_id, sector
+    FROM sos_i_edges
+    WHERE from_node_id IS NOT NULL AND to_node_id IS NOT NULL"""
+    params = []
+    if since is not None:
+        sql += " AND last_updated >= %s"
+        params.append(since)
+    rows = _copy_rows(conn, sql, params)
+    ids = numpy.array([[int(value) for value in row[:3]] for row in rows],
+                      dtype=numpy.int64).reshape(-1, 3)
+    return ids[:, 0], ids[:, 1], ids[:, 2], _codes([row[3] for row in rows], sectors)
+
+def _merge(old_ids, old_columns, new_ids, new_columns):
+    """Replace rows of old columns with new rows of the same id, and append
+    the rest of the new rows
+    """
+    keep = ~numpy.isin(old_ids, new_ids)
+    ids = numpy.concatenate((old_ids[keep], new_ids))
+    columns = [numpy.concatenate((old[keep], new)) for old, new in zip(old_columns, new_columns)]
+    return ids, columns
+
+def load_graph(conn):
+    """Load the whole dependency graph from the database
+    """
+    nodes_version = _version(conn, NODES_VERSION_SQL)
+    edges_version = _version(conn, EDGES_VERSION_SQL)
+    types, sectors = [], []
+    graph = DependencyGraph(_load_nodes(conn, None, types), _load_edges(conn, None, sectors),
+                            types, sectors)
+    graph.nodes_version = nodes_version
+    graph.edges_version = edges_version
+    return graph
+
+def refresh_graph(conn, graph):
+    """Bring a graph up to date with the database
+
+    Loads only rows updated since the graph was built. If rows have been
+    deleted, so that the merged row count is more than the table's, the
+    graph is loaded again in full. Returns the same graph if nothing has
+    changed, else a new graph.
+    """
+    nodes_version = _version(conn, NODES_VERSION_SQL)
+    edges_version = _version(conn, EDGES_VERSION_SQL)
+    if nodes_version == graph.nodes_version and edges_version == graph.edges_version:
+        return graph
+
+    types, sectors = list(graph.types), list(graph.sectors)
+    node_ids, node_types = graph.node_ids, graph.node_types
+    if nodes_version != graph.nodes_version:
+        new_nodes = _load_nodes(conn, graph.nodes_version[1], types)
+        node_ids, (node_types, ) = _merge(node_ids, (node_types, ), new_nodes[0], new_nodes[1:])
+        if len(node_ids) != nodes_version[0]:
+            return load_graph(conn)
+
+    edge_ids, from_ids, to_ids, edge_sectors = graph._edge_rows
+    if edges_version != graph.edges_version:
+        new_edges = _load_edges(conn, graph.edges_version[1], sectors)
+        edge_ids, (from_ids, to_ids, edge_sectors) = _merge(
+            edge_ids, (from_ids, to_ids, edge_sectors), new_edges[0], new_edges[1:])
+        if len(edge_ids) != edges_version[0]:
+            return load_graph(conn)
+
+    refreshed = DependencyGraph((node_ids, node_types), (edge_ids, from_ids, to_ids, edge_sectors),
+                                types, sectors)
+    refreshed.nodes_version = nodes_version
+    refreshed.edges_version = edges_version
+    return refreshed
+
+_graph = None
+_graph_checked_at = 0
+_graph_lock = threading.Lock()
+
+def get_graph(conn):
+    """Get the process-wide dependency graph, checking for changes at most
+    every APP_GRAPH_REFRESH_SECONDS (default 10)
+    """
+    global _graph, _graph_checked_at
+    interval = float(os.environ.get("APP_GRAPH_REFRESH_SECONDS", 10))
+    with _graph_lock:
+        now = time.time()
+        if _graph is None:
+            _graph = load_graph(conn)
+            _graph_checked_at = now
+        elif now - _graph_checked_at >= interval:
+            _graph = refresh_graph(conn, _graph)
+            _graph_checked_at = now
+        return _graph
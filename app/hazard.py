@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Exposure of nodes and edges to a hazard footprint, e.g. a flood extent
+"""
+from __future__ import print_function
+import json
+
+FOOTPRINT_SQL = """WITH footprint AS (
+    SELECT ST_SetSRID(ST_GeomFromGeoJSON(geometry::text), 4326)::geography AS geom
+    FROM json_array_elements(%s::json) AS geometry
+)"""
+
+def footprint_geometries(geojson):
+    """List the geometries of a GeoJSON geometry, Feature or
+    FeatureCollection, skipping features without geometry
+
+    Coordinates are expected in WGS84 longitude/latitude.
+    """
+    kind = geojson.get("type")
+    if kind == "FeatureCollection":
+        geometries = []
+        for feature in geojson.get("features", []):
+            geometries.extend(footprint_geometries(feature))
+        return geometries
+    if kind == "Feature":
+        if geojson.get("geometry") is None:
+            return []
+        return footprint_geometries(geojson["geometry"])
+    if kind == "GeometryCollection":
+        return list(geojson.get("geometries", []))
+    if kind in ("Polygon", "MultiPolygon", "LineString", "MultiLineString", "Point", "MultiPoint"):
+        return [geojson]
+    raise ValueError("Not a GeoJSON geometry, Feature or FeatureCollection: {}".format(kind))
+
+def get_exposed_nodes(conn, geometries):
+    """Get (node_id, type) of nodes within any of a list of GeoJSON
+    geometries
+
+    Each footprint geometry is joined to nodes with ST_Intersects, which
+    uses the GIST index on location.
+    """
+    with conn.cursor() as cur:
+        cur.execute(FOOTPRINT_SQL + """
+        SELECT DISTINCT n.node_id, n.type
+        FROM footprint
+        JOIN sos_i_nodes AS n ON ST_Intersects(n.location, footprint.geom)
+        ORDER BY n.node_id""", (json.dumps(geometries), ))
+        return [(row[0], row[1]) for row in cur]
+
+def get_exposed_edges(conn, geometries):
+    """Get (edge_id, sector, exposed length in metres) of edges crossing any
+    of a list of GeoJSON geometries
+    """
+    with conn.cursor() as cur:
+        cur.execute(FOOTPRINT_SQL + """
+        SELECT
+            e.edge_id,
+            e.sector,
+            sum(ST_Length(ST_Intersection(e.location, footprint.geom)))
+        FROM footprint
+        JOIN sos_i_edges AS e ON ST_Intersects(e.location, footprint.geom)
+        GROUP BY e.edge_id, e.sector
+        ORDER BY e.edge_id""", (json.dumps(geometries), ))
+        return [(row[0], row[1], row[2]) for row in cur]
+
+# key for nodes with no type, or edges with no sector, in summaries
+UNKNOWN = "unknown"
+
+def count_by(values):
+    """Count occurrences of each value, as a dict, counting None as UNKNOWN
+    so the keys can be sorted when sent as JSON
+    """
+    counts = {}
+    for value in values:
+        if value is None:
+            value = UNKNOWN
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+def exposure_summary(nodes, edges=None, graph=None):
+    """Summarise exposed nodes (node_id, type) and edges (edge_id, sector,
+    length), grouped by node type and edge sector
+
+    With a dependency `graph`, also finds the nodes which would fail in turn
+    if the exposed nodes failed.
+    """
+    summary = {
+        "nodes": {
+            "count": len(nodes),
+            "by_type": count_by(node_type for _, node_type in nodes),
+            "node_ids": [node_id for node_id, _ in nodes]
+        }
+    }
+    if edges is not None:
+        by_sector = {}
+        for _, sector, length in edges:
+            totals = by_sector.setdefault(sector or UNKNOWN, {"count": 0, "length": 0.0})
+            totals["count"] += 1
+            totals["length"] += length or 0.0
+        summary["edges"] = {
+            "count": len(edges),
+            "by_sector": by_sector,
+            "edge_ids": [edge_id for edge_id, _, _ in edges]
+        }
+    if graph is not None:
+        cascade = graph.cascade_dict([node_id for node_id, _ in nodes])
+        summary["cascade"] = {
+            "count": cascade["count"],
+            "max_depth": cascade["max_depth"],
+            "sectors": cascade["sectors"],
+            "by_type": count_by(node["type"] for node in cascade["nodes"]),
+            "nodes": cascade["nodes"]
+        }
+    return summary
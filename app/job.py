@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""Background jobs: imports and analyses queued from the web app
+
+Jobs are rows in sos_i_jobs (see migration 009). Each job type runs one of
+the command line tools as a subprocess, with the job's args passed as its
+positional arguments and options, so a job does exactly what running the
+script by hand would:
+
+- osm_import: `data_import.osm`
+- osc_import: `data_import.osc`
+- dependencies: `data_import.depend_on_nearest_of_type`
+- criticality: `analysis.criticality`
+
+Jobs go from queued to running when claimed by a worker (`jobs.worker`),
+then to succeeded, failed or cancelled. Cancelling a running job marks it
+cancelling until its worker has stopped the process.
+
+Each job type has a limit on how many run at once, across all workers, so
+that e.g. several area imports can share the machine while analyses which
+use every core run one at a time.
+"""
+from __future__ import print_function
+import os
+import sys
+import psycopg2.extras
+from query import page_clause, where_clause
+from source import get_source_by_short_name
+
+# for each job type: module to run, positional args, options by name with
+# their type, options for scratch files, and default number which can run
+# at once
+JOB_TYPES = {
+    "osm_import": {
+        "module": "data_import.osm",
+        "positional": ("path", "source", "area"),
+        "options": {"rules": str, "batch_size": int, "workers": int, "ways": bool,
+                    "upsert": bool, "delete_missing": bool},
+        # scratch files, placed in the job's own directory by the worker
+        "files": {"coords_cache": "coords.sqlite"},
+        "limit": 2
+    },
+    "osc_import": {
+        "module": "data_import.osc",
+        "positional": ("path", "source", "area"),
+        "options": {"rules": str, "batch_size": int},
+        "limit": 1
+    },
+    "dependencies": {
+        "module": "data_import.depend_on_nearest_of_type",
+        "positional": ("from_type", "to_type", "sector"),
+        "options": {"k": int, "max_distance": float, "method": str, "capacity": int},
+        "limit": 2
+    },
+    "criticality": {
+        "module": "analysis.criticality",
+        "positional": (),
+        "options": {"workers": int},
+        "limit": 1
+    }
+}
+
+STATUSES = ("queued", "running", "cancelling", "succeeded", "failed", "cancelled")
+ACTIVE_STATUSES = ["running", "cancelling"]
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+# key of the advisory lock held while claiming a job, so that concurrency
+# limits are checked by one worker at a time
+CLAIM_LOCK = 90240001
+
+JOB_COLUMNS_SQL = """job_id, job_type, args, status, data_source_id, progress, output,
+    exit_code, worker, log_path, submitted_at, started_at, heartbeat_at, finished_at"""
+
+def validate_args(job_type, args):
+    """Check args for a job type, returning them with values of the right
+    type. Raises ValueError for an unknown job type, or missing, unknown or
+    invalid args.
+    """
+    if job_type not in JOB_TYPES:
+        raise ValueError("Unknown job type: {}".format(job_type))
+    if not isinstance(args, dict):
+        raise ValueError("Job args must be an object")
+    spec = JOB_TYPES[job_type]
+
+    checked = {}
+    for name in spec["positional"]:
+        value = args.get(name)
+        if value is None or value == "":
+            raise ValueError("Missing {} for {} job".format(name, job_type))
+        checked[name] = str(value)
+
+    for name, value in args.items():
+        if name in spec["positional"] or value is None:
+            continue
+        if name not in spec["options"]:
+            raise ValueError("Unknown arg for {} job: {}".format(job_type, name))
+        kind = spec["options"][name]
+        if kind is bool:
+            if not isinstance(value, bool):
+                raise ValueError("{} must be true or false".format(name))
+            checked[name] = value
+            continue
+        try:
+            checked[name] = kind(value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid {}: {}".format(name, value))
+    return checked
+
+def job_command(job_type, args, job_dir=None):
+    """Command line to run a job, as a list for `subprocess`
+
+    Scratch files are put in `job_dir`, which should belong to this job
+    alone, so that jobs running at once do not share them.
+    """
+    spec = JOB_TYPES[job_type]
+    command = [sys.executable, "-m", spec["module"]]
+    command.extend(str(args[name]) for name in spec["positional"])
+    for name in sorted(spec["options"]):
+        value = args.get(name)
+        if value is None or value is False:
+            continue
+        command.append("--" + name.replace("_", "-"))
+        if value is not True:
+            command.append(str(value))
+    if job_dir is not None:
+        for name, filename in sorted(spec.get("files", {}).items()):
+            command.extend(["--" + name.replace("_", "-"), os.path.join(job_dir, filename)])
+    return command
+
+def job_dict(row):
+    """Job row as a dict which can be sent as JSON
+    """
+    job = dict(row)
+    for key in ("submitted_at", "started_at", "heartbeat_at", "finished_at"):
+        if job[key] is not None:
+            job[key] = job[key].isoformat()
+    return job
+
+def submit_job(conn, job_type, args):
+    """Queue a job, returning it as a dict. Jobs with a `source` arg are
+    recorded against that data source.
+    """
+    args = validate_args(job_type, args)
+    data_source_id = None
+    if "source" in args:
+        data_source_id = get_source_by_short_name(conn, args["source"]).id
+
+    with conn.cursor() as cur:
+        cur.execute("""INSERT INTO sos_i_jobs (job_type, args, data_source_id)
+            VALUES (%s, %s, %s)
+            RETURNING {}""".format(JOB_COLUMNS_SQL),
+                    (job_type, psycopg2.extras.Json(args), data_source_id))
+        return job_dict(cur.fetchone())
+
+def get_job(conn, job_id):
+    """Get a job as a dict, or None if there is no such job
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT {} FROM sos_i_jobs WHERE job_id = %s".format(JOB_COLUMNS_SQL), (job_id, ))
+        row = cur.fetchone()
+    if row is None:
+        return None
+    return job_dict(row)
+
+def get_jobs(conn, statuses=None, job_types=None, data_source_id=None, after_id=None, limit=100):
+    """Get jobs as dicts, in the order they were submitted
+    """
+    where, params = where_clause([
+        ("status = ANY(%s)", statuses),
+        ("job_type = ANY(%s)", job_types),
+        ("data_source_id = %s", data_source_id),
+        ("job_id > %s", after_id)
+    ])
+    page, page_params = page_clause("job_id", after_id, limit)
+    with conn.cursor() as cur:
+        cur.execute("SELECT {} FROM sos_i_jobs{}{}".format(JOB_COLUMNS_SQL, where, page),
+                    params + page_params)
+        return [job_dict(row) for row in cur]
+
+def cancel_job(conn, job_id):
+    """Cancel a job: queued jobs are cancelled at once, running jobs are
+    marked cancelling for their worker to stop. Returns the job, or None if
+    it has already finished.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""UPDATE sos_i_jobs
+            SET status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE 'cancelling' END,
+                finished_at = CASE WHEN status = 'queued' THEN now() END
+            WHERE job_id = %s AND status IN ('queued', 'running')
+            RETURNING {}""".format(JOB_COLUMNS_SQL), (job_id, ))
+        row = cur.fetchone()
+    if row is None:
+        return None
+    return job_dict(row)
+
+def claim_job(conn, worker, limits=None, job_types=None):
+    """Claim the next queued job of a type which is under its limit of
+    running jobs, marking it running on `worker`. Commits, and returns the
+    job or None if there is nothing to run.
+
+    `limits` maps job type to the most jobs of that type to run at once
+    (default: the limit in JOB_TYPES); `job_types` restricts the types this
+    worker runs.
+    """
+    limits = limits or {}
+    if job_types is None:
+        job_types = sorted(JOB_TYPES)
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_xact_lock(%s)", (CLAIM_LOCK, ))
+        cur.execute("""SELECT job_type, count(*)
+            FROM sos_i_jobs
+            WHERE status = ANY(%s)
+            GROUP BY job_type""", (ACTIVE_STATUSES, ))
+        running = dict((row[0], row[1]) for row in cur)
+        available = [
+            job_type for job_type in job_types
+            if running.get(job_type, 0) < limits.get(job_type, JOB_TYPES[job_type]["limit"])
+        ]
+        row = None
+        if available:
+            cur.execute("""UPDATE sos_i_jobs
+                SET status = 'running', worker = %s, started_at = now(), heartbeat_at = now()
+                WHERE job_id = (
+                    SELECT job_id
+                    FROM sos_i_jobs
+                    WHERE status = 'queued' AND job_type = ANY(%s)
+                    ORDER BY job_id
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING {}""".format(JOB_COLUMNS_SQL), (worker, available))
+            row = cur.fetchone()
+    conn.commit()
+    if row is None:
+        return None
+    return job_dict(row)
+
+def update_job(conn, job_id, progress=None, log_path=None):
+    """Record that a running job is alive, with its latest progress. Commits,
+    and returns the job's status, so the worker can see if it was cancelled.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""UPDATE sos_i_jobs
+            SET heartbeat_at = now(),
+                progress = COALESCE(%s, progress),
+                log_path = COALESCE(%s, log_path)
+            WHERE job_id = %s
+            RETURNING status""", (progress, log_path, job_id))
+        row = cur.fetchone()
+    conn.commit()
+    return row[0] if row is not None else None
+
+def finish_job(conn, job_id, status, exit_code=None, output=None):
+    """Mark a job finished with `status`, one of FINISHED_STATUSES. Commits.
+    """
+    if status not in FINISHED_STATUSES:
+        raise ValueError("Not a finished status: {}".format(status))
+    with conn.cursor() as cur:
+        cur.execute("""UPDATE sos_i_jobs
+            SET status = %s, exit_code = %s, output = %s, finished_at = now(), heartbeat_at = now()
+            WHERE job_id = %s""", (status, exit_code, output, job_id))
+    conn.commit()
+
+def fail_stale_jobs(conn, timeout=300):
+    """Mark jobs failed whose worker has not checked in for `timeout`
+    seconds, e.g. because it was killed. Commits, and returns their ids.
+    """
+    with conn.cursor() as cur:
+        cur.execute("""UPDATE sos_i_jobs
+            SET status = 'failed', output = 'Worker stopped responding', finished_at = now()
+            WHERE status = ANY(%s) AND heartbeat_at < now() - %s * interval '1 second'
+            RETURNING job_id""", (ACTIVE_STATUSES, timeout))
+        job_ids = [row[0] for row in cur]
+    conn.commit()
+    return job_ids
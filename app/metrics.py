@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Request instrumentation: phase timings, SQL timings and latency metrics
+
+Each request gets a `Timings` which collects the time spent in named phases:
+connect, query, hydrate (building objects from rows), serialize and render.
+Code marks phases with `timed(phase)`, which does nothing outside a request,
+and SQL run through `TimingCursor` is timed as "query", with statements
+slower than APP_SLOW_QUERY_MS (default 500) logged to the "app.sql" logger.
+
+When a request finishes, its timings are passed to each observer added with
+`add_observer`. The default observer is `registry`, which keeps latency
+histograms per route and phase and renders them in the Prometheus text
+format.
+"""
+from __future__ import print_function
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+import psycopg2.extras
+
+PHASES = ("connect", "query", "hydrate", "serialize", "render")
+
+# histogram bucket upper bounds, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+slow_query_log = logging.getLogger("app.sql")
+
+class Timings(object):
+    """Time spent in each phase of a request
+    """
+    def __init__(self):
+        self.started = time.time()
+        self.phases = {}
+        self.queries = 0
+
+    def add(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+    def elapsed(self):
+        return time.time() - self.started
+
+    def server_timing(self):
+        """Format as a Server-Timing header value, durations in milliseconds
+        """
+        return ", ".join(
+            "{};dur={:.1f}".format(phase, self.phases[phase] * 1000)
+            for phase in PHASES if phase in self.phases)
+
+_local = threading.local()
+
+def start_request():
+    """Start timing a request in this thread
+    """
+    _local.timings = Timings()
+    return _local.timings
+
+def current():
+    """Timings of the request in this thread, or None
+    """
+    return getattr(_local, "timings", None)
+
+def finish_request(route, method, status):
+    """Stop timing the request in this thread and report it to observers
+    """
+    timings = current()
+    _local.timings = None
+    if timings is None:
+        return
+    seconds = timings.elapsed()
+    for observer in _observers:
+        observer(route, method, status, seconds, timings)
+
+@contextmanager
+def timed(phase):
+    """Add the time spent in a block to a phase of the current request
+    """
+    timings = current()
+    if timings is None:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.time() - start)
+
+def slow_query_seconds():
+    return float(os.environ.get("APP_SLOW_QUERY_MS", 500)) / 1000
+
+class TimingCursor(psycopg2.extras.DictCursor):
+    """DictCursor which times each statement as a "query" phase, and logs
+    slow statements
+    """
+    def execute(self, query, vars=None):
+        start = time.time()
+        try:
+            return super(TimingCursor, self).execute(query, vars)
+        finally:
+            self._record(query, vars, time.time() - start)
+
+    def executemany(self, query, vars_list):
+        start = time.time()
+        try:
+            return super(TimingCursor, self).executemany(query, vars_list)
+        finally:
+            self._record(query, None, time.time() - start)
+
+    def copy_expert(self, sql, file, size=8192):
+        start = time.time()
+        try:
+            return super(TimingCursor, self).copy_expert(sql, file, size)
+        finally:
+            self._record(sql, None, time.time() - start)
+
+    def _record(self, query, vars, seconds):
+        timings = current()
+        if timings is not None:
+            timings.add("query", seconds)
+            timings.queries += 1
+        registry.observe_query(seconds)
+        if seconds >= slow_query_seconds():
+            try:
+                statement = self.mogrify(query, vars) if vars is not None else query
+            except Exception:
+                statement = query
+            if isinstance(statement, bytes):
+                statement = statement.decode("utf-8", "replace")
+            slow_query_log.warning("slow query (%.0fms): %s", seconds * 1000, statement)
+
+class Histogram(object):
+    """Counts of observations in cumulative buckets, with a sum
+    """
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        """Lines of Prometheus text format, for a dict of labels
+        """
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf", ), self.counts):
+            cumulative += count
+            bucket_labels = dict(labels, le=str(bound))
+            lines.append("{}_bucket{} {}".format(name, format_labels(bucket_labels), cumulative))
+        lines.append("{}_sum{} {}".format(name, format_labels(labels), self.sum))
+        lines.append("{}_count{} {}".format(name, format_labels(labels), self.count))
+        return lines
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in sorted(labels.items())) + "}"
+
+class Registry(object):
+    """Latency histograms per route and per phase, and of SQL statements
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.phases = {}
+        self.queries = Histogram()
+        self.slow_queries = 0
+
+    def __call__(self, route, method, status, seconds, timings):
+        """Observe a finished request
+        """
+        with self._lock:
+            key = (route, method, str(status))
+            self.requests.setdefault(key, Histogram()).observe(seconds)
+            for phase, phase_seconds in timings.phases.items():
+                self.phases.setdefault((route, phase), Histogram()).observe(phase_seconds)
+
+    def observe_query(self, seconds):
+        with self._lock:
+            self.queries.observe(seconds)
+            if seconds >= slow_query_seconds():
+                self.slow_queries += 1
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format
+        """
+        with self._lock:
+            lines = [
+                "# HELP app_request_duration_seconds Request latency by route",
+                "# TYPE app_request_duration_seconds histogram"
+            ]
+            for (route, method, status), histogram in sorted(self.requests.items()):
+                lines.extend(histogram.lines("app_request_duration_seconds", {
+                    "route": route, "method": method, "status": status}))
+
+            lines.extend([
+                "# HELP app_request_phase_seconds Time spent in each phase of a request",
+                "# TYPE app_request_phase_seconds histogram"
+            ])
+            for (route, phase), histogram in sorted(self.phases.items()):
+                lines.extend(histogram.lines("app_request_phase_seconds", {
+                    "route": route, "phase": phase}))
+
+            lines.extend([
+                "# HELP app_sql_duration_seconds SQL statement latency",
+                "# TYPE app_sql_duration_seconds histogram"
+            ])
+            lines.extend(self.queries.lines("app_sql_duration_seconds", {}))
+            lines.extend([
+                "# HELP app_sql_slow_queries_total SQL statements slower than APP_SLOW_QUERY_MS",
+                "# TYPE app_sql_slow_queries_total counter",
+                "app_sql_slow_queries_total {}".format(self.slow_queries)
+            ])
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+_observers = [registry]
+
+def add_observer(observer):
+    """Add a function of (route, method, status, seconds, timings), called
+    as each request finishes
+    """
+    _observers.append(observer)
@@ -2,11 +2,24 @@
 """Infrastructure nodes: assets and points of demand
 """
 from __future__ import print_function
+import array
 import datetime
+import numpy
+from area import get_areas
+from cache import invalidate
+from columns import Categorical, StringColumn
+from metrics import timed
+from node_type import get_node_types
+from query import BBOX_SQL, page_clause, where_clause
 
-class Node:
+UTC = datetime.timezone.utc
+
+class Node(object):
     """A node in the infrastructure network
     """
+    __slots__ = ("id", "name", "lon", "lat", "type", "function", "condition",
+                 "last_updated", "status")
+
     def __init__(self, data=None):
         self.id = 0
         self.name = ""
@@ -59,6 +72,11 @@ class Node:
 
     def save(self, conn):
         with conn.cursor() as cur:
+            cur.execute("""SELECT type, area, ST_X(location::geometry), ST_Y(location::geometry)
+                FROM sos_i_nodes
+                WHERE node_id = %s""", (self.id, ))
+            before = cur.fetchone()
+
             sql = """UPDATE sos_i_nodes SET
                 location = 'POINT(%s %s)',
                 node_name = %s,
@@ -80,6 +98,14 @@ class Node:
                 datetime.datetime.now(),
                 self.id, ))
 
+        if before is not None:
+            old_type, area, old_lon, old_lat = before
+            if old_type != self.type:
+                count_node(conn, old_type, None, -1)
+                count_node(conn, self.type, None, 1)
+            if (old_lon, old_lat) != (self.lon, self.lat):
+                count_node(conn, None, area, 0, self.lon, self.lat)
+        invalidate("nodes")
         return self
 
     def delete(self, conn):
@@ -87,8 +113,13 @@ class Node:
             # only staged nodes can be deleted, otherwise only archive
             with conn.cursor() as cur:
                 sql = """DELETE FROM sos_i_nodes
-                WHERE node_id = %s"""
+                WHERE node_id = %s
+                RETURNING type, area"""
                 cur.execute(sql, (self.id, ))
+                deleted = cur.fetchone()
+            if deleted is not None:
+                count_node(conn, deleted[0], deleted[1], -1)
+            invalidate("nodes")
         else:
             raise StatusError("This node cannot be deleted (only nodes that are staged can be deleted).")
 
@@ -129,45 +160,395 @@ class Node:
         self.condition = node_condition
 
     def set_status(self, status):
-        if self.status is None and status in ("staged", "approved", "archived"):
+        if self.status is None and status in STATUSES:
             # status can be set on creation
             self.status = status
 
-        if self.status == "staged" and status == "approved":
-            # status can change from staged->approved
-            self.status = "approved"
+        elif (self.status, status) in STATUS_TRANSITIONS:
+            # status can change from staged->approved->archived
+            self.status = status
+
+STATUSES = ("staged", "approved", "archived")
+
+# allowed (from, to) status changes
+STATUS_TRANSITIONS = (("staged", "approved"), ("approved", "archived"))
 
-        if self.status == "approved" and status == "archived":
-            # status can change from approved->archived
-            self.status = "archived"
+# fields which can be edited in bulk
+EDITABLE_FIELDS = ("node_name", "type", "function", "condition")
+
+def refresh_lookups(conn):
+    """Rebuild the node type and area lookup tables (migration 008) from
+    every node, after changing the types of many nodes. The caller commits,
+    then calls `clear_lookups`.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT sos_refresh_lookups()")
+
+def count_node(conn, node_type, area, delta, lon=None, lat=None):
+    """Adjust the lookup tables for a single node added (`delta` 1) or
+    removed (-1) from a type and/or area, or moved (0) to (lon, lat) within
+    an area, without a rebuild (migration 012). The caller commits, then
+    calls `clear_lookups`.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT sos_count_node(%s, %s, %s, %s, %s)", (node_type, area, delta, lon, lat))
+
+def clear_lookups():
+    """Drop node types and areas cached in this process, once changes to
+    the lookup tables are committed
+    """
+    get_node_types.clear()
+    get_areas.clear()
 
 class StatusError(Exception):
     """Raise when the node's status forbids some action
     """
 
-def get_nodes(conn, area=None):
-    """Get a list of nodes
+NODES_SQL = """SELECT
+    ST_X(location::geometry) as lon,
+    ST_Y(location::geometry) as lat,
+    node_id,
+    node_name,
+    type,
+    function,
+    condition,
+    status,
+    last_updated
+FROM sos_i_nodes"""
+
+# precomputed by analysis.criticality
+DOWNSTREAM_COUNT_SQL = """(SELECT downstream_count
+    FROM sos_i_node_criticality AS c
+    WHERE c.node_id = sos_i_nodes.node_id)"""
+
+def node_query(area=None, bbox=None, node_types=None, statuses=None,
+               updated_since=None, min_downstream=None, node_ids=None, sort=None, after_id=None,
+               limit=None):
+    """Build the WHERE/ORDER BY/LIMIT SQL and params for filtering nodes
+
+    - bbox: (min lon, min lat, max lon, max lat), using the GIST index
+    - node_types, statuses: lists of allowed values
+    - updated_since: datetime, only nodes updated after it
+    - min_downstream: only nodes with at least this many dependent nodes
+    - node_ids: list of node ids
+    - sort: "criticality" for the most depended-on nodes first, which
+      cannot be combined with after_id
+    - after_id, limit: keyset pagination by node_id
     """
-    with conn.cursor() as cur:
-        sql = """SELECT
-            ST_X(location::geometry) as lon,
-            ST_Y(location::geometry) as lat,
-            node_id,
-            node_name,
-            type,
-            function,
-            condition,
-            status,
-            last_updated
-        FROM sos_i_nodes"""
-
-        if area is not None:
-            sql = sql + " WHERE area = %s"
-            cur.execute(sql, (area, ))
+    if sort not in (None, "criticality"):
+        raise ValueError("Unknown sort: {}".format(sort))
+    if sort is not None and after_id is not None:
+        raise ValueError("after_id can only be used with nodes in node_id order")
 
-        else:
-            cur.execute(sql)
+    where, params = where_clause([
+        ("area = %s", area),
+        (BBOX_SQL, None if bbox is None else tuple(bbox)),
+        ("type = ANY(%s)", node_types),
+        ("status::text = ANY(%s)", statuses),
+        ("last_updated > %s", updated_since),
+        ("{} >= %s".format(DOWNSTREAM_COUNT_SQL), min_downstream),
+        ("node_id = ANY(%s)", node_ids),
+        ("node_id > %s", after_id)
+    ])
+    if sort == "criticality":
+        page = " ORDER BY {} DESC NULLS LAST, node_id".format(DOWNSTREAM_COUNT_SQL)
+        page_params = []
+        if limit is not None:
+            page += " LIMIT %s"
+            page_params.append(limit)
+    else:
+        page, page_params = page_clause("node_id", after_id, limit)
+    return where + page, params + page_params
+
+NODE_COLUMNS_SQL = """SELECT
+    node_id,
+    ST_X(location::geometry),
+    ST_Y(location::geometry),
+    node_name,
+    type,
+    function,
+    condition,
+    status::text,
+    extract(epoch FROM last_updated)::bigint
+FROM sos_i_nodes"""
+
+class NodeCollection(object):
+    """Nodes held as columns, rather than as a list of `Node`
+
+    - ids, lon, lat: NumPy arrays
+    - names: a `StringColumn`
+    - types, functions, conditions, statuses: `Categorical` columns
+    - last_updated: seconds since the epoch, as int64
+
+    Indexing with an int gives a `Node`, built when it is accessed. Indexing
+    with a slice, boolean mask or array of indices gives a new collection,
+    so filters are vectorized, for example:
+
+        nodes[nodes.types.isin(["substation"]) & nodes.in_bbox(bbox)]
+    """
+    def __init__(self, ids, lon, lat, names, types, functions, conditions, statuses, last_updated):
+        self.ids = ids
+        self.lon = lon
+        self.lat = lat
+        self.names = names
+        self.types = types
+        self.functions = functions
+        self.conditions = conditions
+        self.statuses = statuses
+        self.last_updated = last_updated
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from an iterable of rows of NODE_COLUMNS_SQL, one row at a
+        time
+        """
+        ids = array.array("q")
+        lon = array.array("d")
+        lat = array.array("d")
+        last_updated = array.array("q")
+        names = StringColumn.Builder()
+        categoricals = [Categorical.Builder() for _ in range(4)]
+        for row in rows:
+            ids.append(row[0])
+            lon.append(row[1] if row[1] is not None else numpy.nan)
+            lat.append(row[2] if row[2] is not None else numpy.nan)
+            names.append(row[3])
+            for builder, value in zip(categoricals, row[4:8]):
+                builder.append(value)
+            last_updated.append(row[8] if row[8] is not None else 0)
+
+        types, functions, conditions, statuses = [builder.build() for builder in categoricals]
+        return cls(
+            numpy.frombuffer(ids, dtype=numpy.int64),
+            numpy.frombuffer(lon, dtype=numpy.float64),
+            numpy.frombuffer(lat, dtype=numpy.float64),
+            names.build(),
+            types,
+            functions,
+            conditions,
+            statuses,
+            numpy.frombuffer(last_updated, dtype=numpy.int64))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.node(i)
 
-        nodes = [Node(f) for f in cur]
+    def __getitem__(self, key):
+        if isinstance(key, (int, numpy.integer)):
+            return self.node(key)
+        return self.take(numpy.arange(len(self))[key])
+
+    def node(self, i):
+        """The node at index i, as a `Node`
+        """
+        if i < 0:
+            i += len(self)
+        node = Node()
+        node.id = int(self.ids[i])
+        node.name = self.names[i]
+        node.lon = float(self.lon[i])
+        node.lat = float(self.lat[i])
+        node.type = self.types[i]
+        node.function = self.functions[i]
+        node.condition = self.conditions[i]
+        node.status = self.statuses[i]
+        node.last_updated = datetime.datetime.fromtimestamp(int(self.last_updated[i]), UTC)
+        return node
+
+    def take(self, index):
+        """New collection of the nodes at an array of indices
+        """
+        return NodeCollection(
+            self.ids[index],
+            self.lon[index],
+            self.lat[index],
+            self.names.take(index),
+            self.types.take(index),
+            self.functions.take(index),
+            self.conditions.take(index),
+            self.statuses.take(index),
+            self.last_updated[index])
+
+    def in_bbox(self, bbox):
+        """Boolean mask of nodes inside (min lon, min lat, max lon, max lat)
+        """
+        min_lon, min_lat, max_lon, max_lat = bbox
+        return (self.lon >= min_lon) & (self.lon <= max_lon) & \
+            (self.lat >= min_lat) & (self.lat <= max_lat)
+
+    def updated_since(self, when):
+        """Boolean mask of nodes updated after a timezone-aware datetime
+        """
+        return self.last_updated > int((when - datetime.datetime.fromtimestamp(0, UTC)).total_seconds())
+
+    def nbytes(self):
+        """Approximate memory used by the columns, in bytes
+        """
+        return sum(column.nbytes if isinstance(column, numpy.ndarray) else column.nbytes()
+                   for column in (self.ids, self.lon, self.lat, self.names, self.types,
+                                  self.functions, self.conditions, self.statuses, self.last_updated))
+
+def get_nodes(conn, area=None, chunk_size=2000, **filters):
+    """Get nodes as a `NodeCollection`, filtered as by `node_query`
+
+    Rows are fetched `chunk_size` at a time from a server-side cursor and
+    added straight to the columns, so only the collection is held in
+    memory, not every row. Must be used inside a transaction, which psycopg2
+    opens by default.
+    """
+    with conn.cursor(name="get_nodes") as cur:
+        cur.itersize = chunk_size
+        sql, params = node_query(area=area, **filters)
+        cur.execute(NODE_COLUMNS_SQL + sql, params)
+
+        with timed("hydrate"):
+            nodes = NodeCollection.from_rows(cur)
 
     return nodes
+
+def iter_nodes(conn, area=None, chunk_size=2000, **filters):
+    """Iterate over nodes, fetching `chunk_size` rows at a time from a
+    server-side cursor
+
+    Memory use does not grow with the number of nodes, so this suits
+    streaming large responses. Must be used inside a transaction, which
+    psycopg2 opens by default.
+    """
+    with conn.cursor(name="iter_nodes") as cur:
+        cur.itersize = chunk_size
+        sql, params = node_query(area=area, **filters)
+        cur.execute(NODES_SQL + sql, params)
+
+        for row in cur:
+            yield Node(row)
+
+NODE_FEATURE_SQL = """json_build_object(
+    'type', 'Feature',
+    'geometry', ST_AsGeoJSON(location)::json,
+    'properties', json_build_object(
+        'id', node_id,
+        'name', COALESCE(node_name, ''),
+        'type', type,
+        'function', function,
+        'condition', condition,
+        'last_updated', to_char(last_updated AT TIME ZONE 'UTC', 'Dy, DD Mon YYYY HH24:MI:SS "+0000"'),
+        'status', status
+    )
+)"""
+
+def get_nodes_geojson(conn, area=None, **filters):
+    """Get nodes as a GeoJSON FeatureCollection, built by the database
+
+    Returns the JSON text as it comes from postgres, without decoding rows
+    into python objects. Features match `Node.as_geojson_feature_dict`. With
+    a `limit`, the collection has a `next_after_id` member giving the cursor
+    for the next page (null on the last page).
+    """
+    with conn.cursor() as cur:
+        sql, params = node_query(area=area, **filters)
+        limit = filters.get("limit")
+        cur.execute("""SELECT json_build_object(
+            'type', 'FeatureCollection',
+            'features', COALESCE(json_agg(feature ORDER BY node_id), '[]'::json),
+            'next_after_id', CASE WHEN count(*) = %s THEN max(node_id) END
+        )::text
+        FROM (
+            SELECT node_id, {} AS feature
+            FROM sos_i_nodes{}
+        ) AS page""".format(NODE_FEATURE_SQL, sql), [limit] + params)
+
+        return cur.fetchone()[0]
+
+def bulk_edit_nodes(conn, area=None, data_source_id=None, node_types=None, node_ids=None,
+                    statuses=None, status=None, fields=None):
+    """Change the status and/or edit fields of all nodes matching filters, in
+    a single UPDATE
+
+    Status changes follow the same rules as `Node.set_status`: nodes with
+    no status can be given any status, others only move staged->approved->
+    archived. Nodes which cannot make the change are left untouched, along
+    with any field edits. `fields` is a dict of EDITABLE_FIELDS to set.
+
+    Returns a dict of the number of nodes matched and with each outcome:
+    updated, unchanged (already had the status, and no fields to edit) or
+    forbidden. Lookup tables are refreshed if types were edited. The
+    caller commits, then calls `clear_lookups`. Raises ValueError for an invalid change, or for type,
+    id or status filters which are not lists.
+    """
+    fields = fields or {}
+    if status is not None and status not in STATUSES:
+        raise ValueError("Unknown status: {}".format(status))
+    for field in fields:
+        if field not in EDITABLE_FIELDS:
+            raise ValueError("Field cannot be edited in bulk: {}".format(field))
+    if status is None and not fields:
+        raise ValueError("Nothing to change")
+    for name, values in (("type", node_types), ("id", node_ids), ("status", statuses)):
+        if values is not None and not isinstance(values, list):
+            raise ValueError("Filter by {} must be a list".format(name))
+
+    where, params = where_clause([
+        ("area = %s", area),
+        ("data_source_id = %s", data_source_id),
+        ("type = ANY(%s)", node_types),
+        ("node_id = ANY(%s)", node_ids),
+        ("status::text = ANY(%s)", statuses)
+    ])
+    if not where:
+        raise ValueError("Filter by at least one of area, source, type, id or status")
+
+    field_names = sorted(fields)
+    sets = "".join("{0} = %s, ".format(field) for field in field_names)
+    transitions = ", ".join("(%s, %s)" for _ in STATUS_TRANSITIONS)
+    transition_params = [value for transition in STATUS_TRANSITIONS for value in transition]
+
+    sql = """WITH matched AS (
+        SELECT node_id, status::text AS status
+        FROM sos_i_nodes{where}
+        FOR UPDATE
+    ),
+    transitions (from_status, to_status) AS (
+        VALUES {transitions}
+    ),
+    outcomes AS (
+        SELECT
+            matched.node_id,
+            CASE
+                WHEN %s::text IS NULL OR matched.status IS NULL THEN 'updated'
+                WHEN matched.status = %s THEN
+                    CASE WHEN %s THEN 'updated' ELSE 'unchanged' END
+                WHEN transitions.to_status IS NOT NULL THEN 'updated'
+                ELSE 'forbidden'
+            END AS outcome
+        FROM matched
+        LEFT JOIN transitions
+            ON transitions.from_status = matched.status AND transitions.to_status = %s
+    ),
+    updated AS (
+        UPDATE sos_i_nodes SET
+            {sets}status = COALESCE(%s::data_status, sos_i_nodes.status),
+            last_updated = now()
+        FROM outcomes
+        WHERE sos_i_nodes.node_id = outcomes.node_id
+        AND outcomes.outcome = 'updated'
+        RETURNING sos_i_nodes.node_id
+    )
+    SELECT outcome, count(*) FROM outcomes GROUP BY outcome""".format(
+        where=where, transitions=transitions, sets=sets)
+
+    with conn.cursor() as cur:
+        cur.execute(sql, params + transition_params + [
+            status, status, bool(fields), status] + [fields[field] for field in field_names] + [status])
+        counts = {"updated": 0, "unchanged": 0, "forbidden": 0}
+        for outcome, count in cur:
+            counts[outcome] = count
+
+    counts["matched"] = sum(counts.values())
+    if counts["updated"]:
+        if "type" in fields:
+            refresh_lookups(conn)
+        invalidate("nodes")
+    return counts
@@ -2,12 +2,17 @@
 """Infrastructure node types: classes of asset
 """
 from __future__ import print_function
+from cache import lookup_cache
 
+@lookup_cache
 def get_node_types(conn):
-    sql = """SELECT DISTINCT type
-    FROM sos_i_nodes
+    """Get list of node types, from the sos_lu_node_types lookup table
+    """
+    sql = """SELECT type
+    FROM sos_lu_node_types
+    ORDER BY type
     """
     cur = conn.cursor()
     cur.execute(sql)
 
-    return [row[0] for row in cur]
\ No newline at end of file
+    return [row[0] for row in cur]
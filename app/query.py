@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Helpers to build filtered and paginated SELECT queries
+"""
+from __future__ import print_function
+
+BBOX_SQL = "location && ST_MakeEnvelope(%s, %s, %s, %s, 4326)::geography"
+
+def where_clause(conditions):
+    """Build a WHERE clause from a list of (sql, value) conditions
+
+    Conditions with a value of None are left out. A tuple value supplies
+    several parameters to one condition (e.g. a bounding box); a list value
+    is passed as a single array parameter (e.g. for `= ANY(%s)`).
+
+    Returns (sql, params), where sql is empty if there are no conditions.
+    """
+    clauses = []
+    params = []
+    for sql, value in conditions:
+        if value is None:
+            continue
+        clauses.append(sql)
+        if isinstance(value, tuple):
+            params.extend(value)
+        else:
+            params.append(value)
+
+    if not clauses:
+        return "", params
+    return " WHERE " + " AND ".join(clauses), params
+
+def page_clause(id_column, after_id=None, limit=None):
+    """Order by id for keyset pagination, with an optional LIMIT
+
+    Combine with an `id_column > %s` condition for the page after an id.
+    Without either, rows are left unordered. Returns (sql, params). Raises
+    ValueError for a limit less than 1.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Limit must be at least 1, got {}".format(limit))
+    if after_id is None and limit is None:
+        return "", []
+    if limit is None:
+        return " ORDER BY {}".format(id_column), []
+    return " ORDER BY {} LIMIT %s".format(id_column), [limit]
+
+def next_after_id(last_id, count, limit):
+    """Cursor for the next page, or None if this was the last page
+    """
+    if limit is not None and count == limit:
+        return last_id
+    return None
@@ -2,17 +2,15 @@
 
 // APP global to hold application state for direct reference
 var APP = window.APP = {
-    // layers is a collection of leaflet map layers
-    // each layer contains related features (typically grouped by type)
+    // layers is a collection of leaflet map layers: vector tiles of nodes
+    // and of edges, served by /tiles/<layer>/<z>/<x>/<y>.mvt
     layers: {},
 
-    // hold another reference to nodes
-    // node_id => leaflet marker
-    nodes: {},
-
-    // layer_key => boolean, indicating whether is layer is active or not
+    // node type => boolean, indicating whether nodes of that type are shown
     activeLayers: {},
-    utilLayerKeys: [],
+
+    // id of the node shown in the details sidebar, if any
+    focusId: undefined,
 
     // possible locations for map view
     // - could load from database areas table?
@@ -44,42 +42,97 @@ function setupMap(){
     L.tileLayer(basemap_url, {
         attribution: '&copy; <a href="http://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors, &copy; <a href="https://carto.com/attributions">CARTO</a>'
     }).addTo(map);
+}
 
-    // layer to hold lines (added first to draw under subsequent point layers)
-    APP.layers.base_lines = L.layerGroup().addTo(map);
-    // save to list of util layers, e.g not to show in nav
-    APP.utilLayerKeys.push("base_lines");
+function tileUrl(layer, params){
+    // URL template of a vector tile layer, with filters as query params
+    var query = _.map(params, function(value, key){
+        return key + "=" + encodeURIComponent(value);
+    }).join("&");
+    return "/tiles/" + layer + "/{z}/{x}/{y}.mvt" + (query ? "?" + query : "");
 }
 
-function setupMapNodes(data){
-    // group nodes by type and add to map layers
-    var features_by_type = _.groupBy(data.features, function(feature){
-        return feature.properties.type;
-    });
-    _.map(features_by_type, function(features, type){
-        APP.layers[type] = addLayer(features);
+function nodeStyle(properties, zoom){
+    // at low zooms, features are clusters of nodes with a count
+    if(properties.count !== undefined){
+        return {
+            radius: Math.min(4 + Math.sqrt(properties.count), 20),
+            fill: true,
+            fillColor: "#3399ff",
+            fillOpacity: 0.6,
+            color: "#ffffff",
+            weight: 1
+        };
+    }
+    return {
+        radius: 5,
+        fill: true,
+        fillColor: "#ff9933",
+        fillOpacity: 0.9,
+        color: "#ffffff",
+        weight: 1
+    };
+}
+
+var FOCUS_STYLE = {
+    radius: 8,
+    fill: true,
+    fillColor: "#ffeb00",
+    fillOpacity: 1,
+    color: "#333333",
+    weight: 2
+};
+
+function setupMapTiles(node_types){
+    // edges first, to draw under nodes
+    APP.layers.edges = L.vectorGrid.protobuf(tileUrl("edges", {}), {
+        vectorTileLayerStyles: {
+            edges: {color: "#999999", weight: 1}
+        }
+    }).addTo(APP.map);
+
+    APP.layers.nodes = L.vectorGrid.protobuf(tileUrl("nodes", {}), {
+        vectorTileLayerStyles: {
+            nodes: nodeStyle
+        },
+        interactive: true,
+        getFeatureId: function(feature){
+            return feature.properties.id;
+        }
+    }).addTo(APP.map);
+    APP.layers.nodes.on("click", focusNode);
+
+    _.each(node_types, function(type){
         APP.activeLayers[type] = true;
     });
-
     updateTypeNav();
 
     var controls_form = document.querySelector(".main-controls");
     controls_form.addEventListener("change", updateActiveLayers);
 }
 
-function setupMapEdges(data){
-    // build array of dependent/dependency ids on each node
-    // - currently discarding other edge data
-    _.each(data.features, function(feature){
-        var from_node = APP.nodes[feature.properties.from_node_id]
-        var to_node = APP.nodes[feature.properties.to_node_id]
-        if(from_node !== undefined){
-            from_node.feature.properties.dependent_ids.push(feature.properties.to_node_id)
-        }
-        if(to_node !== undefined){
-            to_node.feature.properties.dependency_ids.push(feature.properties.from_node_id)
-        }
-    });
+function focusNode(e){
+    var properties = e.layer.properties;
+    if(properties.id === undefined){
+        // a cluster: zoom in to see its nodes
+        APP.map.setView(e.latlng, APP.map.getZoom() + 2);
+        return;
+    }
+
+    if(APP.focusId !== undefined){
+        APP.layers.nodes.resetFeatureStyle(APP.focusId);
+    }
+    if(APP.focusId === properties.id){
+        // remove focus from this node
+        APP.focusId = undefined;
+        closeDetails();
+        return;
+    }
+
+    // focus on this node, to show details
+    APP.focusId = properties.id;
+    APP.layers.nodes.setFeatureStyle(properties.id, FOCUS_STYLE);
+    showDetails(properties);
 }
 
 function getIconClass(type){
@@ -106,108 +159,15 @@ function getIconClass(type){
     return icon_class;
 }
 
-function getIconHtml(type){
-    var icon_class = getIconClass(type);
-    return '<i class="fa fa-'+icon_class+'" aria-hidden="true"></i>';
-}
-
-function addLayer(features){
-    return L.geoJSON(features, {
-        pointToLayer: function (feature, latlng) {
-            // create marker for this feature with an icon
-            var html = getIconHtml(feature.properties.type);
-            var marker = L.marker(latlng, {
-                icon: L.divIcon({
-                    html: html,
-                    iconSize: [18, 18]
-                })
-            });
-
-            // set up id for ease of reference later
-            marker._leaflet_id = feature.properties.type + feature.properties.id;
-            APP.nodes[feature.properties.id] = marker;
-
-            // set up array of dependent_ids and dependency_ids
-            // to be filled with data from edges
-            // - could do this server side?
-            // - each edge is currently just a straight-line dependency
-            feature.properties.dependent_ids = []
-            feature.properties.dependency_ids = []
-
-            // define click interaction, to show details on focus
-            marker.on("click", function(e){
-                if(this._icon.classList.contains("icon-focus")){
-                    // remove focus from this feature
-                    this._icon.classList.remove("icon-focus");
-                    closeDetails(this.feature);
-
-                    // clear dependency lines
-                    APP.layers.base_lines.clearLayers();
-
-                    // remove focus from any dependent features
-                    _.each(document.querySelectorAll(".icon-dependent"), function(el){
-                        el.classList.remove("icon-dependent");
-                    });
-
-                } else {
-                    if(!e.originalEvent.ctrlKey && !e.originalEvent.shiftKey){
-                        // remove focus from any other features
-                        _.each(document.querySelectorAll(".icon-focus, .icon-dependent"), function(el){
-                            el.classList.remove("icon-focus", "icon-dependent");
-                        });
-                        // clear dependency lines
-                        APP.layers.base_lines.clearLayers();
-                    }
-
-                    // focus on this feature
-                    this._icon.classList.add("icon-focus");
-                    showDetails(this.feature);
-
-                    // highlight dependencies
-                    _.each(this.feature.properties.dependent_ids, function(id){
-                        var dependent_node = APP.nodes[id];
-                        highlightDependency(this.feature, dependent_node.feature);
-                    }, this);
-
-                    _.each(this.feature.properties.dependency_ids, function(id){
-                        var dependency_node = APP.nodes[id];
-                        highlightDependent(this.feature, dependency_node.feature);
-                    }, this);
-
-                }
-            });
-            return marker;
-        }
-    }).addTo(APP.map);
-}
-
-function showDetails(feature){
+function showDetails(properties){
     // populate node details element
     var mountNode = document.querySelector(".main-controls .node-details");
-    var details_el = createDetailsEl(feature.properties);
+    var details_el = createDetailsEl(properties);
     mountNode.innerHTML = "";
     mountNode.appendChild(details_el);
 }
 
-function highlightDependency(feature, dependency){
-    highlightAnother(feature, dependency, "icon-dependent", "#3399ff");
-}
-
-function highlightDependent(feature, dependent){
-    highlightAnother(feature, dependent, "icon-dependent", "#ff9933");
-}
-
-function highlightAnother(feature, dependency, className, colorCode){
-    // add class to highlight dependency
-    var marker = APP.layers[dependency.properties.type].getLayer(dependency.properties.type + dependency.properties.id);
-    marker._icon.classList.add(className);
-
-    // draw line from this feature to dependency
-    var line = L.geoJSON(turf.lineString([feature.geometry.coordinates, dependency.geometry.coordinates]), {color: colorCode});
-    APP.layers.base_lines.addLayer(line);
-}
-
-function closeDetails(feature){
+function closeDetails(){
     // clear/close details sidebar
     var mountNode = document.querySelector(".main-controls .node-details");
     mountNode.innerHTML = "";
@@ -220,34 +180,36 @@ function updateTypeNav(){
     var sorted_keys = _.keys(APP.activeLayers).sort()
 
     _.each(sorted_keys, function(key){
-        var link_el
-        if ( !_.contains(APP.utilLayerKeys, key) ){
-            link_el = createTypeNavEl({"type": key, "active": APP.activeLayers[key]});
-            nav_el.appendChild(link_el);
-        }
+        var link_el = createTypeNavEl({"type": key, "active": APP.activeLayers[key]});
+        nav_el.appendChild(link_el);
     });
 }
 
 function updateActiveLayers(){
-    // read checkbox status to update map layers
+    // read checkbox status, then fetch node tiles of the checked types only
     _.each(APP.activeLayers, function(was_active, key){
         var checkbox = document.querySelector("#node_type_"+key);
-        var layer = APP.layers[key];
-
         if (checkbox){
-            if(checkbox.checked){
-                if(!was_active){
-                    APP.map.addLayer(layer);
-                }
-            } else {
-                if(was_active){
-                    APP.map.removeLayer(layer);
-                }
-            }
-
             APP.activeLayers[key] = checkbox.checked;
         }
     });
+
+    var types = _.filter(_.keys(APP.activeLayers), function(key){
+        return APP.activeLayers[key];
+    });
+    var layer = APP.layers.nodes;
+    if(types.length === 0){
+        APP.map.removeLayer(layer);
+        return;
+    }
+    var params = {};
+    if(types.length < _.size(APP.activeLayers)){
+        params.type = types.sort().join(",");
+    }
+    layer.setUrl(tileUrl("nodes", params));
+    if(!APP.map.hasLayer(layer)){
+        APP.map.addLayer(layer);
+    }
 }
 
 function createTypeNavEl(props){
@@ -288,6 +250,8 @@ function createDetailsEl(props){
     <a href="/nodes/{{ id }}.html?edit=true" class="button-link">Edit</a>`;
     Mustache.parse(template);
 
+    // tile features leave out null properties
+    props.type = props.type || "unknown";
     props.icon_class = getIconClass(props.type);
     props.type_text = props.type.replace(/_/g," ");
 
@@ -308,21 +272,6 @@ function clear_cache_and_reload(){
 }
 
 
-function cachingFetch(url, options) {
-    // assume localStorage available
-    // - could 'cut the mustard' and fall back to no js for older browsers
-    let cached = localStorage.getItem(url)
-    if (cached !== null) {
-        return Promise.resolve(JSON.parse(cached));
-    }
-    return fetch(url, options).then(function(response){
-        return response.json().then(function(json){
-            localStorage.setItem(url, JSON.stringify(json));
-            return json;
-        });
-    });
-}
-
 function init(){
     var mapEl = document.querySelector("#main-map");
     if(mapEl){
@@ -336,17 +285,9 @@ function init(){
             });
         }
 
-        // TODO handle 404, timeout
-        cachingFetch('/nodes.json?area=uk_southeast')
-        .then(function(json){
-            setupMapNodes(json, APP.map);
-        })
-        .then(function(){
-            cachingFetch('/edges.json')
-            .then(function(json){
-                setupMapEdges(json, APP.map);
-            });
-        });
+        // node types for the checkbox list, as in the lookup table
+        var nav_el = document.querySelector(".main-controls .node-types-nav");
+        setupMapTiles(JSON.parse(nav_el.getAttribute("data-node-types") || "[]"));
 
     }
 }
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Vector tiles (Mapbox Vector Tile format) of nodes and edges
+
+Tiles are encoded by PostGIS with ST_AsMVT, which needs PostGIS 2.4 or later;
+with an older PostGIS, getting a tile raises TilesUnavailable.
+"""
+from __future__ import print_function
+import psycopg2.errorcodes
+
+# half the width of the web mercator (EPSG:3857) world, in metres
+WORLD_HALF_WIDTH = 20037508.342789244
+EXTENT = 4096
+BUFFER = 64
+MAX_ZOOM = 22
+# below this zoom, nodes are clustered on a grid instead of drawn one by one
+CLUSTER_BELOW_ZOOM = 12
+# grid cell size for clustering, in tile pixels
+CLUSTER_CELL_PIXELS = 64
+# below this zoom, edges are simplified to about one tile pixel
+SIMPLIFY_BELOW_ZOOM = 14
+
+class TilesUnavailable(Exception):
+    """Raise when the database cannot encode vector tiles
+    """
+
+def valid_tile(z, x, y):
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+def tile_bounds(z, x, y):
+    """Web mercator bounds (xmin, ymin, xmax, ymax) of a tile in the XYZ
+    scheme (y counts down from the north)
+    """
+    size = 2 * WORLD_HALF_WIDTH / 2 ** z
+    xmin = -WORLD_HALF_WIDTH + x * size
+    ymax = WORLD_HALF_WIDTH - y * size
+    return (xmin, ymax - size, xmin + size, ymax)
+
+def pixel_size(z):
+    """Width of one tile pixel at zoom z, in web mercator metres
+    """
+    return 2 * WORLD_HALF_WIDTH / 2 ** z / EXTENT
+
+def _filters(column_values):
+    """Build SQL conditions and parameters for lists of allowed values
+    """
+    conditions = []
+    params = []
+    for column, values in column_values:
+        if values:
+            conditions.append("{} = ANY(%s)".format(column))
+            params.append(list(values))
+    return conditions, params
+
+def _bounds_sql():
+    """Tile bounds, and the search area with a margin for the buffer
+
+    The search area is a lon/lat geometry, not geography: at low zooms it
+    spans the antimeridian, where a geography envelope would wrap the wrong
+    way. Searches use the GIST index on location::geometry (migration 011).
+    """
+    return """WITH bounds AS (
+        SELECT
+            ST_MakeEnvelope(%s, %s, %s, %s, 3857) AS geom,
+            ST_Transform(ST_MakeEnvelope(%s, %s, %s, %s, 3857), 4326) AS search
+    )"""
+
+def _bounds_params(z, x, y):
+    xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+    margin = BUFFER * pixel_size(z)
+    return [xmin, ymin, xmax, ymax,
+            xmin - margin, ymin - margin, xmax + margin, ymax + margin]
+
+def _fetch_tile(conn, sql, params):
+    with conn.cursor() as cur:
+        try:
+            cur.execute(sql, params)
+        except psycopg2.ProgrammingError as error:
+            if error.pgcode == psycopg2.errorcodes.UNDEFINED_FUNCTION:
+                raise TilesUnavailable("Vector tiles need PostGIS 2.4 or later (ST_AsMVT)")
+            raise
+        return bytes(cur.fetchone()[0])
+
+def get_node_tile(conn, z, x, y, node_types=None, statuses=None):
+    """Encode nodes in a tile as MVT bytes, in a layer named "nodes"
+
+    Below CLUSTER_BELOW_ZOOM, nodes are clustered on a grid and each feature
+    has a `count` and the most common `type` of the nodes in its cell.
+    """
+    conditions, filter_params = _filters((("type", node_types), ("status", statuses)))
+    where = "".join(" AND " + condition for condition in conditions)
+
+    if z < CLUSTER_BELOW_ZOOM:
+        sql = _bounds_sql() + """,
+        points AS (
+            SELECT ST_Transform(n.location::geometry, 3857) AS geom, n.type
+            FROM sos_i_nodes AS n, bounds
+            WHERE n.location::geometry && bounds.search{}
+        ),
+        tile AS (
+            SELECT
+                ST_AsMVTGeom(ST_Centroid(ST_Collect(points.geom)), bounds.geom, %s, %s, true) AS geom,
+                count(*) AS count,
+                mode() WITHIN GROUP (ORDER BY points.type) AS type
+            FROM points, bounds
+            GROUP BY ST_SnapToGrid(points.geom, %s), bounds.geom
+        )
+        SELECT ST_AsMVT(tile, 'nodes', %s, 'geom') FROM tile""".format(where)
+        params = _bounds_params(z, x, y) + filter_params + [
+            EXTENT, BUFFER, CLUSTER_CELL_PIXELS * pixel_size(z), EXTENT]
+    else:
+        sql = _bounds_sql() + """,
+        tile AS (
+            SELECT
+                ST_AsMVTGeom(ST_Transform(n.location::geometry, 3857), bounds.geom, %s, %s, true) AS geom,
+                n.node_id AS id,
+                n.node_name AS name,
+                n.type,
+                n.status::text AS status
+            FROM sos_i_nodes AS n, bounds
+            WHERE n.location::geometry && bounds.search{}
+        )
+        SELECT ST_AsMVT(tile, 'nodes', %s, 'geom') FROM tile""".format(where)
+        params = _bounds_params(z, x, y) + [EXTENT, BUFFER] + filter_params + [EXTENT]
+
+    return _fetch_tile(conn, sql, params)
+
+def get_edge_tile(conn, z, x, y, sectors=None):
+    """Encode edges in a tile as MVT bytes, in a layer named "edges"
+
+    Below SIMPLIFY_BELOW_ZOOM, lines are simplified to about a pixel.
+    """
+    conditions, filter_params = _filters((("sector", sectors), ))
+    where = "".join(" AND " + condition for condition in conditions)
+
+    geom = "ST_Transform(e.location::geometry, 3857)"
+    simplify_params = []
+    if z < SIMPLIFY_BELOW_ZOOM:
+        geom = "ST_Simplify({}, %s)".format(geom)
+        simplify_params = [pixel_size(z)]
+
+    sql = _bounds_sql() + """,
+    tile AS (
+        SELECT
+            ST_AsMVTGeom({}, bounds.geom, %s, %s, true) AS geom,
+            e.edge_id AS id,
+            e.edge_name AS name,
+            e.sector,
+            e.from_node_id,
+            e.to_node_id
+        FROM sos_i_edges AS e, bounds
+        WHERE e.location::geometry && bounds.search{}
+    )
+    SELECT ST_AsMVT(tile, 'edges', %s, 'geom') FROM tile""".format(geom, where)
+    params = _bounds_params(z, x, y) + simplify_params + [EXTENT, BUFFER] + filter_params + [EXTENT]
+
+    return _fetch_tile(conn, sql, params)
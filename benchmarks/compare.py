@@ -0,0 +1,72 @@
+"""Compare two benchmark results files from `benchmarks.run`
+"""
+from __future__ import print_function
+import argparse
+import json
+import sys
+
+
+def load_results(path):
+    """Load a results file as (document, {(benchmark, scale): result})
+    """
+    with open(path) as results_file:
+        document = json.load(results_file)
+    return document, dict(
+        ((result["benchmark"], result["scale"]), result) for result in document["results"])
+
+
+def compare(base, head, threshold=0.1):
+    """Compare median times of benchmarks in both results
+
+    Returns a list of (benchmark, scale, base seconds, head seconds, change)
+    where change is the relative change in time (positive is slower), and
+    the list of those slower by more than `threshold`.
+    """
+    rows = []
+    regressions = []
+    for key in sorted(set(base) & set(head)):
+        base_seconds = base[key]["median"]
+        head_seconds = head[key]["median"]
+        change = (head_seconds - base_seconds) / base_seconds if base_seconds > 0 else 0.0
+        row = (key[0], key[1], base_seconds, head_seconds, change)
+        rows.append(row)
+        if change > threshold:
+            regressions.append(row)
+    return rows, regressions
+
+
+def main():
+    """Show the change in time of each benchmark between two runs:
+
+        python -m benchmarks.compare bench/base.json bench/head.json
+
+    With `--fail`, exits with status 1 if any benchmark is slower by more
+    than `--threshold` (a fraction, default 0.1).
+    """
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown counted as a regression")
+    parser.add_argument("--fail", action="store_true",
+                        help="exit with status 1 on any regression")
+    args = parser.parse_args()
+
+    base_document, base = load_results(args.base)
+    head_document, head = load_results(args.head)
+    print("base: {}\nhead: {}".format(base_document.get("commit"), head_document.get("commit")))
+
+    rows, regressions = compare(base, head, threshold=args.threshold)
+    print("{:<16} {:>9} {:>10} {:>10} {:>8}".format("benchmark", "scale", "base (s)", "head (s)", "change"))
+    for name, scale, base_seconds, head_seconds, change in rows:
+        flag = " !" if change > args.threshold else ""
+        print("{:<16} {:>9} {:>10.3f} {:>10.3f} {:>+7.0%}{}".format(
+            name, scale, base_seconds, head_seconds, change, flag))
+
+    if regressions:
+        print("{} regressions over {:.0%}".format(len(regressions), args.threshold))
+        if args.fail:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+"""Run the benchmark suite against a throwaway PostGIS database
+
+For each scale (number of generated OSM nodes), times:
+
+- import_handler: classifying nodes and loading them with `NodeHandler`
+  and a COPY writer, fed directly with generated nodes
+- import_osm: the same, parsing a generated .osm file with imposm
+- edges_per_node, edges_kdtree, edges_sql: building dependency edges for
+  `synthetic.DEPENDENCIES` with each method (per-node only up to
+  `--per-node-max` nodes, as it runs one query per node)
+- get_nodes, get_edges: loading all nodes or edges into collections
+- nodes_json, edges_json: the whole body of /nodes.json and /edges.json,
+  with the response cache invalidated before each request
+
+Each benchmark runs `--repeat` times, after setup which is not timed (e.g.
+emptying the table being loaded). Results are written as JSON, with the git
+commit, so runs can be compared across commits with `benchmarks.compare`.
+
+The database named by `--database` is created from scratch, migrated, and
+dropped afterwards unless `--keep`; the server and user are taken from the
+APP_PG_* environment variables, as for the app. The user needs permission to
+create databases, and PostGIS must be installed on the server.
+"""
+from __future__ import print_function
+import argparse
+import datetime
+import functools
+import glob
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import timeit
+import psycopg2
+from dotenv import load_dotenv, find_dotenv
+from benchmarks.synthetic import DEPENDENCIES, generate_nodes, write_osm
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+SOURCE_NAME = "synthetic"
+AREA = "synthetic"
+# nodes passed to each NodeHandler callback, as from the parser
+CALLBACK_SIZE = 1000
+
+
+def git_commit():
+    """Get (commit hash, whether the working tree has changes), or (None,
+    None) outside a git checkout
+    """
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"]).decode("utf-8").strip()
+        status = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"])
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def migration_paths():
+    """Up migrations, in order
+    """
+    paths = glob.glob(os.path.join(MIGRATIONS_DIR, "[0-9][0-9][0-9]-*.sql"))
+    return sorted(paths)
+
+
+def create_database(params, database):
+    """Create an empty database with PostGIS, and apply all migrations
+    """
+    admin = psycopg2.connect(**dict(params, database="postgres"))
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute("DROP DATABASE IF EXISTS {}".format(database))
+        cur.execute("CREATE DATABASE {}".format(database))
+    admin.close()
+
+    conn = psycopg2.connect(**dict(params, database=database))
+    with conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+        for path in migration_paths():
+            with open(path) as migration:
+                cur.execute(migration.read())
+        cur.execute("""INSERT INTO sos_lu_data_sources (name, description)
+            VALUES (%s, 'Synthetic network for benchmarks')""", (SOURCE_NAME, ))
+    conn.commit()
+    conn.close()
+
+
+def drop_database(params, database):
+    admin = psycopg2.connect(**dict(params, database="postgres"))
+    admin.autocommit = True
+    with admin.cursor() as cur:
+        cur.execute("DROP DATABASE IF EXISTS {}".format(database))
+    admin.close()
+
+
+def truncate(conn, *tables):
+    with conn.cursor() as cur:
+        cur.execute("TRUNCATE {} RESTART IDENTITY".format(", ".join(tables)))
+    conn.commit()
+
+
+def server_versions(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT version(), postgis_full_version()")
+        postgres, postgis = cur.fetchone()
+    return {"postgres": postgres, "postgis": postgis}
+
+
+class Suite(object):
+    """Benchmarks at one scale, sharing a connection and generated data
+    """
+    def __init__(self, conn, scale, seed, workdir):
+        self.conn = conn
+        self.scale = scale
+        self.nodes = generate_nodes(scale, seed=seed)
+        self.osm_path = os.path.join(workdir, "synthetic_{}.osm".format(scale))
+        write_osm(self.osm_path, self.nodes)
+        self.source_id = self._source_id()
+        self._web_client = None
+
+    def _source_id(self):
+        import app.source
+        return app.source.get_source_by_short_name(self.conn, SOURCE_NAME).id
+
+    def node_handler(self):
+        from data_import.bulk import node_writer
+        from data_import.osm import NodeHandler
+        writer = node_writer(self.conn, commit_each_batch=False)
+        handler = NodeHandler()
+        handler.source(self.source_id)
+        handler.area(AREA)
+        handler.writer(writer)
+        return handler, writer
+
+    def import_handler(self):
+        handler, writer = self.node_handler()
+        for start in range(0, len(self.nodes), CALLBACK_SIZE):
+            handler.nodes(self.nodes[start:start + CALLBACK_SIZE])
+        writer.close()
+        return writer.rows_written
+
+    def import_osm(self):
+        from imposm.parser import OSMParser
+        handler, writer = self.node_handler()
+        OSMParser(nodes_callback=handler.nodes).parse(self.osm_path)
+        writer.close()
+        return writer.rows_written
+
+    def edges_per_node(self):
+        from data_import.depend_on_nearest_of_type import add_edges_between_types
+        for from_type, to_type, sector in DEPENDENCIES:
+            add_edges_between_types(self.conn, from_type, to_type, sector)
+        self.conn.commit()
+        return self.edge_count()
+
+    def edges_kdtree(self):
+        from data_import.nearest import add_edges_between_types_in_memory
+        return sum(add_edges_between_types_in_memory(self.conn, from_type, to_type, sector)
+                   for from_type, to_type, sector in DEPENDENCIES)
+
+    def edges_sql(self):
+        from data_import.depend_on_nearest_of_type import add_edges_to_nearest
+        return sum(add_edges_to_nearest(self.conn, from_type, to_type, sector)
+                   for from_type, to_type, sector in DEPENDENCIES)
+
+    def edge_count(self):
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM sos_i_edges")
+            return cur.fetchone()[0]
+
+    def get_nodes(self):
+        from app.node import get_nodes
+        nodes = get_nodes(self.conn)
+        self.conn.commit()
+        return len(nodes)
+
+    def get_edges(self):
+        from app.edge import get_edges
+        edges = get_edges(self.conn)
+        self.conn.commit()
+        return len(edges)
+
+    def web_client(self):
+        if self._web_client is None:
+            from app import app as web_app
+            self._web_client = web_app.test_client()
+        return self._web_client
+
+    def invalidate_cache(self):
+        from app.cache import invalidate
+        invalidate("nodes")
+        invalidate("edges")
+
+    def get_json(self, url):
+        response = self.web_client().get(url)
+        body = response.get_data()
+        if response.status_code != 200:
+            raise RuntimeError("{} returned {}".format(url, response.status_code))
+        return len(json.loads(body.decode("utf-8"))["features"])
+
+    def nodes_json(self):
+        return self.get_json("/nodes.json")
+
+    def edges_json(self):
+        return self.get_json("/edges.json")
+
+
+def benchmarks(suite, per_node_max):
+    """List of (name, setup, run) for a suite, in the order they run
+
+    Each import or edge builder starts from an empty table. `edges_sql` runs
+    last, and its edges are kept for the read benchmarks.
+    """
+    empty_nodes = functools.partial(truncate, suite.conn, "sos_i_edges", "sos_i_nodes")
+    empty_edges = functools.partial(truncate, suite.conn, "sos_i_edges")
+    listed = [
+        ("import_osm", empty_nodes, suite.import_osm),
+        ("import_handler", empty_nodes, suite.import_handler)
+    ]
+    if suite.scale <= per_node_max:
+        listed.append(("edges_per_node", empty_edges, suite.edges_per_node))
+    listed.extend([
+        ("edges_kdtree", empty_edges, suite.edges_kdtree),
+        ("edges_sql", empty_edges, suite.edges_sql),
+        ("get_nodes", None, suite.get_nodes),
+        ("get_edges", None, suite.get_edges),
+        ("nodes_json", suite.invalidate_cache, suite.nodes_json),
+        ("edges_json", suite.invalidate_cache, suite.edges_json)
+    ])
+    return listed
+
+
+def time_benchmark(setup, run, repeat):
+    """Run a benchmark `repeat` times, returning (seconds of each run,
+    rows handled by the last run)
+    """
+    times = []
+    rows = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = timeit.default_timer()
+        rows = run()
+        times.append(timeit.default_timer() - start)
+    return times, rows
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2.0
+
+
+def result(name, scale, times, rows):
+    seconds = median(times)
+    return {
+        "benchmark": name,
+        "scale": scale,
+        "rows": rows,
+        "times": times,
+        "min": min(times),
+        "median": seconds,
+        "rows_per_second": rows / seconds if rows and seconds > 0 else None
+    }
+
+
+def run_suite(params, database, scales, repeat=3, seed=0, per_node_max=10000, only=None, keep=False):
+    """Run all benchmarks at each scale in a new database, returning the
+    results document
+    """
+    create_database(params, database)
+    # the app, and app.db.connect, read the database from the environment
+    os.environ["APP_PG_DATABASE"] = database
+    import app.db
+    conn = app.db.connect()
+    workdir = tempfile.mkdtemp()
+    commit, dirty = git_commit()
+    document = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": []
+    }
+    document.update(server_versions(conn))
+    try:
+        for scale in scales:
+            suite = Suite(conn, scale, seed, workdir)
+            for name, setup, run in benchmarks(suite, per_node_max):
+                if only and name not in only:
+                    continue
+                try:
+                    times, rows = time_benchmark(setup, run, repeat)
+                except ImportError as error:
+                    print("{} at {}: skipped ({})".format(name, scale, error))
+                    conn.rollback()
+                    continue
+                entry = result(name, scale, times, rows)
+                document["results"].append(entry)
+                print("{} at {}: {:.3f}s median, {} rows".format(name, scale, entry["median"], rows))
+    finally:
+        conn.close()
+        shutil.rmtree(workdir)
+        if not keep:
+            drop_database(params, database)
+    return document
+
+
+def main():
+    """Run the benchmarks and save the results:
+
+        python -m benchmarks.run --scales 1000,10000,100000 --output bench/$(git rev-parse --short HEAD).json
+
+    Then compare two runs with `python -m benchmarks.compare`.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark imports, edge building and reads")
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="comma-separated numbers of OSM nodes to generate")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of timed runs of each benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database", default="nismod_int_benchmark",
+                        help="name of the throwaway database to create (and drop)")
+    parser.add_argument("--keep", action="store_true",
+                        help="keep the database afterwards")
+    parser.add_argument("--per-node-max", type=int, default=10000,
+                        help="largest scale at which to run edges_per_node")
+    parser.add_argument("--only", default=None,
+                        help="comma-separated names of benchmarks to run (include an import, which the others need)")
+    parser.add_argument("--output", default="benchmark.json",
+                        help="path for the JSON results")
+    args = parser.parse_args()
+
+    load_dotenv(find_dotenv())
+    from app.db import connection_params
+    params = connection_params()
+    if args.database == params["database"]:
+        parser.error("--database must not be the app database, it is dropped and recreated")
+
+    document = run_suite(
+        params,
+        args.database,
+        [int(scale) for scale in args.scales.split(",")],
+        repeat=args.repeat,
+        seed=args.seed,
+        per_node_max=args.per_node_max,
+        only=args.only.split(",") if args.only else None,
+        keep=args.keep
+    )
+    with open(args.output, "w") as output_file:
+        json.dump(document, output_file, indent=2)
+    print("Wrote {} results to {}".format(len(document["results"]), args.output))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Synthetic networks for benchmarks
+
+Generates nodes of the types in the classification rules, placed in clusters
+(towns) across a bounding box, as OSM-like (osmid, tags, (lon, lat)) tuples -
+the same form the imposm parser passes to `NodeHandler.nodes`. Only a
+fraction of nodes match a rule, as in a real extract, where most tagged nodes
+are of no interest. The same seed always gives the same network.
+
+Nodes can be written as an .osm XML file for benchmarking the parser too;
+convert it to .pbf with `osmium cat network.osm -o network.osm.pbf` if
+needed.
+
+Dependency edges are generated in the database from `DEPENDENCIES`, by the
+nearest-node edge builders being benchmarked.
+"""
+from __future__ import print_function
+import argparse
+import numpy
+from xml.sax.saxutils import quoteattr
+from data_import.rules import DEFAULT_RULES_PATH, load_rules_data
+
+# Great Britain
+DEFAULT_BBOX = (-5.7, 50.0, 1.8, 58.6)
+
+# relative frequency of each node type
+TYPE_WEIGHTS = {
+    "school": 40,
+    "bank": 30,
+    "hospital": 5,
+    "tower": 15,
+    "waste_water_treatment": 5,
+    "water_treatment": 5
+}
+
+# tags of nodes which match no rule
+UNMATCHED_TAGS = (
+    {"amenity": "bench"},
+    {"highway": "bus_stop"},
+    {"amenity": "post_box"},
+    {"natural": "tree"},
+    {"shop": "convenience"}
+)
+
+# (from type, to type, sector) of edges to build between generated nodes
+DEPENDENCIES = (
+    ("water_treatment", "hospital", "water"),
+    ("water_treatment", "school", "water"),
+    ("waste_water_treatment", "hospital", "water"),
+    ("tower", "bank", "telecoms")
+)
+
+
+def rule_tags(rule):
+    """Tags which match a classification rule
+    """
+    tags = {rule["tag"]: rule["value"]}
+    for tag, predicate in rule.get("require", {}).items():
+        if predicate is True:
+            tags[tag] = "yes"
+        elif isinstance(predicate, list):
+            tags[tag] = predicate[0]
+        elif predicate is not False:
+            tags[tag] = predicate
+    return tags
+
+
+def type_tags(rules_path=DEFAULT_RULES_PATH):
+    """Map each weighted node type to tags which classify as that type
+    """
+    tags = {}
+    for rule in load_rules_data(rules_path).get("nodes", []):
+        if rule["type"] in TYPE_WEIGHTS and rule["type"] not in tags:
+            tags[rule["type"]] = rule_tags(rule)
+    return tags
+
+
+def generate_locations(n, bbox=DEFAULT_BBOX, towns=None, seed=0):
+    """Generate an (n, 2) array of lon/lat points, clustered around `towns`
+    random centres (default: one per 500 points) inside `bbox`
+    """
+    rng = numpy.random.RandomState(seed)
+    min_lon, min_lat, max_lon, max_lat = bbox
+    if towns is None:
+        towns = max(1, n // 500)
+    centres = numpy.column_stack((
+        rng.uniform(min_lon, max_lon, towns),
+        rng.uniform(min_lat, max_lat, towns)))
+    # town sizes follow a power law: a few cities, many villages
+    sizes = rng.pareto(1.2, towns) + 1
+    town = rng.choice(towns, size=n, p=sizes / sizes.sum())
+    spread = 0.02 * numpy.sqrt(sizes[town])
+    points = centres[town] + rng.normal(size=(n, 2)) * spread[:, numpy.newaxis]
+    points[:, 0] = numpy.clip(points[:, 0], min_lon, max_lon)
+    points[:, 1] = numpy.clip(points[:, 1], min_lat, max_lat)
+    return points
+
+
+def generate_nodes(n, match_fraction=0.2, bbox=DEFAULT_BBOX, seed=0, rules_path=DEFAULT_RULES_PATH):
+    """Generate `n` tagged nodes as (osmid, tags, (lon, lat)), of which
+    about `match_fraction` match a classification rule
+    """
+    rng = numpy.random.RandomState(seed + 1)
+    tags_by_type = type_tags(rules_path)
+    types = sorted(tags_by_type)
+    weights = numpy.array([TYPE_WEIGHTS[node_type] for node_type in types], dtype=float)
+
+    locations = generate_locations(n, bbox=bbox, seed=seed)
+    matched = rng.uniform(size=n) < match_fraction
+    type_index = rng.choice(len(types), size=n, p=weights / weights.sum())
+    unmatched_index = rng.randint(len(UNMATCHED_TAGS), size=n)
+
+    nodes = []
+    for i in range(n):
+        if matched[i]:
+            node_type = types[type_index[i]]
+            tags = dict(tags_by_type[node_type])
+            tags["name"] = u"{} {}".format(node_type.replace("_", " ").title(), i + 1)
+        else:
+            tags = dict(UNMATCHED_TAGS[unmatched_index[i]])
+        nodes.append((i + 1, tags, (float(locations[i, 0]), float(locations[i, 1]))))
+    return nodes
+
+
+def write_osm(path, nodes):
+    """Write nodes as an OSM XML file
+    """
+    with open(path, "w") as osm_file:
+        osm_file.write("<?xml version='1.0' encoding='UTF-8'?>\n")
+        osm_file.write('<osm version="0.6" generator="nismod_int benchmarks">\n')
+        for osmid, tags, (lon, lat) in nodes:
+            osm_file.write('  <node id="{}" lat="{:.7f}" lon="{:.7f}" version="1">\n'.format(osmid, lat, lon))
+            for key, value in sorted(tags.items()):
+                osm_file.write('    <tag k={} v={}/>\n'.format(quoteattr(key), quoteattr(value)))
+            osm_file.write('  </node>\n')
+        osm_file.write('</osm>\n')
+
+
+def main():
+    """Write a synthetic network as an OSM file:
+
+        python -m benchmarks.synthetic 100000 synthetic.osm --seed 1
+    """
+    parser = argparse.ArgumentParser(description="Generate a synthetic OSM extract")
+    parser.add_argument("count", type=int)
+    parser.add_argument("path_to_file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--match-fraction", type=float, default=0.2,
+                        help="fraction of nodes which match a classification rule")
+    args = parser.parse_args()
+
+    nodes = generate_nodes(args.count, match_fraction=args.match_fraction, seed=args.seed)
+    write_osm(args.path_to_file, nodes)
+    print("Wrote {} nodes to {}".format(len(nodes), args.path_to_file))
+
+if __name__ == '__main__':
+    main()
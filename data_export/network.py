@@ -0,0 +1,105 @@
+"""Export the network as GeoParquet, Arrow IPC or FlatGeobuf
+
+A command line wrapper around `app.export`, which the web app also serves at
+/export/nodes and /export/edges.
+"""
+from __future__ import print_function
+import argparse
+import os
+from dotenv import load_dotenv, find_dotenv
+import app.db
+from app.export import FORMATS, export
+from data_import.progress import Progress
+
+
+def format_from_path(path):
+    """Guess the export format from a file extension, or None
+    """
+    extension = os.path.splitext(path)[1].lower()
+    for fmt, details in FORMATS.items():
+        if details["extension"] == extension:
+            return fmt
+    if extension in (".feather", ".ipc"):
+        return "arrow"
+    return None
+
+
+def list_arg(value):
+    """Split a comma-separated list, or None
+    """
+    if not value:
+        return None
+    return value.split(",")
+
+
+def main():
+    """Export nodes or edges to a file:
+
+        python -m data_export.network nodes uk_nodes.parquet --area uk
+        python -m data_export.network nodes substations.arrow --type substation --flatten-properties
+        python -m data_export.network edges water_edges.fgb --sector water
+
+    The format is taken from the file extension (.parquet, .arrow, .feather,
+    .fgb) unless given with `--format`. Rows are written in record batches
+    of `--batch-size` rows, fetched from a server-side cursor.
+    """
+    parser = argparse.ArgumentParser(description="Export nodes or edges in a binary columnar format")
+    parser.add_argument("layer", choices=("nodes", "edges"))
+    parser.add_argument("path_to_file")
+    parser.add_argument("--format", choices=sorted(FORMATS), default=None,
+                        help="output format (default: from the file extension)")
+    parser.add_argument("--area", default=None,
+                        help="only nodes in this area")
+    parser.add_argument("--type", default=None,
+                        help="only nodes of these comma-separated types")
+    parser.add_argument("--status", default=None,
+                        help="only nodes with these comma-separated statuses")
+    parser.add_argument("--sector", default=None,
+                        help="only edges in these comma-separated sectors")
+    parser.add_argument("--bbox", default=None,
+                        help="only features within min_lon,min_lat,max_lon,max_lat")
+    parser.add_argument("--flatten-properties", action="store_true",
+                        help="export each node property as its own column")
+    parser.add_argument("--batch-size", type=int, default=50000,
+                        help="number of rows in each record batch")
+    args = parser.parse_args()
+
+    fmt = args.format or format_from_path(args.path_to_file)
+    if fmt is None:
+        parser.error("Could not tell the format from the file extension, use --format")
+    if args.layer == "edges" and (args.flatten_properties or args.area or args.type or args.status):
+        parser.error("--flatten-properties, --area, --type and --status only apply to nodes")
+    if args.layer == "nodes" and args.sector:
+        parser.error("--sector only applies to edges")
+
+    bbox = None
+    if args.bbox is not None:
+        bbox = tuple(float(part) for part in args.bbox.split(","))
+        if len(bbox) != 4:
+            parser.error("--bbox needs four comma-separated numbers")
+
+    if args.layer == "nodes":
+        filters = {
+            "area": args.area,
+            "bbox": bbox,
+            "node_types": list_arg(args.type),
+            "statuses": list_arg(args.status)
+        }
+    else:
+        filters = {
+            "bbox": bbox,
+            "sectors": list_arg(args.sector)
+        }
+
+    load_dotenv(find_dotenv())
+    conn = app.db.connect()
+
+    progress = Progress(args.layer)
+    with open(args.path_to_file, "wb") as out:
+        export(conn, args.layer, fmt, out, filters, flatten_properties=args.flatten_properties,
+               batch_size=args.batch_size, progress=progress)
+    progress.finish()
+    conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+"""Bulk loading into postgres with COPY
+"""
+from __future__ import print_function
+import contextlib
+import io
+import time
+import psycopg2.errorcodes
+
+NODE_COLUMNS = (
+    "ref_key",
+    "node_name",
+    "type",
+    "location",
+    "last_updated",
+    "data_source_id",
+    "area"
+)
+
+# an element of a source matching several rules has one node of each type
+NODE_KEY_COLUMNS = ("data_source_id", "ref_key", "type")
+
+# on re-import, only touch nodes where something from the source changed, so
+# status, function and condition set by users are kept
+NODE_UPDATE_COLUMNS = ("node_name", "location", "last_updated", "area")
+NODE_CHANGED = """(sos_i_nodes.node_name, sos_i_nodes.area)
+    IS DISTINCT FROM (EXCLUDED.node_name, EXCLUDED.area)
+    OR NOT ST_Equals(sos_i_nodes.location::geometry, EXCLUDED.location::geometry)"""
+
+# shown when a plain COPY hits the unique index on nodes (migration 004) or
+# edges (migration 013)
+REIMPORT_HINT = "Nodes or edges from this source are already imported: re-run with --upsert to update them"
+
+
+def is_unique_violation(error):
+    """Whether a database error is a unique violation, e.g. from importing
+    nodes which are already in the database without upsert
+    """
+    return getattr(error, "pgcode", None) == psycopg2.errorcodes.UNIQUE_VIOLATION
+
+
+@contextlib.contextmanager
+def without_change_log(cur, table, layer):
+    """Skip the per-row change log trigger (migration 010) while bulk loading
+    into `table`, and log a single truncate ('T') row for `layer` instead,
+    which clients of /changes.json handle as a full reload
+
+    The trigger is disabled and enabled again within the current transaction,
+    so other connections never see it disabled, though their writes to
+    `table` wait until the transaction commits. If the load fails, rolling
+    back the transaction enables the trigger again.
+    """
+    trigger = "{}_log_change".format(table)
+    cur.execute("ALTER TABLE {} DISABLE TRIGGER {}".format(table, trigger))
+    yield
+    cur.execute("ALTER TABLE {} ENABLE TRIGGER {}".format(table, trigger))
+    cur.execute("INSERT INTO sos_i_changes (layer, operation) VALUES (%s, 'T')", (layer, ))
+
+
+def copy_text_value(value):
+    """Format a python value as a field in postgres COPY text format
+    """
+    if value is None:
+        return "\\N"
+    if not isinstance(value, str):
+        value = str(value)
+    return value.replace("\\", "\\\\") \
+        .replace("\t", "\\t") \
+        .replace("\n", "\\n") \
+        .replace("\r", "\\r")
+
+
+class CopyWriter(object):
+    """Buffer rows and stream them into a table with COPY FROM STDIN
+
+    Rows are tuples with one value per column. Once `batch_size` rows have
+    been added the buffer is flushed to the database. By default each batch
+    is committed in its own transaction; with `commit_each_batch=False` the
+    caller commits once at the end (`close`), so a whole file is loaded in a
+    single transaction.
+
+    With `change_layer` ('nodes' or 'edges'), each batch is copied without
+    writing a change log row per row, and logs one reset row for that layer
+    instead (see `without_change_log`).
+
+    Optionally reports each flush, and the time it took, to a `progress`
+    object (see `data_import.progress.Progress`).
+    """
+    def __init__(self, conn, table, columns, batch_size=10000,
+                 commit_each_batch=True, progress=None, change_layer=None):
+        self._conn = conn
+        self._table = table
+        self._columns = columns
+        self._batch_size = batch_size
+        self._commit_each_batch = commit_each_batch
+        self._progress = progress
+        self._change_layer = change_layer
+        self._rows = []
+        self.rows_written = 0
+
+    def add(self, row):
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_size:
+            self.flush()
+
+    def add_many(self, rows):
+        for row in rows:
+            self.add(row)
+
+    def flush(self):
+        """Send buffered rows to the database
+        """
+        if not self._rows:
+            return
+
+        start = time.time()
+        buf = io.StringIO()
+        for row in self._rows:
+            buf.write(u"\t".join(copy_text_value(value) for value in row))
+            buf.write(u"\n")
+        buf.seek(0)
+
+        with self._conn.cursor() as cur:
+            self._load(cur, buf)
+
+        if self._commit_each_batch:
+            self._conn.commit()
+
+        self.rows_written += len(self._rows)
+        if self._progress is not None:
+            self._progress.written(len(self._rows), time.time() - start)
+        self._rows = []
+
+    def _load(self, cur, buf):
+        sql = "COPY {} ({}) FROM STDIN".format(
+            self._table, ", ".join(self._columns))
+        if self._change_layer is None:
+            cur.copy_expert(sql, buf)
+            return
+        with without_change_log(cur, self._table, self._change_layer):
+            cur.copy_expert(sql, buf)
+
+    def close(self):
+        """Flush any remaining rows and commit
+        """
+        self.flush()
+        self._conn.commit()
+
+
+class UpsertWriter(CopyWriter):
+    """Buffer rows and merge them into a table on a unique key
+
+    Each batch is copied into a temporary staging table, then merged with
+    INSERT ... ON CONFLICT: new keys are inserted, and existing rows are
+    updated only where `update_where` holds (e.g. where some value changed),
+    so unchanged rows keep their other columns as they are. Where a batch
+    has several rows with the same key, the last one added is used.
+
+    The keys of every row merged are kept in the temporary table named by
+    `keys_table`, so the caller can find rows which were not in the input.
+
+    Only rows which are inserted or changed reach the table, so these keep
+    their change log rows and `change_layer` is ignored.
+    """
+    def __init__(self, conn, table, columns, conflict_columns, update_columns,
+                 update_where=None, **kwargs):
+        super(UpsertWriter, self).__init__(conn, table, columns, **kwargs)
+        self._conflict_columns = conflict_columns
+        self._update_columns = update_columns
+        self._update_where = update_where
+        self._staging_table = "staging_{}".format(table)
+        self.keys_table = "staging_{}_keys".format(table)
+        self._created = False
+
+    def _create_staging(self, cur):
+        cur.execute("""CREATE TEMPORARY TABLE IF NOT EXISTS {} AS
+            SELECT {} FROM {} WITH NO DATA""".format(
+                self._staging_table, ", ".join(self._columns), self._table))
+        # numbers rows in the order they are copied
+        cur.execute("ALTER TABLE {} ADD COLUMN seq bigserial".format(self._staging_table))
+        cur.execute("""CREATE TEMPORARY TABLE IF NOT EXISTS {} AS
+            SELECT {} FROM {} WITH NO DATA""".format(
+                self.keys_table, ", ".join(self._conflict_columns), self._table))
+        self._created = True
+
+    def _load(self, cur, buf):
+        if not self._created:
+            self._create_staging(cur)
+
+        cur.copy_expert("COPY {} ({}) FROM STDIN".format(
+            self._staging_table, ", ".join(self._columns)), buf)
+
+        columns = ", ".join(self._columns)
+        keys = ", ".join(self._conflict_columns)
+        sql = """INSERT INTO {table} ({columns})
+            SELECT DISTINCT ON ({keys}) {columns}
+            FROM {staging}
+            ORDER BY {keys}, seq DESC
+            ON CONFLICT ({keys}) DO UPDATE SET {updates}""".format(
+                table=self._table,
+                columns=columns,
+                keys=keys,
+                staging=self._staging_table,
+                updates=", ".join(
+                    "{0} = EXCLUDED.{0}".format(column) for column in self._update_columns))
+        if self._update_where is not None:
+            sql = sql + " WHERE " + self._update_where
+        cur.execute(sql)
+
+        cur.execute("INSERT INTO {} SELECT DISTINCT {} FROM {}".format(
+            self.keys_table, keys, self._staging_table))
+        cur.execute("TRUNCATE {}".format(self._staging_table))
+
+
+def node_writer(conn, upsert=False, **kwargs):
+    """Writer for rows of NODE_COLUMNS into sos_i_nodes
+
+    With `upsert`, merges on (data_source_id, ref_key, type) instead of
+    inserting. Without, inserting a node which is already there is a unique
+    violation (see `is_unique_violation`), and the load is logged as a single
+    reset of the change log rather than one change per node.
+    """
+    if upsert:
+        return UpsertWriter(
+            conn,
+            "sos_i_nodes",
+            NODE_COLUMNS,
+            NODE_KEY_COLUMNS,
+            NODE_UPDATE_COLUMNS,
+            update_where=NODE_CHANGED,
+            **kwargs)
+    return CopyWriter(conn, "sos_i_nodes", NODE_COLUMNS, change_layer="nodes", **kwargs)
+
+
+def retire_nodes(conn, data_source_id, ref_keys, keep=None):
+    """Remove nodes which no longer exist in the source
+
+    Staged nodes are deleted; approved nodes are archived, as they would be
+    through `Node.delete` and `Node.set_status`. Nodes of the (ref_key, type)
+    pairs in `keep` are left, e.g. the types an element still matches.
+    Returns the number of nodes (deleted, archived).
+    """
+    ref_keys = [str(ref_key) for ref_key in ref_keys]
+    keep = keep or []
+    where = """data_source_id = %s
+        AND ref_key = ANY(%s)
+        AND NOT EXISTS (
+            SELECT 1 FROM unnest(%s::text[], %s::text[]) AS k (ref_key, type)
+            WHERE k.ref_key = sos_i_nodes.ref_key AND k.type = sos_i_nodes.type
+        )"""
+    params = (data_source_id, ref_keys,
+              [str(ref_key) for ref_key, _ in keep], [node_type for _, node_type in keep])
+    with conn.cursor() as cur:
+        cur.execute("""DELETE FROM sos_i_nodes
+            WHERE {}
+            AND status = 'staged'""".format(where), params)
+        deleted = cur.rowcount
+        cur.execute("""UPDATE sos_i_nodes
+            SET status = 'archived', last_updated = now()
+            WHERE {}
+            AND status = 'approved'""".format(where), params)
+        archived = cur.rowcount
+    return deleted, archived
+
+
+def retire_missing_nodes(conn, writer, data_source_id, area_short_name):
+    """Retire nodes of a source and area which were not merged by `writer`
+
+    For use after a full import with an `UpsertWriter`, to drop nodes which
+    have been removed from the source since the last import, or whose
+    element no longer matches their type. Does nothing if no rows were
+    written at all, rather than retiring every node.
+    """
+    if writer.rows_written == 0:
+        return 0, 0
+
+    with conn.cursor() as cur:
+        cur.execute("""SELECT DISTINCT ref_key
+            FROM sos_i_nodes AS n
+            WHERE data_source_id = %s
+            AND area = %s
+            AND status IN ('staged', 'approved')
+            AND NOT EXISTS (
+                SELECT 1 FROM {keys} AS k
+                WHERE k.data_source_id = n.data_source_id
+                AND k.ref_key = n.ref_key
+                AND k.type = n.type
+            )""".format(keys=writer.keys_table), (data_source_id, area_short_name))
+        ref_keys = [row[0] for row in cur]
+
+        # types of those elements which are still in the source
+        cur.execute("""SELECT ref_key, type
+            FROM {keys}
+            WHERE data_source_id = %s
+            AND ref_key = ANY(%s)""".format(keys=writer.keys_table), (data_source_id, ref_keys))
+        keep = [tuple(row) for row in cur]
+    return retire_nodes(conn, data_source_id, ref_keys, keep=keep)
+
+
+def refresh_lookups(conn):
+    """Refresh the node type and area lookup tables (migration 008) after
+    loading nodes, and commit
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT sos_refresh_lookups()")
+    conn.commit()
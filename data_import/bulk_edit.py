@@ -0,0 +1,75 @@
+"""Approve, archive or edit nodes in bulk, e.g. after an import
+"""
+from __future__ import print_function
+import argparse
+from dotenv import load_dotenv, find_dotenv
+import app.db
+import app.source
+from app.node import EDITABLE_FIELDS, STATUSES, bulk_edit_nodes
+
+
+def main():
+    """Change status or edit fields of all nodes matching filters:
+
+        python -m data_import.bulk_edit --source osm_extract --area monaco --status approved
+        python -m data_import.bulk_edit --type school --set condition=good
+
+    Status changes follow the same rules as in the app (staged->approved->
+    archived). With `--dry-run`, reports what would change and rolls back.
+    """
+    parser = argparse.ArgumentParser(description="Edit nodes in bulk")
+    parser.add_argument("--area", default=None)
+    parser.add_argument("--source", default=None,
+                        help="data source short name")
+    parser.add_argument("--type", action="append", default=None,
+                        help="node type (repeat for several)")
+    parser.add_argument("--id", type=int, action="append", default=None,
+                        help="node id (repeat for several)")
+    parser.add_argument("--current-status", choices=STATUSES, action="append", default=None,
+                        help="only nodes which currently have this status (repeat for several)")
+    parser.add_argument("--status", choices=STATUSES, default=None,
+                        help="status to change to")
+    parser.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE",
+                        help="field to edit, one of {}".format(", ".join(EDITABLE_FIELDS)))
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    fields = {}
+    for field_value in args.set:
+        field, _, value = field_value.partition("=")
+        fields[field] = value
+
+    load_dotenv(find_dotenv())
+    conn = app.db.connect()
+
+    data_source_id = None
+    if args.source is not None:
+        data_source_id = app.source.get_source_by_short_name(conn, args.source).id
+
+    try:
+        counts = bulk_edit_nodes(
+            conn,
+            area=args.area,
+            data_source_id=data_source_id,
+            node_types=args.type,
+            node_ids=args.id,
+            statuses=args.current_status,
+            status=args.status,
+            fields=fields
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.dry_run:
+        conn.rollback()
+    else:
+        conn.commit()
+    conn.close()
+
+    print("{matched} nodes matched: {updated} updated, {unchanged} unchanged, "
+          "{forbidden} forbidden".format(**counts))
+    if args.dry_run:
+        print("(dry run, no changes saved)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Disk-backed cache of OSM node coordinates
+
+Ways only reference nodes by id, so importing way geometries means looking up
+the coordinates of every referenced node. A country-sized extract has far too
+many nodes to hold in python dicts, so coordinates are kept in a throwaway
+sqlite file instead, with a fixed-size page cache bounding the memory used.
+
+Resolved coordinates of ways which are members of multipolygon relations are
+kept in the same file, so relations can be assembled after the ways pass.
+"""
+from __future__ import print_function
+import array
+import os
+import sqlite3
+
+# sqlite limits the number of host parameters in a single statement
+MAX_PARAMS = 900
+
+
+class CoordCache(object):
+    """Store and look up (lon, lat) by OSM node id
+    """
+    def __init__(self, path, cache_size_mb=256):
+        self.path = path
+        if os.path.exists(path):
+            os.remove(path)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode = OFF")
+        self._db.execute("PRAGMA synchronous = OFF")
+        self._db.execute("PRAGMA cache_size = {}".format(-1024 * cache_size_mb))
+        self._db.execute("""CREATE TABLE coords (
+            id INTEGER PRIMARY KEY,
+            lon REAL,
+            lat REAL
+        )""")
+        self._db.execute("""CREATE TABLE ways (
+            id INTEGER PRIMARY KEY,
+            coords BLOB
+        )""")
+
+    def add_coords(self, coords):
+        """Add a list of (osmid, lon, lat), as passed to a coords callback
+        """
+        self._db.executemany("INSERT OR REPLACE INTO coords VALUES (?, ?, ?)", coords)
+
+    def get_coords(self, refs):
+        """Return the list of (lon, lat) for a list of node ids, skipping any
+        ids which are not in the cache
+        """
+        found = {}
+        unique_refs = list(set(refs))
+        for start in range(0, len(unique_refs), MAX_PARAMS):
+            chunk = unique_refs[start:start + MAX_PARAMS]
+            sql = "SELECT id, lon, lat FROM coords WHERE id IN ({})".format(
+                ",".join("?" * len(chunk)))
+            for osmid, lon, lat in self._db.execute(sql, chunk):
+                found[osmid] = (lon, lat)
+        return [found[ref] for ref in refs if ref in found]
+
+    def add_way(self, osmid, coords):
+        """Keep the resolved coordinates of a way
+        """
+        flat = array.array("d", [value for point in coords for value in point])
+        self._db.execute("INSERT OR REPLACE INTO ways VALUES (?, ?)",
+                         (osmid, sqlite3.Binary(flat.tobytes())))
+
+    def get_way(self, osmid):
+        """Return the list of (lon, lat) for a way, or None if not kept
+        """
+        row = self._db.execute("SELECT coords FROM ways WHERE id = ?", (osmid, )).fetchone()
+        if row is None:
+            return None
+        flat = array.array("d")
+        flat.frombytes(bytes(row[0]))
+        return list(zip(flat[0::2], flat[1::2]))
+
+    def commit(self):
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+        os.remove(self.path)
@@ -1,13 +1,14 @@
 """OpenStreetMap data import
 """
 from __future__ import print_function
-import os
-import sys
-import psycopg2
+import argparse
 from dotenv import load_dotenv, find_dotenv
+import app.db
 from app.edge import Edge
+from data_import.nearest import add_edges_between_types_in_memory
+from data_import.progress import Profiler, Progress, phase
 
-def add_edges_between_types(conn, from_type, to_type, sector):
+def add_edges_between_types(conn, from_type, to_type, sector, progress=None):
     with conn.cursor() as cur:
         # get nodes of to_type
         cur.execute("""SELECT node_id
@@ -19,7 +20,9 @@ def add_edges_between_types(conn, from_type, to_type, sector):
         for node in cur:
             # get nearest node of from_type
             to_node_id = node["node_id"]
-            with conn.cursor() as sub_cur:
+            if progress is not None:
+                progress.parsed(1)
+            with conn.cursor() as sub_cur, phase(progress, "search"):
                 sub_cur.execute("""SELECT from_nodes.node_id as node_id
                 FROM sos_i_nodes as from_nodes, sos_i_nodes as to_nodes
                 WHERE from_nodes.type = %s
@@ -28,17 +31,70 @@ def add_edges_between_types(conn, from_type, to_type, sector):
                 LIMIT 1
                 """,
                 (from_type, to_node_id ))
+                from_nodes = sub_cur.fetchall()
 
-                for from_node in sub_cur:
-                    from_node_id = from_node["node_id"]
+            for from_node in from_nodes:
+                from_node_id = from_node["node_id"]
 
-                    # add edge from->to given sector
-                    e = Edge({
-                        "from_node_id": from_node_id,
-                        "to_node_id": to_node_id,
-                        "sector": sector
-                    })
+                # add edge from->to given sector
+                e = Edge({
+                    "from_node_id": from_node_id,
+                    "to_node_id": to_node_id,
+                    "sector": sector
+                })
+                with phase(progress, "write"):
                     e.save(conn)
+                if progress is not None:
+                    progress.written(1)
+
+def add_edges_to_nearest(conn, from_type, to_type, sector, k=1, max_distance=None):
+    """Add edges to each node of `to_type` from its `k` nearest nodes of
+    `from_type`, optionally only those within `max_distance` metres
+
+    Runs as a single INSERT ... SELECT, with a LATERAL subquery ordered by the
+    `<->` operator so each nearest-neighbour search can use the GIST index on
+    location. Each edge is a straight line between the two nodes. Returns the
+    number of edges added.
+    """
+    distance_filter = ""
+    if max_distance is not None:
+        distance_filter = "AND ST_DWithin(from_nodes.location, to_nodes.location, %(max_distance)s)"
+
+    sql = """INSERT INTO sos_i_edges (
+        sector,
+        from_node_id,
+        to_node_id,
+        last_updated,
+        location
+    )
+    SELECT
+        %(sector)s,
+        nearest.node_id,
+        to_nodes.node_id,
+        now(),
+        ST_MakeLine(nearest.location::geometry, to_nodes.location::geometry)::geography
+    FROM sos_i_nodes AS to_nodes
+    CROSS JOIN LATERAL (
+        SELECT from_nodes.node_id, from_nodes.location
+        FROM sos_i_nodes AS from_nodes
+        WHERE from_nodes.type = %(from_type)s
+        {}
+        ORDER BY from_nodes.location <-> to_nodes.location
+        LIMIT %(k)s
+    ) AS nearest
+    WHERE to_nodes.type = %(to_type)s""".format(distance_filter)
+
+    with conn.cursor() as cur:
+        cur.execute(sql, {
+            "sector": sector,
+            "from_type": from_type,
+            "to_type": to_type,
+            "k": k,
+            "max_distance": max_distance
+        })
+        count = cur.rowcount
+    conn.commit()
+    return count
 
 def main():
     """Initial setup: run this as a script to add edges between
@@ -51,28 +107,64 @@ def main():
 
         python -m data_import.depend_on_nearest_of_type electricity_sink water_tower electricity
 
-    """
-    if len(sys.argv) != 4:
-        print("Usage: python -m data_import.depend_on_nearest_of_type <from_type> <to_type> <sector>")
-        exit()
+    Edges are added in a single statement from the `--k` nearest nodes, and
+    only from nodes within `--max-distance` metres if given. Use
+    `--method per-node` to add edges one node at a time instead.
 
-    from_type = sys.argv[1]
-    to_type = sys.argv[2]
-    sector = sys.argv[3]
+    With `--method kdtree`, nearest nodes are found in memory rather than in
+    the database (see `data_import.nearest`). This also supports
+    `--capacity`: each node then gets a single edge from one of its `--k`
+    nearest nodes that has served fewer than `--capacity` nodes so far.
+
+    Progress is reported to STDERR. With `--profile PATH`, runs under
+    cProfile, with stats written to PATH and a JSON report of counts and
+    wall time per phase (load, search, write) to PATH.json.
+    """
+    parser = argparse.ArgumentParser(description="Add edges from nearest nodes of one type to another")
+    parser.add_argument("from_type")
+    parser.add_argument("to_type")
+    parser.add_argument("sector")
+    parser.add_argument("--k", type=int, default=1,
+                        help="number of nearest nodes to connect each node to")
+    parser.add_argument("--max-distance", type=float, default=None,
+                        help="maximum edge length in metres")
+    parser.add_argument("--method", choices=("sql", "kdtree", "per-node"), default="sql",
+                        help="find nearest nodes in one SQL statement, in memory, or one node at a time")
+    parser.add_argument("--capacity", type=int, default=None,
+                        help="with --method kdtree, maximum number of edges from each node")
+    parser.add_argument("--profile", default=None,
+                        help="profile the run, writing stats to this path and a report to PATH.json")
+    args = parser.parse_args()
+    if args.capacity is not None and args.method != "kdtree":
+        parser.error("--capacity requires --method kdtree")
 
     load_dotenv(find_dotenv())
-    conn = psycopg2.connect(
-        cursor_factory=psycopg2.extras.DictCursor,
-        host=os.environ.get("APP_PG_HOST"),
-        database=os.environ.get("APP_PG_DATABASE"),
-        user=os.environ.get("APP_PG_USER"),
-        password=os.environ.get("APP_PG_PASSWORD"),
-        port=os.environ.get("APP_PG_PORT")
-    )
+    conn = app.db.connect()
 
-    add_edges_between_types(conn, from_type, to_type, sector)
+    profiler = Profiler(args.profile)
+    profiler.start()
+    progress = profiler.track(Progress("edges"))
 
-    conn.close()
+    try:
+        if args.method == "per-node":
+            add_edges_between_types(conn, args.from_type, args.to_type, args.sector,
+                                    progress=progress)
+        elif args.method == "kdtree":
+            count = add_edges_between_types_in_memory(
+                conn, args.from_type, args.to_type, args.sector, k=args.k,
+                max_distance=args.max_distance, capacity=args.capacity, progress=progress)
+            print("Added {} edges".format(count))
+        else:
+            with progress.phase("insert"):
+                count = add_edges_to_nearest(conn, args.from_type, args.to_type, args.sector,
+                                             k=args.k, max_distance=args.max_distance)
+            progress.written(count)
+            print("Added {} edges".format(count))
+    finally:
+        # report and write the profile even if the run failed
+        progress.finish()
+        conn.close()
+        profiler.finish()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,205 @@
+"""Nearest-neighbour dependency edges, computed in memory
+
+An alternative to the SQL in `data_import.depend_on_nearest_of_type` which
+does not depend on the database for the spatial search: node coordinates are
+loaded into NumPy arrays, converted to points on the unit sphere, and all
+nearest-neighbour queries are answered by one batched KD-tree query. The
+straight-line (chord) distance between points on the sphere increases with
+the great-circle distance, so nearest by chord is nearest on the ground.
+
+Edges are then loaded in bulk with COPY.
+"""
+from __future__ import print_function
+import datetime
+import io
+import numpy
+from scipy.spatial import cKDTree
+from data_import.bulk import copy_text_value, without_change_log
+from data_import.progress import phase
+
+EARTH_RADIUS = 6371008.8
+
+
+def load_coords(conn, node_type):
+    """Load (node ids, lon/lat array) for all nodes of a type
+    """
+    with conn.cursor() as cur:
+        sql = cur.mogrify("""COPY (
+            SELECT node_id, ST_X(location::geometry), ST_Y(location::geometry)
+            FROM sos_i_nodes
+            WHERE type = %s
+        ) TO STDOUT WITH CSV""", (node_type, ))
+        buf = io.StringIO()
+        cur.copy_expert(sql.decode("utf-8"), buf)
+
+    buf.seek(0)
+    data = numpy.loadtxt(buf, delimiter=",", ndmin=2)
+    if data.shape[0] == 0:
+        return numpy.zeros(0, dtype=numpy.int64), numpy.zeros((0, 2))
+    return data[:, 0].astype(numpy.int64), data[:, 1:3]
+
+
+def to_unit_vectors(lonlat):
+    """Convert an (n, 2) array of lon/lat degrees to (n, 3) points on the
+    unit sphere
+    """
+    lon = numpy.radians(lonlat[:, 0])
+    lat = numpy.radians(lonlat[:, 1])
+    cos_lat = numpy.cos(lat)
+    return numpy.column_stack((cos_lat * numpy.cos(lon), cos_lat * numpy.sin(lon), numpy.sin(lat)))
+
+
+def metres_to_chord(metres):
+    return 2 * numpy.sin(numpy.asarray(metres) / (2 * EARTH_RADIUS))
+
+
+def chord_to_metres(chord):
+    return 2 * EARTH_RADIUS * numpy.arcsin(numpy.clip(numpy.asarray(chord) / 2, 0, 1))
+
+
+def query_nearest(from_lonlat, to_lonlat, k=1, max_distance=None):
+    """Find the `k` nearest `from` points to each `to` point
+
+    Returns (distances in metres, from indices), both shaped (n_to, k).
+    Missing neighbours (fewer than k within `max_distance`) have infinite
+    distance and an index of len(from_lonlat).
+    """
+    tree = cKDTree(to_unit_vectors(from_lonlat))
+    upper_bound = numpy.inf
+    if max_distance is not None:
+        upper_bound = metres_to_chord(max_distance)
+    chord, index = tree.query(
+        to_unit_vectors(to_lonlat), k=k, distance_upper_bound=upper_bound, workers=-1)
+    chord = chord.reshape(len(to_lonlat), k)
+    index = index.reshape(len(to_lonlat), k)
+    distance = numpy.full(chord.shape, numpy.inf)
+    found = numpy.isfinite(chord)
+    distance[found] = chord_to_metres(chord[found])
+    return distance, index
+
+
+def nearest_pairs(from_lonlat, to_lonlat, k=1, max_distance=None):
+    """Pair each `to` point with its `k` nearest `from` points
+
+    Returns arrays of (from index, to index, distance in metres).
+    """
+    distance, index = query_nearest(from_lonlat, to_lonlat, k=k, max_distance=max_distance)
+    found = numpy.isfinite(distance)
+    to_index = numpy.nonzero(found)[0]
+    return index[found], to_index, distance[found]
+
+
+def capacity_limited_pairs(from_lonlat, to_lonlat, capacity, k=8, max_distance=None):
+    """Assign each `to` point to one of its `k` nearest `from` points, where
+    each `from` point can serve at most `capacity` (a number, or an array
+    with one value per `from` point) `to` points
+
+    Assignment runs in rounds: every unassigned `to` point asks its next
+    nearest candidate, and each `from` point accepts its closest requests up
+    to its remaining capacity. `to` points with no candidate left within `k`
+    stay unassigned.
+
+    Returns arrays of (from index, to index, distance in metres).
+    """
+    n_from = len(from_lonlat)
+    n_to = len(to_lonlat)
+    distance, index = query_nearest(from_lonlat, to_lonlat, k=k, max_distance=max_distance)
+    remaining = numpy.broadcast_to(numpy.asarray(capacity, dtype=numpy.int64), (n_from, )).copy()
+
+    assigned_from = numpy.full(n_to, -1, dtype=numpy.int64)
+    assigned_distance = numpy.full(n_to, numpy.inf)
+    for rank in range(k):
+        unassigned = numpy.nonzero(assigned_from < 0)[0]
+        candidate_distance = distance[unassigned, rank]
+        asking = numpy.isfinite(candidate_distance)
+        to_index = unassigned[asking]
+        if len(to_index) == 0:
+            break
+        from_index = index[to_index, rank]
+        request_distance = candidate_distance[asking]
+
+        # order requests by from point, then distance, and number them
+        # within each from point
+        order = numpy.lexsort((request_distance, from_index))
+        from_sorted = from_index[order]
+        starts = numpy.searchsorted(from_sorted, from_sorted, side="left")
+        position = numpy.arange(len(order)) - starts
+        accepted = order[position < remaining[from_sorted]]
+
+        assigned_from[to_index[accepted]] = from_index[accepted]
+        assigned_distance[to_index[accepted]] = request_distance[accepted]
+        remaining -= numpy.bincount(from_index[accepted], minlength=n_from)
+
+    to_index = numpy.nonzero(assigned_from >= 0)[0]
+    return assigned_from[to_index], to_index, assigned_distance[to_index]
+
+
+def write_edges(conn, sector, from_ids, from_lonlat, to_ids, to_lonlat):
+    """Load edges between pairs of nodes with COPY, as straight lines
+
+    The COPY data is formatted by `numpy.savetxt` rather than row by row.
+    The load is logged as a single reset of the change log.
+    """
+    now = datetime.datetime.now().isoformat()
+    fmt = "{}\t%d\t%d\tLINESTRING(%.8f %.8f, %.8f %.8f)\t{}".format(
+        copy_text_value(sector).replace("%", "%%"), now)
+    data = numpy.column_stack((from_ids, to_ids, from_lonlat, to_lonlat))
+
+    buf = io.StringIO()
+    numpy.savetxt(buf, data, fmt=fmt)
+    buf.seek(0)
+    with conn.cursor() as cur, without_change_log(cur, "sos_i_edges", "edges"):
+        cur.copy_expert("""COPY sos_i_edges (
+            sector,
+            from_node_id,
+            to_node_id,
+            location,
+            last_updated
+        ) FROM STDIN""", buf)
+    conn.commit()
+    return len(data)
+
+
+def add_edges_between_types_in_memory(conn, from_type, to_type, sector, k=1,
+                                      max_distance=None, capacity=None, progress=None):
+    """Add edges to each node of `to_type` from its nearest nodes of
+    `from_type`
+
+    With `capacity`, each node of `to_type` gets a single edge, from one of
+    its `k` nearest nodes which still has capacity. Returns the number of
+    edges added.
+
+    Given a `Progress`, counts nodes loaded and edges matched and written,
+    and times the load, search and write phases.
+    """
+    with phase(progress, "load"):
+        from_ids, from_lonlat = load_coords(conn, from_type)
+        to_ids, to_lonlat = load_coords(conn, to_type)
+    if progress is not None:
+        progress.parsed(len(from_ids) + len(to_ids))
+    if len(from_ids) == 0 or len(to_ids) == 0:
+        return 0
+
+    k = min(k, len(from_ids))
+    with phase(progress, "search"):
+        if capacity is not None:
+            from_index, to_index, _ = capacity_limited_pairs(
+                from_lonlat, to_lonlat, capacity, k=k, max_distance=max_distance)
+        else:
+            from_index, to_index, _ = nearest_pairs(
+                from_lonlat, to_lonlat, k=k, max_distance=max_distance)
+    if progress is not None:
+        progress.matched(len(to_index))
+
+    with phase(progress, "write"):
+        count = write_edges(
+            conn,
+            sector,
+            from_ids[from_index],
+            from_lonlat[from_index],
+            to_ids[to_index],
+            to_lonlat[to_index]
+        )
+    if progress is not None:
+        progress.written(count)
+    return count
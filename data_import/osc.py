@@ -0,0 +1,159 @@
+"""OpenStreetMap change file (.osc) import
+
+Applies an OSM change file to nodes already imported from the same data
+source, for example a Geofabrik daily diff:
+
+- created and modified nodes which match the rules are upserted on
+  (data_source_id, ref_key, type), so unchanged nodes keep their status
+- deleted nodes, and modified nodes which no longer match the rules (or
+  some of their types), are deleted if staged or archived if approved
+
+A node changed several times in the file ends up as its last version.
+"""
+from __future__ import print_function
+import argparse
+import gzip
+import psycopg2
+import xml.etree.ElementTree as ET
+from dotenv import load_dotenv, find_dotenv
+import app.source
+from app.db import connection_params
+from data_import.bulk import node_writer, refresh_lookups, retire_nodes
+from data_import.osm import NodeHandler
+from data_import.progress import Progress
+from data_import.rules import DEFAULT_RULES_PATH, load_rules
+
+ACTIONS = ("create", "modify", "delete")
+
+
+def iter_node_changes(path):
+    """Stream (action, osmid, tags, (lon, lat)) for each node in a change file
+
+    Ways and relations are skipped. Deleted nodes may have no location, in
+    which case it is None.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as osc_file:
+        action = None
+        for event, elem in ET.iterparse(osc_file, events=("start", "end")):
+            if event == "start":
+                if elem.tag in ACTIONS:
+                    action = elem.tag
+                continue
+
+            if elem.tag == "node" and action is not None:
+                tags = dict(
+                    (tag.get("k"), tag.get("v")) for tag in elem.iter("tag"))
+                if elem.get("lon") is not None:
+                    location = (float(elem.get("lon")), float(elem.get("lat")))
+                else:
+                    location = None
+                yield action, int(elem.get("id")), tags, location
+
+            if elem.tag in ("node", "way", "relation"):
+                elem.clear()
+            elif elem.tag in ACTIONS:
+                action = None
+
+
+class ChangeHandler(object):
+    """Apply node changes through a NodeHandler with an upserting writer
+
+    Changes are collected until `batch_size` nodes have changed, keeping
+    only the last change to each node, so a node ends up as its final
+    version in the file. Nodes which then match the rules are upserted,
+    with any types they no longer match retired; deleted and unmatched
+    nodes are retired.
+    """
+    def __init__(self, conn, node_handler, writer, rules, data_source_id, batch_size=10000):
+        self._conn = conn
+        self._node_handler = node_handler
+        self._writer = writer
+        self._rules = rules
+        self._data_source_id = data_source_id
+        self._batch_size = batch_size
+        self._pending = {}
+        self.deleted = 0
+        self.archived = 0
+
+    def changes(self, changes):
+        for action, osmid, tags, location in changes:
+            self._pending[osmid] = (action, tags, location)
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+
+    def flush(self):
+        matched = []
+        keep = []
+        for osmid, (action, tags, location) in self._pending.items():
+            if action == "delete":
+                continue
+            node_types = self._rules.classify(tags)
+            if node_types:
+                matched.append((osmid, tags, location))
+                keep.extend((osmid, node_type) for node_type in node_types)
+
+        if matched:
+            self._node_handler.nodes(matched)
+        self._writer.flush()
+        if self._pending:
+            deleted, archived = retire_nodes(
+                self._conn, self._data_source_id, list(self._pending), keep=keep)
+            self.deleted += deleted
+            self.archived += archived
+        self._pending = {}
+
+
+def main():
+    """Apply an OSM change file to nodes imported by `data_import.osm`:
+
+        python -m data_import.osc ./monaco-update.osc.gz osm_extract monaco
+
+    Requires the unique index on (data_source_id, ref_key, type) from migration 004.
+    """
+    parser = argparse.ArgumentParser(description="Apply an OpenStreetMap change file")
+    parser.add_argument("path_to_file")
+    parser.add_argument("data_source_short_name")
+    parser.add_argument("area_short_name")
+    parser.add_argument("--rules", default=DEFAULT_RULES_PATH,
+                        help="JSON or YAML file of tag classification rules")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="number of rows to merge at a time")
+    args = parser.parse_args()
+
+    load_dotenv(find_dotenv())
+    conn = psycopg2.connect(**connection_params())
+
+    source = app.source.get_source_by_short_name(conn, args.data_source_short_name)
+    rules = load_rules(args.rules)
+
+    progress = Progress("nodes")
+    writer = node_writer(
+        conn,
+        upsert=True,
+        batch_size=args.batch_size,
+        commit_each_batch=False,
+        progress=progress
+    )
+
+    node_handler = NodeHandler()
+    node_handler.rules(rules)
+    node_handler.source(source.id)
+    node_handler.area(args.area_short_name)
+    node_handler.writer(writer)
+
+    change_handler = ChangeHandler(conn, node_handler, writer, rules, source.id,
+                                   batch_size=args.batch_size)
+    change_handler.changes(iter_node_changes(args.path_to_file))
+    change_handler.flush()
+
+    # whole change file in one transaction
+    writer.close()
+    progress.finish()
+    refresh_lookups(conn)
+    print("{} nodes deleted, {} archived".format(
+        change_handler.deleted, change_handler.archived))
+    conn.close()
+
+if __name__ == '__main__':
+    main()
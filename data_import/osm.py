@@ -1,72 +1,108 @@
 """OpenStreetMap data import
 """
 from __future__ import print_function
+import argparse
 import datetime
-import os
 import sys
+import time
 import psycopg2
 from dotenv import load_dotenv, find_dotenv
 from imposm.parser import OSMParser
 import app.source
+from app.db import connection_params
+from data_import.bulk import (
+    REIMPORT_HINT, is_unique_violation, node_writer, refresh_lookups, retire_missing_nodes)
+from data_import.pipeline import run_pipeline
+from data_import.progress import Profiler, Progress
+from data_import.rules import DEFAULT_RULES_PATH, load_rules
+from data_import.ways import WayHandler, edge_writer, import_ways, retire_missing_edges
+from data_import.coords import CoordCache
 
 class NodeHandler(object):
     """Handle the parsed OSM data
 
     Holds a database connection and inserts each item to the database.
+    Given a `CopyWriter`, buffers rows and loads them in bulk instead.
     Otherwise outputs parsed matching nodes to STDOUT.
+
+    Nodes are classified by a `RuleSet`, by default loaded from
+    `data_import/rules/osm.json`.
+
+    Given a `Progress`, counts nodes parsed and matched, and adds up time
+    spent classifying and, between callbacks, parsing.
     """
     def __init__(self):
         self._conn = None
+        self._writer = None
+        self._rules = load_rules()
         self._data_source_id = None
         self._area_short_name = None
+        self._progress = None
+        self._last_callback = None
 
     def connection(self, conn):
         self._conn = conn
 
+    def writer(self, copy_writer):
+        self._writer = copy_writer
+
+    def rules(self, rule_set):
+        self._rules = rule_set
+
     def source(self, source_id):
         self._data_source_id = source_id
 
     def area(self, area_short_name):
         self._area_short_name = area_short_name
 
+    def progress(self, progress):
+        self._progress = progress
+        self._last_callback = time.time()
+
     def nodes(self, nodes):
+        start = time.time()
+        classify_seconds = 0
+        matched = 0
         for osmid, tags, location in nodes:
             if 'name' in tags:
                 name = tags['name']
             else:
                 name = ""
 
-            if 'amenity' in tags:
-                amenity_type = tags['amenity']
-
-                if amenity_type == 'bank':
-                    self._save_node(osmid, amenity_type, name, location)
+            classify_start = time.time()
+            node_types = self._rules.classify(tags)
+            classify_seconds += time.time() - classify_start
 
-                elif amenity_type == 'school':
-                    self._save_node(osmid, amenity_type, name, location)
+            if node_types:
+                matched += 1
+            for node_type in node_types:
+                self._save_node(osmid, node_type, name, location)
 
-                elif amenity_type == 'hospital':
-                    self._save_node(osmid, amenity_type, name, location)
-
-            if 'man_made' in tags:
-                man_made_type = tags['man_made']
-
-                if man_made_type == 'tower':
-                    if 'tower:type' in tags and tags['tower:type'] == 'communication':
-                        self._save_node(osmid, man_made_type, name, location)
-
-                elif man_made_type == 'wastewater_plant':
-                    self._save_node(osmid, "waste_water_treatment", name, location)
-
-                elif man_made_type == 'water_works':
-                    self._save_node(osmid, "water_treatment", name, location)
+        if self._progress is not None:
+            # time outside callbacks is spent in the parser
+            self._progress.add_time("parse", start - self._last_callback)
+            self._progress.add_time("classify", classify_seconds)
+            self._progress.parsed(len(nodes))
+            self._progress.matched(matched)
+            self._last_callback = time.time()
 
     def _save_node(self, node_id, node_type, name, location):
         """Output node details
         """
         point = self.location_as_wkt(location)
 
-        if self._conn is not None:
+        if self._writer is not None:
+            # buffer for bulk load
+            self._writer.add((
+                node_id,
+                name,
+                node_type,
+                point,
+                datetime.datetime.now().isoformat(),
+                self._data_source_id,
+                self._area_short_name
+            ))
+        elif self._conn is not None:
             # save to databases
             cur = self._conn.cursor()
             cur.execute("""INSERT INTO sos_i_nodes
@@ -111,37 +147,167 @@ def main():
     """Initial setup: run this as a script to import osm.pbf to postgres,
     for example, with monaco downloaded from Geofabrik:
 
-        python -m app.osm ./monaco-latest.osm.pbf osm_extract monaco
+        python -m data_import.osm ./monaco-latest.osm.pbf osm_extract monaco
+
+    Nodes are loaded with COPY in batches of `--batch-size` rows. Each batch
+    is committed as it is written, or with `--commit-per file` the whole
+    import is a single transaction.
+
+    With `--workers N`, runs as a pipeline: N parser processes classify tags
+    and a single writer process loads rows, fed through a queue holding at
+    most `--queue-depth` batches (see `data_import.pipeline`).
+
+    With `--ways`, also imports ways and multipolygon relations: lines as
+    edges, and areas as nodes at their centroid (see `data_import.ways`).
+    Node coordinates are cached on disk at `--coords-cache` while importing.
+
+    With `--upsert`, nodes are merged on (data_source_id, ref_key, type), and
+    edges from ways on (data_source_id, ref_key), so that re-importing an
+    extract updates them in place and keeps node status; `--delete-missing`
+    then also retires nodes and edges from this source and area which are no
+    longer in the extract, or nodes no longer of their type. Without
+    `--upsert`, importing nodes or edges already in the database fails. To
+    apply daily change files instead of a full extract, see
+    `data_import.osc`.
+
+    Progress is reported to STDERR: nodes parsed, matched and written, rows
+    per second, how much of the file has been read with an ETA, and, with
+    `--workers`, the depth of the row queue. With `--profile PATH`, the
+    import runs under cProfile, with stats written to PATH and a JSON report
+    of counts and wall time per phase (parse, classify, write and, with
+    `--workers`, queue_wait) to PATH.json (see `data_import.progress`).
 
     Possible enhancement: set up nismod_int as a package that exposes an
     `import` command
     """
-    if len(sys.argv) != 4:
-        print("Usage: python osm.py <path_to_file> <data_source_short_name> <area_short_name>")
-        exit()
-
-    path_to_file = sys.argv[1]
-    data_source_short_name = sys.argv[2]
-    area_short_name = sys.argv[3]
+    parser = argparse.ArgumentParser(description="Import OpenStreetMap nodes to postgres")
+    parser.add_argument("path_to_file")
+    parser.add_argument("data_source_short_name")
+    parser.add_argument("area_short_name")
+    parser.add_argument("--rules", default=DEFAULT_RULES_PATH,
+                        help="JSON or YAML file of tag classification rules")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="number of rows to send in each COPY")
+    parser.add_argument("--commit-per", choices=("batch", "file"), default="batch",
+                        help="commit after each batch, or once for the whole file")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="run as a pipeline with this many parser processes (0 to write from the parser callback)")
+    parser.add_argument("--queue-depth", type=int, default=64,
+                        help="maximum number of row batches waiting for the writer")
+    parser.add_argument("--ways", action="store_true",
+                        help="also import ways and relations as edges and polygon nodes")
+    parser.add_argument("--coords-cache", default="osm_coords.sqlite",
+                        help="path for the temporary node coordinate cache")
+    parser.add_argument("--cache-size-mb", type=int, default=256,
+                        help="memory for the node coordinate cache")
+    parser.add_argument("--upsert", action="store_true",
+                        help="update existing nodes and edges with the same ref_key instead of inserting")
+    parser.add_argument("--delete-missing", action="store_true",
+                        help="with --upsert, retire nodes and edges of this source and area not in the file")
+    parser.add_argument("--profile", default=None,
+                        help="profile the import, writing stats to this path and a report to PATH.json")
+    args = parser.parse_args()
+    if args.ways and args.workers > 0:
+        parser.error("--ways cannot be combined with --workers")
+    if args.delete_missing and (not args.upsert or args.workers > 0):
+        parser.error("--delete-missing requires --upsert, without --workers")
 
     load_dotenv(find_dotenv())
-    conn = psycopg2.connect(
-        host=os.environ.get("APP_PG_HOST"),
-        database=os.environ.get("APP_PG_DATABASE"),
-        user=os.environ.get("APP_PG_USER"),
-        password=os.environ.get("APP_PG_PASSWORD"),
-        port=os.environ.get("APP_PG_PORT")
-    )
+    params = connection_params()
+    conn = psycopg2.connect(**params)
+
+    source = app.source.get_source_by_short_name(conn, args.data_source_short_name)
+    rules = load_rules(args.rules)
 
-    source = app.source.get_source_by_short_name(conn, data_source_short_name)
+    profiler = Profiler(args.profile)
+    profiler.start()
+    progress = profiler.track(Progress("nodes", path=args.path_to_file))
+    try:
+        run_import(args, params, conn, source, rules, progress, profiler)
+    except psycopg2.IntegrityError as error:
+        if not is_unique_violation(error):
+            raise
+        sys.exit("{}\n{}".format(str(error).strip(), REIMPORT_HINT))
+    finally:
+        # report and write the profile even if the import failed
+        progress.finish()
+        profiler.finish()
+
+def run_import(args, params, conn, source, rules, progress, profiler):
+    """Import nodes, and ways if asked, as set up by `main`
+    """
+    if args.workers > 0:
+        conn.close()
+        writer_summary = run_pipeline(
+            args.path_to_file,
+            rules.classify,
+            params,
+            source.id,
+            args.area_short_name,
+            workers=args.workers,
+            queue_depth=args.queue_depth,
+            batch_size=args.batch_size,
+            commit_each_batch=(args.commit_per == "batch"),
+            upsert=args.upsert,
+            progress=progress
+        )
+        profiler.add_summary(writer_summary)
+        conn = psycopg2.connect(**params)
+        refresh_lookups(conn)
+        conn.close()
+        return
+
+    writer = node_writer(
+        conn,
+        upsert=args.upsert,
+        batch_size=args.batch_size,
+        commit_each_batch=(args.commit_per == "batch"),
+        progress=progress
+    )
 
     node_handler = NodeHandler()
+    node_handler.rules(rules)
     node_handler.source(source.id)
-    node_handler.area(area_short_name)
+    node_handler.area(args.area_short_name)
     node_handler.connection(conn)
+    node_handler.writer(writer)
+    node_handler.progress(progress)
+
+    if args.ways:
+        edge_progress = profiler.track(Progress("edges"))
+        edges = edge_writer(
+            conn,
+            upsert=args.upsert,
+            batch_size=args.batch_size,
+            commit_each_batch=(args.commit_per == "batch"),
+            progress=edge_progress
+        )
+        coord_cache = CoordCache(args.coords_cache, cache_size_mb=args.cache_size_mb)
+        way_handler = WayHandler(load_rules(args.rules, kind="ways"), coord_cache)
+        way_handler.writers(edges, writer)
+        way_handler.source(source.id)
+        way_handler.area(args.area_short_name)
+        try:
+            import_ways(args.path_to_file, way_handler, nodes_callback=node_handler.nodes)
+        finally:
+            coord_cache.close()
+            edge_progress.finish()
+        edges.flush()
+        if args.delete_missing:
+            deleted = retire_missing_edges(conn, edges, source.id, args.area_short_name)
+            print("{} missing edges deleted".format(deleted))
+        edges.close()
+    else:
+        p = OSMParser(nodes_callback=node_handler.nodes)
+        p.parse(args.path_to_file)
 
-    p = OSMParser(nodes_callback=node_handler.nodes)
-    p.parse(path_to_file)
+    writer.flush()
+    if args.delete_missing:
+        deleted, archived = retire_missing_nodes(
+            conn, writer, source.id, args.area_short_name)
+        print("{} missing nodes deleted, {} archived".format(deleted, archived))
+    writer.close()
+    refresh_lookups(conn)
     conn.close()
 
 if __name__ == '__main__':
@@ -0,0 +1,201 @@
+"""Multi-process OSM import pipeline
+
+The imposm parser already reads the .pbf with a pool of worker processes, but
+every callback runs in the main process. To spread the work out:
+
+- tag classification runs in the parser workers, as a tag filter which
+  rewrites matching tags to a compact form and drops everything else
+- the main process turns parsed nodes into compact row tuples and sends
+  one batch per callback through a bounded queue
+- a single writer process owns the database connection and loads the rows
+  with COPY
+
+The queue is bounded, so when the writer falls behind the main process
+blocks on `put`, stops draining the parser, and the parser workers stall in
+turn. Time the main process spends blocked on the full queue is reported
+as the "queue_wait" phase: if it is large, the import is bound by the
+database rather than by parsing.
+"""
+from __future__ import print_function
+import datetime
+import multiprocessing
+import sys
+import time
+import psycopg2
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+from data_import.bulk import REIMPORT_HINT, is_unique_violation, node_writer
+from data_import.progress import Progress
+
+TYPES_TAG = "nismod:types"
+TYPES_SEPARATOR = ";"
+
+
+class ClassifyingTagFilter(object):
+    """Tag filter to classify nodes inside the parser workers
+
+    Matching tags are replaced in place by the node name and the list of
+    node types; non-matching tags are cleared so the node is not passed on
+    to the nodes callback at all.
+    """
+    def __init__(self, classify):
+        self._classify = classify
+
+    def __call__(self, tags):
+        node_types = self._classify(tags)
+        name = tags.get('name', "")
+        tags.clear()
+        if node_types:
+            tags['name'] = name
+            tags[TYPES_TAG] = TYPES_SEPARATOR.join(node_types)
+
+
+class QueueNodeHandler(object):
+    """Send classified nodes to the writer process in batches
+
+    Each row is a compact tuple of (osmid, name, node_type, lon, lat).
+    Optionally counts nodes parsed and matched in a `progress`, with the time
+    spent waiting for space on the queue. Only nodes with tags left by the
+    tag filter reach the handler, so fewer are counted as parsed than with a
+    single process.
+    """
+    def __init__(self, row_queue, writer_process, put_timeout=1.0, progress=None):
+        self._queue = row_queue
+        self._writer_process = writer_process
+        self._put_timeout = put_timeout
+        self._progress = progress
+
+    def nodes(self, nodes):
+        batch = []
+        matched = 0
+        for osmid, tags, location in nodes:
+            if TYPES_TAG not in tags:
+                continue
+            matched += 1
+            name = tags.get('name', "")
+            for node_type in tags[TYPES_TAG].split(TYPES_SEPARATOR):
+                batch.append((osmid, name, node_type, location[0], location[1]))
+        if batch:
+            start = time.time()
+            self.put(batch)
+            if self._progress is not None:
+                self._progress.add_time("queue_wait", time.time() - start)
+        if self._progress is not None:
+            self._progress.parsed(len(nodes))
+            self._progress.matched(matched)
+
+    def put(self, batch):
+        """Put a batch on the queue, blocking while the queue is full
+        """
+        while True:
+            try:
+                self._queue.put(batch, timeout=self._put_timeout)
+                return
+            except queue.Full:
+                if not self._writer_process.is_alive():
+                    raise RuntimeError("Writer process exited while the import was running")
+
+
+def stop_writer(handler, writer_process):
+    """Tell the writer process there are no more rows, and wait for it
+
+    The end of rows is not sent if the writer has already exited, so that
+    an error from the parser is raised rather than one from the queue; the
+    caller checks the writer's exit code.
+    """
+    if writer_process.is_alive():
+        try:
+            handler.put(None)
+        except RuntimeError as error:
+            print(error, file=sys.stderr)
+    writer_process.join()
+
+
+def location_as_wkt(lon, lat):
+    return "POINT({} {})".format(round(lon, 8), round(lat, 8))
+
+
+def write_rows(row_queue, connection_params, upsert, data_source_id,
+               area_short_name, batch_size, commit_each_batch, summary_queue=None):
+    """Writer process: load row batches from the queue until a None arrives
+
+    Puts the summary of its progress on `summary_queue` when done.
+    """
+    conn = psycopg2.connect(**connection_params)
+    progress = Progress("nodes")
+    writer = node_writer(
+        conn,
+        upsert=upsert,
+        batch_size=batch_size,
+        commit_each_batch=commit_each_batch,
+        progress=progress
+    )
+    try:
+        while True:
+            batch = row_queue.get()
+            if batch is None:
+                break
+            now = datetime.datetime.now().isoformat()
+            for osmid, name, node_type, lon, lat in batch:
+                writer.add((
+                    osmid,
+                    name,
+                    node_type,
+                    location_as_wkt(lon, lat),
+                    now,
+                    data_source_id,
+                    area_short_name
+                ))
+        writer.close()
+        progress.finish()
+        if summary_queue is not None:
+            summary_queue.put(progress.summary())
+    except psycopg2.IntegrityError as error:
+        if is_unique_violation(error):
+            print(REIMPORT_HINT, file=sys.stderr)
+        raise
+    finally:
+        conn.close()
+
+
+def run_pipeline(path_to_file, classify, connection_params, data_source_id,
+                 area_short_name, workers=None, queue_depth=64, batch_size=10000,
+                 commit_each_batch=True, upsert=False, progress=None):
+    """Parse `path_to_file` with `workers` parser processes and load the
+    matching nodes through a single writer process
+
+    Nodes parsed and matched are counted in `progress`, if given, which also reports
+    the depth of the row queue. Returns the summary of the writer process's
+    progress (see `Progress.summary`).
+    """
+    # imported here so the rest of the module can be used without imposm
+    from imposm.parser import OSMParser
+
+    row_queue = multiprocessing.Queue(maxsize=queue_depth)
+    summary_queue = multiprocessing.Queue()
+    writer_process = multiprocessing.Process(
+        target=write_rows,
+        args=(row_queue, connection_params, upsert, data_source_id,
+              area_short_name, batch_size, commit_each_batch, summary_queue)
+    )
+    writer_process.start()
+    if progress is not None:
+        progress.watch_queue("rows", row_queue)
+
+    handler = QueueNodeHandler(row_queue, writer_process, progress=progress)
+    parser = OSMParser(
+        concurrency=workers,
+        nodes_callback=handler.nodes,
+        nodes_tag_filter=ClassifyingTagFilter(classify)
+    )
+    try:
+        parser.parse(path_to_file)
+    finally:
+        stop_writer(handler, writer_process)
+
+    if writer_process.exitcode != 0:
+        raise RuntimeError("Writer process failed with exit code {}".format(
+            writer_process.exitcode))
+    return summary_queue.get()
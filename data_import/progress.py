@@ -0,0 +1,272 @@
+"""Progress reporting and profiling for long-running imports
+
+`Progress` counts rows through the stages of an import - parsed, matched
+and written - and reports throughput, how far through the input file the
+import has read with an ETA, and the depth of any queues between processes.
+It also adds up wall time spent in named phases (e.g. classify, write), to
+show whether an import is bound by tag handling or by the database.
+
+`Profiler` runs an import under cProfile, and writes the stats along with a
+JSON report of counts, rates and phase times.
+"""
+from __future__ import print_function
+import cProfile
+import json
+import multiprocessing
+import os
+import pstats
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+STAGES = ("parsed", "matched", "written")
+
+
+def file_offset(path):
+    """Find the furthest offset to which this process or any of its child
+    processes has read `path`, or None where that cannot be found
+
+    Reads file positions from /proc, so only works on Linux. Covers parser
+    worker processes which open the input file themselves.
+    """
+    target = os.path.realpath(path)
+    pids = [os.getpid()] + [child.pid for child in multiprocessing.active_children()]
+    offset = None
+    for pid in pids:
+        fd_dir = "/proc/{}/fd".format(pid)
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                if os.readlink(os.path.join(fd_dir, fd)) != target:
+                    continue
+                with open("/proc/{}/fdinfo/{}".format(pid, fd)) as fdinfo:
+                    for line in fdinfo:
+                        if line.startswith("pos:"):
+                            offset = max(offset or 0, int(line.split()[1]))
+            except (OSError, ValueError):
+                continue
+    return offset
+
+
+class Progress(object):
+    """Count rows through each stage of an import and report throughput as
+    rows per second
+
+    Reports are written to `out` (STDERR by default) at most once every
+    `interval` seconds, and once more on `finish`. Only the stages which are
+    counted appear in reports; the rate is of the last stage counted.
+
+    Given the `path` of the input file, reports how much of the file has been
+    read and estimate the time remaining (see `file_offset`). Queues added
+    with `watch_queue` have their current size reported.
+    """
+    def __init__(self, label="rows", interval=5.0, out=None, path=None):
+        self.label = label
+        self.interval = interval
+        self.out = out if out is not None else sys.stderr
+        self.counts = OrderedDict()
+        self.phases = OrderedDict()
+        self.queues = OrderedDict()
+        self._path = path
+        self._size = os.path.getsize(path) if path is not None else None
+        self._start = time.time()
+        self._last_report = self._start
+
+    @property
+    def count(self):
+        """Number of rows written
+        """
+        return self.counts.get("written", 0)
+
+    def parsed(self, n):
+        self._add("parsed", n)
+
+    def matched(self, n):
+        self._add("matched", n)
+
+    def written(self, n, seconds=None):
+        """Count rows written, optionally adding the time taken to write
+        them to the "write" phase
+        """
+        if seconds is not None:
+            self.add_time("write", seconds)
+        self._add("written", n)
+
+    def _add(self, stage, n):
+        self.counts[stage] = self.counts.get(stage, 0) + n
+        now = time.time()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report(now)
+
+    def add_time(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+    @contextmanager
+    def phase(self, phase):
+        """Add the wall time spent in a block to a phase
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.time() - start)
+
+    def watch_queue(self, name, queue):
+        """Report the size of a queue, which has a `qsize` method
+        """
+        self.queues[name] = queue
+
+    def elapsed(self, now=None):
+        if now is None:
+            now = time.time()
+        return now - self._start
+
+    def rate(self, now=None):
+        elapsed = self.elapsed(now)
+        if elapsed <= 0 or not self.counts:
+            return 0.0
+        stage = [stage for stage in STAGES if stage in self.counts][-1]
+        return self.counts[stage] / elapsed
+
+    def fraction_read(self):
+        """Fraction of the input file read so far, or None if unknown
+        """
+        if not self._size:
+            return None
+        offset = file_offset(self._path)
+        if offset is None:
+            return None
+        return min(float(offset) / self._size, 1.0)
+
+    def eta(self, now=None, fraction=None):
+        """Estimated seconds remaining, from the fraction of the input file
+        read so far, or None if unknown
+        """
+        if fraction is None:
+            fraction = self.fraction_read()
+        if not fraction:
+            return None
+        return self.elapsed(now) * (1 - fraction) / fraction
+
+    def queue_sizes(self):
+        sizes = OrderedDict()
+        for name, queue in self.queues.items():
+            try:
+                sizes[name] = queue.qsize()
+            except NotImplementedError:
+                # multiprocessing queues on macOS
+                sizes[name] = None
+        return sizes
+
+    def report(self, now=None):
+        if now is None:
+            now = time.time()
+        counts = ", ".join(
+            "{} {}".format(count, stage) for stage, count in self.counts.items())
+        if not counts:
+            counts = "0 written"
+        line = "{}: {} in {:.1f}s ({:.0f} {}/s)".format(
+            self.label, counts, self.elapsed(now), self.rate(now), self.label)
+
+        fraction = self.fraction_read()
+        if fraction is not None:
+            line += ", {:.0%} of file read".format(fraction)
+            eta = self.eta(now, fraction)
+            if eta is not None:
+                line += ", ETA {:.0f}s".format(eta)
+        for name, size in self.queue_sizes().items():
+            if size is not None:
+                line += ", {} queue {}".format(name, size)
+        print(line, file=self.out)
+
+    def summary(self):
+        """Counts, rate and phase times as a dict, for reports
+        """
+        return {
+            "label": self.label,
+            "counts": dict(self.counts),
+            "seconds": self.elapsed(),
+            "rate": self.rate(),
+            "phases": dict(self.phases)
+        }
+
+    def finish(self):
+        self.report()
+
+
+@contextmanager
+def phase(progress, name):
+    """As `progress.phase(name)`, doing nothing if `progress` is None
+    """
+    if progress is None:
+        yield
+    else:
+        with progress.phase(name):
+            yield
+
+
+class Profiler(object):
+    """Profile an import with cProfile, if given a `path`
+
+    Between `start` and `finish` the calling process is profiled. On
+    `finish`, stats are written to `path` (for `pstats` or a viewer such as
+    snakeviz) and a JSON report to `path` + ".json", with the summary of
+    each `Progress` tracked, any other summaries added (e.g. from other
+    processes), total wall time and the functions with the most cumulative
+    time.
+
+    Only the calling process is profiled; use a sampling profiler such as
+    py-spy for parser worker processes. With no `path`, does nothing.
+    """
+    def __init__(self, path=None, top=30):
+        self.path = path
+        self.top = top
+        self._profile = None
+        self._progress = []
+        self._summaries = []
+        self._start = None
+
+    def track(self, progress):
+        self._progress.append(progress)
+        return progress
+
+    def add_summary(self, summary):
+        self._summaries.append(summary)
+
+    def start(self):
+        if self.path is None:
+            return
+        self._start = time.time()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def finish(self):
+        if self._profile is None:
+            return
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
+
+        stats = pstats.Stats(self._profile)
+        functions = []
+        for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+            functions.append({
+                "function": "{}:{}({})".format(filename, line, name),
+                "calls": calls,
+                "own_seconds": own,
+                "cumulative_seconds": cumulative
+            })
+        functions.sort(key=lambda function: -function["cumulative_seconds"])
+
+        report = {
+            "seconds": time.time() - self._start,
+            "progress": [progress.summary() for progress in self._progress] + self._summaries,
+            "functions": functions[:self.top]
+        }
+        with open(self.path + ".json", "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        self._profile = None
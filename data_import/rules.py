@@ -0,0 +1,116 @@
+"""Rules to classify OSM tags as node types
+
+Rules are read from a JSON (or YAML) file with a list of rules for each
+element kind:
+
+    {
+        "nodes": [
+            {"type": "bank", "tag": "amenity", "value": "bank"},
+            {"type": "tower", "tag": "man_made", "value": "tower",
+             "require": {"tower:type": "communication"}}
+        ],
+        "ways": [
+            {"type": "power_line", "tag": "power", "value": "line",
+             "geometry": "line", "sector": "electricity"}
+        ]
+    }
+
+Each rule matches a single (tag, value) pair. `require` holds secondary tag
+predicates which must all hold for the rule to match: a string must equal the
+tag value, a list must contain it, `true` means the tag must be present and
+`false` that it must be absent. Other keys (e.g. `geometry` and `sector` for
+ways) are kept on the rule and returned by `RuleSet.match`.
+
+Rules are compiled once into a lookup table keyed on (tag, value), so
+classifying a dict of tags costs one lookup per tag, however many rules
+there are.
+"""
+from __future__ import print_function
+import json
+import os
+
+DEFAULT_RULES_PATH = os.path.join(
+    os.path.dirname(__file__), "rules", "osm.json")
+
+
+class RuleError(Exception):
+    """Raise when a rules file is not valid
+    """
+
+
+class RuleSet(object):
+    """Compiled classification rules for one kind of element
+    """
+    def __init__(self, rules):
+        self._lookup = {}
+        for index, rule in enumerate(rules):
+            for required in ("type", "tag", "value"):
+                if required not in rule:
+                    raise RuleError("Rule {} is missing '{}'".format(index, required))
+            key = (rule["tag"], rule["value"])
+            predicates = compile_predicates(rule.get("require", {}))
+            self._lookup.setdefault(key, []).append((index, rule, predicates))
+
+    def __len__(self):
+        return sum(len(matches) for matches in self._lookup.values())
+
+    def match(self, tags):
+        """Return the list of rules matched by a dict of tags, in the order
+        the rules were defined
+        """
+        lookup = self._lookup
+        matched = []
+        for item in tags.items():
+            candidates = lookup.get(item)
+            if candidates is None:
+                continue
+            for index, rule, predicates in candidates:
+                if all(predicate(tags) for predicate in predicates):
+                    matched.append((index, rule))
+
+        if len(matched) > 1:
+            matched.sort(key=lambda pair: pair[0])
+        return [rule for _, rule in matched]
+
+    def classify(self, tags):
+        """Return the list of node types matched by a dict of tags
+        """
+        return [rule["type"] for rule in self.match(tags)]
+
+
+def compile_predicates(require):
+    """Compile secondary tag requirements to a list of functions of tags
+    """
+    return [compile_predicate(key, expected) for key, expected in sorted(require.items())]
+
+
+def compile_predicate(key, expected):
+    if expected is True:
+        return lambda tags: key in tags
+    if expected is False:
+        return lambda tags: key not in tags
+    if isinstance(expected, list):
+        allowed = frozenset(expected)
+        return lambda tags: tags.get(key) in allowed
+    return lambda tags: tags.get(key) == expected
+
+
+def load_rules_data(path=DEFAULT_RULES_PATH):
+    """Read a rules file, without compiling the rules
+    """
+    with open(path) as rules_file:
+        if path.endswith((".yml", ".yaml")):
+            # only needed for YAML rules files
+            import yaml
+            return yaml.safe_load(rules_file)
+        return json.load(rules_file)
+
+
+def load_rules(path=DEFAULT_RULES_PATH, kind="nodes"):
+    """Load and compile the rules for `kind` of element from a file
+    """
+    data = load_rules_data(path)
+    if not isinstance(data, dict) or kind not in data:
+        raise RuleError("Rules file {} has no '{}' rules".format(path, kind))
+
+    return RuleSet(data[kind])
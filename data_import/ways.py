@@ -0,0 +1,281 @@
+"""OpenStreetMap way and relation import
+
+Ways matching a `line` rule are saved as edges with their full geometry.
+Closed ways and multipolygon relations matching an `area` rule are saved as
+nodes at the centroid of the polygon.
+
+The .pbf is read in two passes, with node coordinates held in a `CoordCache`:
+
+1. coords (and tagged nodes) are added to the cache, and matching
+   multipolygon relations are collected with the ids of their outer ways
+2. ways are resolved against the cache and saved; relation member ways are
+   kept in the cache, and relations are assembled once the pass is done
+"""
+from __future__ import print_function
+import datetime
+from data_import.bulk import CopyWriter, UpsertWriter
+
+EDGE_COLUMNS = (
+    "edge_name",
+    "sector",
+    "ref_key",
+    "data_source_id",
+    "location",
+    "last_updated",
+    "area"
+)
+
+# one edge for each way of a source (migration 013)
+EDGE_KEY_COLUMNS = ("data_source_id", "ref_key")
+
+# on re-import, only touch edges where something from the source changed
+EDGE_UPDATE_COLUMNS = ("edge_name", "sector", "location", "last_updated", "area")
+EDGE_CHANGED = """(sos_i_edges.edge_name, sos_i_edges.sector, sos_i_edges.area)
+    IS DISTINCT FROM (EXCLUDED.edge_name, EXCLUDED.sector, EXCLUDED.area)
+    OR NOT ST_Equals(sos_i_edges.location::geometry, EXCLUDED.location::geometry)"""
+
+
+def edge_writer(conn, upsert=False, **kwargs):
+    """Writer for rows of EDGE_COLUMNS into sos_i_edges
+
+    With `upsert`, merges on (data_source_id, ref_key) instead of inserting.
+    Without, the load is logged as a single reset of the change log.
+    """
+    if upsert:
+        return UpsertWriter(
+            conn,
+            "sos_i_edges",
+            EDGE_COLUMNS,
+            EDGE_KEY_COLUMNS,
+            EDGE_UPDATE_COLUMNS,
+            update_where=EDGE_CHANGED,
+            **kwargs)
+    return CopyWriter(conn, "sos_i_edges", EDGE_COLUMNS, change_layer="edges", **kwargs)
+
+
+def retire_missing_edges(conn, writer, data_source_id, area_short_name):
+    """Delete edges of a source and area which were not merged by `writer`
+
+    For use after a full import with an `UpsertWriter`, as for nodes (see
+    `data_import.bulk.retire_missing_nodes`). Edges have no status, so are
+    deleted rather than archived. Does nothing if no rows were written at
+    all. Returns the number of edges deleted.
+    """
+    if writer.rows_written == 0:
+        return 0
+
+    with conn.cursor() as cur:
+        cur.execute("""DELETE FROM sos_i_edges AS e
+            WHERE data_source_id = %s
+            AND area = %s
+            AND NOT EXISTS (
+                SELECT 1 FROM {keys} AS k
+                WHERE k.data_source_id = e.data_source_id
+                AND k.ref_key = e.ref_key
+            )""".format(keys=writer.keys_table), (data_source_id, area_short_name))
+        return cur.rowcount
+
+
+class WayHandler(object):
+    """Handle parsed OSM ways and relations
+
+    Writes edges and polygon nodes through a pair of `CopyWriter`s (see
+    `edge_writer` and `data_import.bulk.node_writer`).
+    """
+    def __init__(self, rules, coord_cache):
+        self._rules = rules
+        self._cache = coord_cache
+        self._edge_writer = None
+        self._node_writer = None
+        self._data_source_id = None
+        self._area_short_name = None
+        # relation id => (node type, name, [outer way ids])
+        self._relations = {}
+        self._member_way_ids = set()
+
+    def writers(self, edge_writer, node_writer):
+        self._edge_writer = edge_writer
+        self._node_writer = node_writer
+
+    def source(self, source_id):
+        self._data_source_id = source_id
+
+    def area(self, area_short_name):
+        self._area_short_name = area_short_name
+
+    def coords(self, coords):
+        self._cache.add_coords(coords)
+
+    def nodes(self, nodes):
+        # tagged nodes may also be referenced by ways
+        self._cache.add_coords([(osmid, lon, lat) for osmid, tags, (lon, lat) in nodes])
+
+    def relations(self, relations):
+        for osmid, tags, members in relations:
+            if tags.get('type') != 'multipolygon':
+                continue
+            for rule in self._rules.match(tags):
+                if rule.get("geometry") != "area":
+                    continue
+                outer_way_ids = [
+                    ref for ref, member_type, role in members
+                    if member_type == 'way' and role in ('outer', '')
+                ]
+                self._relations[osmid] = (rule["type"], tags.get('name', ""), outer_way_ids)
+                self._member_way_ids.update(outer_way_ids)
+                break
+
+    def ways(self, ways):
+        for osmid, tags, refs in ways:
+            is_member = osmid in self._member_way_ids
+            rules = self._rules.match(tags)
+            if not rules and not is_member:
+                continue
+
+            coords = self._cache.get_coords(refs)
+            if is_member:
+                self._cache.add_way(osmid, coords)
+
+            name = tags.get('name', "")
+            for rule in rules:
+                geometry = rule.get("geometry", "line")
+                if geometry == "line" and len(coords) >= 2:
+                    self._save_edge(osmid, rule, name, coords)
+                elif geometry == "area" and refs[0] == refs[-1] and len(coords) >= 4:
+                    self._save_polygon_node("way/{}".format(osmid), rule["type"], name, [coords])
+
+    def finish_relations(self):
+        """Assemble and save the collected multipolygon relations
+        """
+        for osmid, (node_type, name, outer_way_ids) in self._relations.items():
+            ways = []
+            for way_id in outer_way_ids:
+                coords = self._cache.get_way(way_id)
+                if coords:
+                    ways.append(coords)
+            rings = join_rings(ways)
+            if rings:
+                self._save_polygon_node("relation/{}".format(osmid), node_type, name, rings)
+
+    def _save_edge(self, osmid, rule, name, coords):
+        self._edge_writer.add((
+            name,
+            rule.get("sector", "unknown"),
+            osmid,
+            self._data_source_id,
+            linestring_as_wkt(coords),
+            datetime.datetime.now().isoformat(),
+            self._area_short_name
+        ))
+
+    def _save_polygon_node(self, ref_key, node_type, name, rings):
+        lon, lat = centroid(rings)
+        self._node_writer.add((
+            ref_key,
+            name,
+            node_type,
+            "POINT({} {})".format(round(lon, 8), round(lat, 8)),
+            datetime.datetime.now().isoformat(),
+            self._data_source_id,
+            self._area_short_name
+        ))
+
+
+def linestring_as_wkt(coords):
+    return "LINESTRING({})".format(", ".join(
+        "{} {}".format(round(lon, 8), round(lat, 8)) for lon, lat in coords))
+
+
+def join_rings(ways):
+    """Join way coordinate lists end-to-end into closed rings
+
+    Ways which cannot be closed into a ring are dropped.
+    """
+    rings = []
+    open_ways = [list(way) for way in ways if len(way) >= 2]
+    while open_ways:
+        current = open_ways.pop()
+        joined = True
+        while current[0] != current[-1] and joined:
+            joined = False
+            for i, way in enumerate(open_ways):
+                if way[0] == current[-1]:
+                    current.extend(way[1:])
+                elif way[-1] == current[-1]:
+                    current.extend(reversed(way[:-1]))
+                elif way[-1] == current[0]:
+                    current = way[:-1] + current
+                elif way[0] == current[0]:
+                    current = list(reversed(way[1:])) + current
+                else:
+                    continue
+                open_ways.pop(i)
+                joined = True
+                break
+        if current[0] == current[-1] and len(current) >= 4:
+            rings.append(current)
+    return rings
+
+
+def centroid(rings):
+    """Area-weighted centroid of a list of closed rings of (lon, lat)
+
+    Planar calculation in degrees, which is close enough for assets the size
+    of a plant or substation. Falls back to the mean of the vertices if the
+    rings have no area.
+    """
+    total_area = 0.0
+    cx = 0.0
+    cy = 0.0
+    for ring in rings:
+        ring_area = 0.0
+        ring_cx = 0.0
+        ring_cy = 0.0
+        for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]):
+            cross = x0 * y1 - x1 * y0
+            ring_area += cross
+            ring_cx += (x0 + x1) * cross
+            ring_cy += (y0 + y1) * cross
+        if ring_area == 0:
+            continue
+        # ring centroid, weighted by absolute area whatever the winding
+        weight = abs(ring_area)
+        total_area += weight
+        cx += weight * ring_cx / (3.0 * ring_area)
+        cy += weight * ring_cy / (3.0 * ring_area)
+
+    if total_area == 0:
+        points = [point for ring in rings for point in ring[:-1]]
+        return (
+            sum(lon for lon, _ in points) / len(points),
+            sum(lat for _, lat in points) / len(points)
+        )
+
+    return (cx / total_area, cy / total_area)
+
+
+def import_ways(path_to_file, way_handler, concurrency=None, nodes_callback=None):
+    """Run both passes over `path_to_file`
+
+    `nodes_callback`, if given, is also called with tagged nodes during the
+    first pass, so nodes can be imported without a third pass.
+    """
+    # imported here so the rest of the module can be used without imposm
+    from imposm.parser import OSMParser
+
+    def nodes(nodes):
+        way_handler.nodes(nodes)
+        if nodes_callback is not None:
+            nodes_callback(nodes)
+
+    p = OSMParser(
+        concurrency=concurrency,
+        coords_callback=way_handler.coords,
+        nodes_callback=nodes,
+        relations_callback=way_handler.relations
+    )
+    p.parse(path_to_file)
+
+    p = OSMParser(concurrency=concurrency, ways_callback=way_handler.ways)
+    p.parse(path_to_file)
+    way_handler.finish_relations()
@@ -0,0 +1,262 @@
+"""Run queued background jobs (see `app.job`)
+
+Each worker runs up to `--slots` jobs at once as subprocesses, claiming them
+from the queue as slots free up, within the limit for each job type across
+all workers. Run one worker per machine; more can share the same queue.
+
+A job's output (STDOUT and STDERR) is written to a log file in `--log-dir`.
+While it runs, its last line - the latest progress report, for imports - is
+saved as the job's progress every `--poll` seconds, which also tells the
+worker if the job has been cancelled. When the process exits, the end of
+the log is saved as the job's output.
+
+Scratch files, such as an import's node coordinate cache, go in a directory
+of the job's own under `--log-dir`, removed once the job finishes.
+
+Once an hour, changes older than `--keep-changes` days are pruned from the
+change log (see `app.changes`), so that it does not grow without bound.
+"""
+from __future__ import print_function
+import argparse
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from dotenv import load_dotenv, find_dotenv
+import app.db
+from app.changes import prune_changes
+from app.job import JOB_TYPES, claim_job, fail_stale_jobs, finish_job, job_command, update_job
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# bytes from the end of a log kept as the job's output
+OUTPUT_BYTES = 8192
+# seconds between prunes of the change log
+PRUNE_INTERVAL = 3600
+
+
+def tail(path, max_bytes=OUTPUT_BYTES):
+    """Read up to `max_bytes` from the end of a file, as text
+    """
+    with open(path, "rb") as log_file:
+        log_file.seek(0, os.SEEK_END)
+        size = log_file.tell()
+        log_file.seek(max(0, size - max_bytes))
+        return log_file.read().decode("utf-8", "replace")
+
+
+def last_line(text):
+    """Last non-empty line of text, or None
+    """
+    for line in reversed(text.replace("\r", "\n").split("\n")):
+        if line.strip():
+            return line.strip()
+    return None
+
+
+def parse_limits(values):
+    """Parse `job_type=N` limits into a dict
+    """
+    limits = {}
+    for value in values or []:
+        job_type, _, limit = value.partition("=")
+        if job_type not in JOB_TYPES or not limit.isdigit():
+            raise ValueError("Expected job_type=N with a known job type, got {}".format(value))
+        limits[job_type] = int(limit)
+    return limits
+
+
+class RunningJob(object):
+    """A job's subprocess and log
+    """
+    def __init__(self, job, process, log_path, job_dir):
+        self.job = job
+        self.process = process
+        self.log_path = log_path
+        self.job_dir = job_dir
+        self.cancelled = False
+
+    @property
+    def job_id(self):
+        return self.job["job_id"]
+
+
+class Worker(object):
+    """Claims jobs and runs them as subprocesses, up to `slots` at once
+    """
+    def __init__(self, conn, name=None, slots=None, limits=None, job_types=None, log_dir=None,
+                 stale_timeout=300, keep_changes=30):
+        self.conn = conn
+        self.name = name or "{}:{}".format(socket.gethostname(), os.getpid())
+        self.slots = slots or multiprocessing.cpu_count()
+        self.limits = limits or {}
+        self.job_types = job_types
+        self.log_dir = log_dir or tempfile.gettempdir()
+        self.stale_timeout = stale_timeout
+        self.keep_changes = keep_changes
+        self.running = []
+        self._last_prune = None
+
+    def start(self, job):
+        """Start a job's subprocess, with output to its log and scratch
+        files in a directory of its own
+        """
+        log_path = os.path.join(self.log_dir, "job_{}.log".format(job["job_id"]))
+        job_dir = tempfile.mkdtemp(prefix="job_{}_".format(job["job_id"]), dir=self.log_dir)
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        try:
+            with open(log_path, "wb") as log_file:
+                process = subprocess.Popen(
+                    job_command(job["job_type"], job["args"], job_dir),
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    cwd=ROOT_DIR,
+                    env=env
+                )
+        except Exception:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        update_job(self.conn, job["job_id"], log_path=log_path)
+        print("Started job {} ({}), pid {}".format(job["job_id"], job["job_type"], process.pid))
+        return RunningJob(job, process, log_path, job_dir)
+
+    def check(self, running):
+        """Save a running job's progress, stopping it if cancelled and
+        recording its result if it has exited. Returns True once finished.
+        """
+        output = tail(running.log_path)
+        exit_code = running.process.poll()
+        if exit_code is None:
+            status = update_job(self.conn, running.job_id, progress=last_line(output))
+            if status == "cancelling" and not running.cancelled:
+                running.process.terminate()
+                running.cancelled = True
+            return False
+
+        if running.cancelled:
+            status = "cancelled"
+        elif exit_code == 0:
+            status = "succeeded"
+        else:
+            status = "failed"
+        update_job(self.conn, running.job_id, progress=last_line(output))
+        finish_job(self.conn, running.job_id, status, exit_code=exit_code, output=output)
+        shutil.rmtree(running.job_dir, ignore_errors=True)
+        print("Job {} {} (exit code {})".format(running.job_id, status, exit_code))
+        return True
+
+    def prune(self, now=None):
+        """Prune the change log, if it has not been pruned in the last
+        PRUNE_INTERVAL seconds. With no `keep_changes`, does nothing.
+        """
+        if now is None:
+            now = time.time()
+        if not self.keep_changes:
+            return
+        if self._last_prune is not None and now - self._last_prune < PRUNE_INTERVAL:
+            return
+        prune_changes(self.conn, self.keep_changes)
+        self.conn.commit()
+        self._last_prune = now
+
+    def run_once(self):
+        """Prune the change log when due and check on running jobs, then
+        claim jobs for any free slots. Returns the number of jobs running.
+        """
+        self.prune()
+        for job_id in fail_stale_jobs(self.conn, self.stale_timeout):
+            print("Job {} failed: worker stopped responding".format(job_id))
+        self.running = [running for running in self.running if not self.check(running)]
+        while len(self.running) < self.slots:
+            job = claim_job(self.conn, self.name, self.limits, self.job_types)
+            if job is None:
+                break
+            try:
+                self.running.append(self.start(job))
+            except Exception as error:
+                # e.g. no such log directory, or python could not be run
+                finish_job(self.conn, job["job_id"], "failed", output=str(error))
+                print("Job {} failed to start: {}".format(job["job_id"], error))
+        return len(self.running)
+
+    def run(self, poll=2, exit_when_empty=False):
+        """Run jobs until stopped, or with `exit_when_empty` until none are
+        running or can be claimed
+        """
+        while True:
+            if self.run_once() == 0 and exit_when_empty:
+                return
+            time.sleep(poll)
+
+    def stop(self):
+        """Stop all running jobs, marking them failed
+        """
+        for running in self.running:
+            running.process.terminate()
+        for running in self.running:
+            exit_code = running.process.wait()
+            finish_job(self.conn, running.job_id, "failed", exit_code=exit_code,
+                       output=tail(running.log_path) + "\nWorker stopped")
+            shutil.rmtree(running.job_dir, ignore_errors=True)
+        self.running = []
+
+
+def main():
+    """Run queued jobs:
+
+        python -m jobs.worker --slots 8 --limit osm_import=4
+
+    Submit jobs with POST /jobs.json. With `--exit-when-empty`, the worker
+    exits once the queue is empty, e.g. after a night's imports.
+
+    On SIGTERM or Ctrl-C, running jobs are stopped and marked failed.
+    """
+    parser = argparse.ArgumentParser(description="Run queued import and analysis jobs")
+    parser.add_argument("--slots", type=int, default=None,
+                        help="most jobs to run at once (default: one per CPU)")
+    parser.add_argument("--limit", action="append", default=[], metavar="JOB_TYPE=N",
+                        help="most jobs of a type to run at once across all workers (repeatable)")
+    parser.add_argument("--type", action="append", default=None, dest="job_types",
+                        choices=sorted(JOB_TYPES), help="only run jobs of this type (repeatable)")
+    parser.add_argument("--log-dir", default=None,
+                        help="directory for job logs (default: the system temp directory)")
+    parser.add_argument("--poll", type=float, default=2,
+                        help="seconds between checks on the queue and running jobs")
+    parser.add_argument("--stale-timeout", type=int, default=300,
+                        help="seconds after which a job whose worker has not checked in is failed")
+    parser.add_argument("--keep-changes", type=int, default=30, metavar="DAYS",
+                        help="days of the change log to keep when pruning it (0: do not prune)")
+    parser.add_argument("--exit-when-empty", action="store_true",
+                        help="exit once no jobs are running or queued")
+    args = parser.parse_args()
+    try:
+        limits = parse_limits(args.limit)
+    except ValueError as error:
+        parser.error(str(error))
+
+    load_dotenv(find_dotenv())
+    conn = app.db.connect()
+    worker = Worker(conn, slots=args.slots, limits=limits, job_types=args.job_types,
+                    log_dir=args.log_dir, stale_timeout=args.stale_timeout,
+                    keep_changes=args.keep_changes)
+
+    def terminate(signum, frame):
+        raise KeyboardInterrupt()
+    signal.signal(signal.SIGTERM, terminate)
+
+    print("Worker {} running up to {} jobs".format(worker.name, worker.slots))
+    try:
+        worker.run(poll=args.poll, exit_when_empty=args.exit_when_empty)
+    except KeyboardInterrupt:
+        conn.rollback()
+        worker.stop()
+        sys.exit(1)
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+-- Each node from a data source is identified by its ref_key and type, so
+-- imports can update nodes in place (INSERT ... ON CONFLICT) instead of
+-- duplicating them. An element matching several rules is imported as one
+-- node of each type, all with the same ref_key.
+
+-- for each (data_source_id, ref_key, type), keep the approved node if there
+-- is one, else the most recently updated, and note which node replaces each
+-- of the others
+CREATE TEMPORARY TABLE sos_tmp_node_duplicates AS
+SELECT node_id, keep_node_id
+FROM (
+    SELECT
+        node_id,
+        first_value(node_id) OVER (
+            PARTITION BY data_source_id, ref_key, type
+            ORDER BY status IS NOT DISTINCT FROM 'approved' DESC, last_updated DESC NULLS LAST, node_id
+        ) AS keep_node_id
+    FROM sos_i_nodes
+    WHERE data_source_id IS NOT NULL AND ref_key IS NOT NULL
+) AS ranked
+WHERE node_id <> keep_node_id;
+
+-- edges have no foreign key to nodes, so point them at the node kept
+UPDATE sos_i_edges AS e
+SET from_node_id = d.keep_node_id
+FROM sos_tmp_node_duplicates AS d
+WHERE e.from_node_id = d.node_id;
+
+UPDATE sos_i_edges AS e
+SET to_node_id = d.keep_node_id
+FROM sos_tmp_node_duplicates AS d
+WHERE e.to_node_id = d.node_id;
+
+DELETE FROM sos_i_nodes AS n
+USING sos_tmp_node_duplicates AS d
+WHERE n.node_id = d.node_id;
+
+DROP TABLE sos_tmp_node_duplicates;
+
+CREATE UNIQUE INDEX sos_i_nodes_source_ref_key_type ON sos_i_nodes (data_source_id, ref_key, type);
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS sos_i_nodes_source_ref_key_type;
@@ -0,0 +1,2 @@
+-- Index node type, which most queries between types of node filter on
+CREATE INDEX sos_i_nodes_type ON sos_i_nodes (type);
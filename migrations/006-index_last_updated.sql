@@ -0,0 +1,3 @@
+-- Index last_updated, for updated_since filters on node and edge lists
+CREATE INDEX sos_i_nodes_last_updated ON sos_i_nodes (last_updated);
+CREATE INDEX sos_i_edges_last_updated ON sos_i_edges (last_updated);
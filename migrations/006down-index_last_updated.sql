@@ -0,0 +1,2 @@
+DROP INDEX IF EXISTS sos_i_edges_last_updated;
+DROP INDEX IF EXISTS sos_i_nodes_last_updated;
@@ -0,0 +1,15 @@
+-- Criticality of each node in the dependency graph: what fails if it fails.
+-- Computed in batch by `python -m analysis.criticality`, which replaces the
+-- contents of the table.
+
+CREATE TABLE sos_i_node_criticality (
+    node_id integer PRIMARY KEY -- Node id, see sos_i_nodes
+    , downstream_count integer NOT NULL -- Number of nodes which transitively depend on this node
+    , sector_count integer NOT NULL -- Number of sectors of the dependencies lost
+    , sectors text[] NOT NULL -- Sectors of the dependencies lost
+    , max_depth integer NOT NULL -- Longest chain of failures, in hops
+    , betweenness double precision NOT NULL -- Number of shortest dependency paths through this node
+    , computed_at timestamp with time zone DEFAULT now() -- Date that this was computed
+);
+
+CREATE INDEX sos_i_node_criticality_downstream_count ON sos_i_node_criticality (downstream_count);
@@ -0,0 +1,45 @@
+-- Lookup tables of node types and areas, so listing them does not scan every
+-- node. Kept up to date by importers, which call sos_refresh_lookups() after
+-- loading nodes; run `SELECT sos_refresh_lookups();` after other changes.
+
+CREATE TABLE sos_lu_node_types (
+    type text PRIMARY KEY -- Node type, as in sos_i_nodes
+    , node_count integer NOT NULL -- Number of nodes of this type
+    , last_updated timestamp with time zone DEFAULT now() -- Date that this was refreshed
+);
+
+CREATE TABLE sos_lu_areas (
+    area text PRIMARY KEY -- Area name, as in sos_i_nodes
+    , node_count integer NOT NULL -- Number of nodes in this area
+    , min_lon double precision -- Bounding box of nodes in this area
+    , min_lat double precision
+    , max_lon double precision
+    , max_lat double precision
+    , last_updated timestamp with time zone DEFAULT now() -- Date that this was refreshed
+);
+
+CREATE FUNCTION sos_refresh_lookups() RETURNS void AS $$
+BEGIN
+    DELETE FROM sos_lu_node_types;
+    INSERT INTO sos_lu_node_types (type, node_count)
+    SELECT type, count(*)
+    FROM sos_i_nodes
+    WHERE type IS NOT NULL
+    GROUP BY type;
+
+    DELETE FROM sos_lu_areas;
+    INSERT INTO sos_lu_areas (area, node_count, min_lon, min_lat, max_lon, max_lat)
+    SELECT
+        area,
+        count(*),
+        ST_XMin(ST_Extent(location::geometry)),
+        ST_YMin(ST_Extent(location::geometry)),
+        ST_XMax(ST_Extent(location::geometry)),
+        ST_YMax(ST_Extent(location::geometry))
+    FROM sos_i_nodes
+    WHERE area IS NOT NULL
+    GROUP BY area;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT sos_refresh_lookups();
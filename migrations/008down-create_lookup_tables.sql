@@ -0,0 +1,3 @@
+DROP FUNCTION IF EXISTS sos_refresh_lookups();
+DROP TABLE IF EXISTS sos_lu_areas;
+DROP TABLE IF EXISTS sos_lu_node_types;
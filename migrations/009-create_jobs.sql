@@ -0,0 +1,25 @@
+-- Queue of background jobs (imports and analyses), submitted through /jobs
+-- and run by `python -m jobs.worker`. Workers claim queued jobs with
+-- SELECT ... FOR UPDATE SKIP LOCKED, so any number can share the queue.
+
+CREATE TABLE sos_i_jobs (
+    job_id serial PRIMARY KEY -- Primary key and id field for table records
+    , job_type text NOT NULL -- Kind of job, see app/job.py, eg osm_import
+    , args jsonb NOT NULL DEFAULT '{}' -- Arguments of the job, by name
+    , status text NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'cancelling', 'succeeded', 'failed', 'cancelled'))
+    , data_source_id integer REFERENCES sos_lu_data_sources (data_source_id) -- Data source imported, if any
+    , progress text -- Last progress line reported by the job
+    , output text -- End of the job's output, once finished
+    , exit_code integer -- Exit code of the job's process
+    , worker text -- Worker running the job, as host:pid
+    , log_path text -- Path of the job's full output on the worker's host
+    , submitted_at timestamp with time zone DEFAULT now()
+    , started_at timestamp with time zone
+    , heartbeat_at timestamp with time zone -- Last time the worker checked in on the job
+    , finished_at timestamp with time zone
+);
+
+CREATE INDEX sos_i_jobs_queued ON sos_i_jobs (job_id) WHERE status = 'queued';
+CREATE INDEX sos_i_jobs_status_type ON sos_i_jobs (status, job_type);
+CREATE INDEX sos_i_jobs_data_source_id ON sos_i_jobs (data_source_id);
@@ -0,0 +1 @@
+DROP TABLE IF EXISTS sos_i_jobs;
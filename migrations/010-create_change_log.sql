@@ -0,0 +1,78 @@
+-- Log of changes to nodes and edges, written by triggers, so that clients
+-- can fetch only what changed since they last loaded (see /changes.json).
+-- A deleted row leaves its id in the log as a tombstone.
+--
+-- Changes are read by transaction id: a cursor is the oldest transaction
+-- still running when the changes were read, so changes from transactions
+-- which commit later are never skipped. Triggers are per row; TRUNCATE is
+-- logged once, and clients then reload everything. Bulk loads with COPY
+-- disable the per-row trigger and log a truncate row in the same way (see
+-- data_import.bulk.without_change_log).
+--
+-- Prune old changes with `SELECT sos_prune_changes(interval '30 days');`
+
+CREATE TABLE sos_i_changes (
+    change_id bigserial PRIMARY KEY -- Primary key and id field for table records
+    , layer text NOT NULL CHECK (layer IN ('nodes', 'edges')) -- Table changed
+    , id integer -- Node or edge id, or NULL if the table was truncated
+    , operation char(1) NOT NULL CHECK (operation IN ('I', 'U', 'D', 'T')) -- Insert, update, delete or truncate
+    , txid bigint NOT NULL DEFAULT txid_current() -- Transaction which made the change
+    , changed_at timestamp with time zone DEFAULT now() -- Date of the change
+);
+
+CREATE INDEX sos_i_changes_txid ON sos_i_changes (txid);
+
+-- Oldest transaction covered by the log: earlier cursors need a full reload
+CREATE TABLE sos_i_changes_start (
+    txid bigint NOT NULL
+);
+INSERT INTO sos_i_changes_start (txid) VALUES (txid_snapshot_xmin(txid_current_snapshot()));
+
+CREATE FUNCTION sos_log_node_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        INSERT INTO sos_i_changes (layer, operation) VALUES ('nodes', 'T');
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO sos_i_changes (layer, id, operation) VALUES ('nodes', OLD.node_id, 'D');
+    ELSE
+        INSERT INTO sos_i_changes (layer, id, operation) VALUES ('nodes', NEW.node_id, left(TG_OP, 1));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION sos_log_edge_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        INSERT INTO sos_i_changes (layer, operation) VALUES ('edges', 'T');
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO sos_i_changes (layer, id, operation) VALUES ('edges', OLD.edge_id, 'D');
+    ELSE
+        INSERT INTO sos_i_changes (layer, id, operation) VALUES ('edges', NEW.edge_id, left(TG_OP, 1));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sos_i_nodes_log_change
+    AFTER INSERT OR UPDATE OR DELETE ON sos_i_nodes
+    FOR EACH ROW EXECUTE PROCEDURE sos_log_node_change();
+CREATE TRIGGER sos_i_nodes_log_truncate
+    AFTER TRUNCATE ON sos_i_nodes
+    FOR EACH STATEMENT EXECUTE PROCEDURE sos_log_node_change();
+CREATE TRIGGER sos_i_edges_log_change
+    AFTER INSERT OR UPDATE OR DELETE ON sos_i_edges
+    FOR EACH ROW EXECUTE PROCEDURE sos_log_edge_change();
+CREATE TRIGGER sos_i_edges_log_truncate
+    AFTER TRUNCATE ON sos_i_edges
+    FOR EACH STATEMENT EXECUTE PROCEDURE sos_log_edge_change();
+
+CREATE FUNCTION sos_prune_changes(keep interval) RETURNS void AS $$
+BEGIN
+    UPDATE sos_i_changes_start
+    SET txid = GREATEST(txid, (
+        SELECT max(txid) + 1 FROM sos_i_changes WHERE changed_at < now() - keep
+    ));
+    DELETE FROM sos_i_changes WHERE txid < (SELECT txid FROM sos_i_changes_start);
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,9 @@
+DROP FUNCTION IF EXISTS sos_prune_changes(interval);
+DROP TRIGGER IF EXISTS sos_i_edges_log_truncate ON sos_i_edges;
+DROP TRIGGER IF EXISTS sos_i_edges_log_change ON sos_i_edges;
+DROP TRIGGER IF EXISTS sos_i_nodes_log_truncate ON sos_i_nodes;
+DROP TRIGGER IF EXISTS sos_i_nodes_log_change ON sos_i_nodes;
+DROP FUNCTION IF EXISTS sos_log_edge_change();
+DROP FUNCTION IF EXISTS sos_log_node_change();
+DROP TABLE IF EXISTS sos_i_changes_start;
+DROP TABLE IF EXISTS sos_i_changes;
@@ -0,0 +1,4 @@
+-- Index locations as lon/lat geometry, for vector tile searches whose area
+-- spans the antimeridian at low zooms, which geography cannot express
+CREATE INDEX sos_i_nodes_geometry_gist ON sos_i_nodes USING GIST ((location::geometry));
+CREATE INDEX sos_i_edges_geometry_gist ON sos_i_edges USING GIST ((location::geometry));
@@ -0,0 +1,2 @@
+DROP INDEX IF EXISTS sos_i_nodes_geometry_gist;
+DROP INDEX IF EXISTS sos_i_edges_geometry_gist;
@@ -0,0 +1,67 @@
+-- Keep the lookup tables (migration 008) up to date as single nodes are
+-- edited or deleted in the app, by adjusting counts rather than rebuilding
+-- them from every node with sos_refresh_lookups().
+--
+-- Full refreshes take advisory lock 90240002 exclusively and adjustments
+-- take it shared, so that two refreshes cannot both insert the same rows,
+-- and adjustments do not interleave with a refresh.
+
+CREATE OR REPLACE FUNCTION sos_refresh_lookups() RETURNS void AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(90240002);
+
+    DELETE FROM sos_lu_node_types;
+    INSERT INTO sos_lu_node_types (type, node_count)
+    SELECT type, count(*)
+    FROM sos_i_nodes
+    WHERE type IS NOT NULL
+    GROUP BY type;
+
+    DELETE FROM sos_lu_areas;
+    INSERT INTO sos_lu_areas (area, node_count, min_lon, min_lat, max_lon, max_lat)
+    SELECT
+        area,
+        count(*),
+        ST_XMin(ST_Extent(location::geometry)),
+        ST_YMin(ST_Extent(location::geometry)),
+        ST_XMax(ST_Extent(location::geometry)),
+        ST_YMax(ST_Extent(location::geometry))
+    FROM sos_i_nodes
+    WHERE area IS NOT NULL
+    GROUP BY area;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Add `delta` to the count of nodes of a type and in an area (either may be
+-- NULL), removing entries whose count reaches zero, and extend the area's
+-- bounding box to take in (lon, lat) if given. Bounding boxes only grow
+-- until the next full refresh.
+CREATE FUNCTION sos_count_node(
+    node_type text, node_area text, delta integer,
+    lon double precision DEFAULT NULL, lat double precision DEFAULT NULL
+) RETURNS void AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock_shared(90240002);
+
+    IF node_type IS NOT NULL AND delta <> 0 THEN
+        INSERT INTO sos_lu_node_types AS t (type, node_count)
+        VALUES (node_type, delta)
+        ON CONFLICT (type) DO UPDATE
+        SET node_count = t.node_count + delta, last_updated = now();
+        DELETE FROM sos_lu_node_types WHERE type = node_type AND node_count <= 0;
+    END IF;
+
+    IF node_area IS NOT NULL THEN
+        INSERT INTO sos_lu_areas AS a (area, node_count, min_lon, min_lat, max_lon, max_lat)
+        VALUES (node_area, delta, lon, lat, lon, lat)
+        ON CONFLICT (area) DO UPDATE
+        SET node_count = a.node_count + delta,
+            min_lon = LEAST(a.min_lon, lon),
+            min_lat = LEAST(a.min_lat, lat),
+            max_lon = GREATEST(a.max_lon, lon),
+            max_lat = GREATEST(a.max_lat, lat),
+            last_updated = now();
+        DELETE FROM sos_lu_areas WHERE area = node_area AND node_count <= 0;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
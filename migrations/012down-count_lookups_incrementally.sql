@@ -0,0 +1,4 @@
+DROP FUNCTION IF EXISTS sos_count_node(text, text, integer, double precision, double precision);
+
+-- as in migration 008, without the lock
+
@@ -0,0 +1,15 @@
+-- Edges from a data source are identified by their ref_key, so imports can
+-- update them in place (INSERT ... ON CONFLICT) as they do nodes, and can
+-- retire the edges of an area which are no longer in the source
+
+ALTER TABLE sos_i_edges ADD COLUMN area text; -- Area the edge was imported for, if any
+
+-- keep the most recently updated edge for any (data_source_id, ref_key)
+DELETE FROM sos_i_edges AS a
+USING sos_i_edges AS b
+WHERE a.data_source_id = b.data_source_id
+AND a.ref_key = b.ref_key
+AND (COALESCE(a.last_updated, '-infinity'), a.edge_id)
+    < (COALESCE(b.last_updated, '-infinity'), b.edge_id);
+
+CREATE UNIQUE INDEX sos_i_edges_source_ref_key ON sos_i_edges (data_source_id, ref_key);
@@ -0,0 +1,2 @@
+DROP INDEX IF EXISTS sos_i_edges_source_ref_key;
+ALTER TABLE sos_i_edges DROP COLUMN IF EXISTS area;
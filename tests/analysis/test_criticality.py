@@ -0,0 +1,35 @@
+import numpy
+from app.graph import DependencyGraph
+from analysis.criticality import all_node_criticality, array_literal
+
+def make_graph():
+    # diamond 1 -> (2, 3) -> 4, then chain 4 -> 5, and 6 alone
+    nodes = (numpy.arange(1, 7), numpy.zeros(6, dtype=numpy.int32))
+    edges = (
+        numpy.arange(5),
+        numpy.array([1, 1, 2, 3, 4]),
+        numpy.array([2, 3, 4, 4, 5]),
+        numpy.array([0, 0, 0, 1, 1])
+    )
+    return DependencyGraph(nodes, edges, ["substation"], ["electricity", "water"])
+
+def test_downstream_and_depth():
+    downstream, sectors, max_depth, _ = all_node_criticality(make_graph(), workers=1)
+    assert list(downstream) == [4, 2, 2, 1, 0, 0]
+    assert list(max_depth) == [3, 2, 2, 1, 0, 0]
+    assert [list(codes) for codes in sectors] == [[0, 1], [0, 1], [1], [1], [], []]
+
+def test_betweenness():
+    _, _, _, betweenness = all_node_criticality(make_graph(), workers=1)
+    # 1 -> 4 and 1 -> 5 each split between 2 and 3; 4 lies on 1, 2, 3 -> 5
+    assert list(betweenness) == [0, 1, 1, 3, 0, 0]
+
+def test_workers_match():
+    serial = all_node_criticality(make_graph(), workers=1)
+    parallel = all_node_criticality(make_graph(), workers=2)
+    assert list(serial[0]) == list(parallel[0])
+    assert list(serial[3]) == list(parallel[3])
+
+def test_array_literal():
+    assert array_literal([]) == "{}"
+    assert array_literal(["water", 'say "hi"']) == '{"water","say \\"hi\\""}'
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import datetime
+from app.cache import LRUBackend, ResponseCache, lookup_cache
+
+def make_cache(max_bytes=1000, max_entry_bytes=100):
+    return ResponseCache(LRUBackend(max_bytes=max_bytes), max_entry_bytes=max_entry_bytes)
+
+def test_lru_evicts_least_recently_used():
+    backend = LRUBackend(max_bytes=10)
+    backend.set("a", {"body": "aaaa"})
+    backend.set("b", {"body": "bbbb"})
+    backend.get("a")
+    backend.set("c", {"body": "cccc"})
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.stats() == {"entries": 2, "bytes": 8}
+
+def test_key_ignores_arg_order():
+    cache = make_cache()
+    assert cache.key("nodes", [("a", "1"), ("b", "2")]) == cache.key("nodes", {"b": "2", "a": "1"})
+
+def test_etag_changes_with_version():
+    cache = make_cache()
+    key = cache.key("nodes", {})
+    now = datetime.datetime(2018, 1, 1)
+    assert cache.etag(key, (1, now)) == cache.etag(key, (1, now))
+    assert cache.etag(key, (1, now)) != cache.etag(key, (2, now))
+    assert cache.etag(key, (1, now)) != cache.etag(key, (1, now + datetime.timedelta(seconds=1)))
+
+def test_get_checks_etag():
+    cache = make_cache()
+    cache.set("k", "etag1", None, "body")
+    assert cache.get("k", "etag1")["body"] == "body"
+    assert cache.get("k", "etag2") is None
+
+def test_invalidate_changes_keys():
+    cache = make_cache()
+    key = cache.key("nodes", {"area": "uk"})
+    cache.invalidate("nodes")
+    assert cache.key("nodes", {"area": "uk"}) != key
+    assert cache.key("edges", {}) == make_cache().key("edges", {})
+
+def test_tee_caches_complete_body():
+    cache = make_cache()
+    chunks = list(cache.tee("k", "etag", None, iter(["ab", "cd"])))
+    assert chunks == ["ab", "cd"]
+    assert cache.get("k", "etag")["body"] == "abcd"
+
+def test_tee_skips_large_body():
+    cache = make_cache(max_entry_bytes=3)
+    chunks = list(cache.tee("k", "etag", None, iter(["ab", "cd"])))
+    assert chunks == ["ab", "cd"]
+    assert cache.get("k", "etag") is None
+
+def test_lookup_cache():
+    calls = []
+
+    @lookup_cache
+    def lookup(conn, name):
+        calls.append(name)
+        return name.upper()
+
+    assert lookup(None, "a") == "A"
+    assert lookup(None, "a") == "A"
+    assert lookup(None, "b") == "B"
+    assert calls == ["a", "b"]
+    lookup.clear()
+    lookup(None, "a")
+    assert calls == ["a", "b", "a"]
+
+def test_lookup_cache_expires(monkeypatch):
+    calls = []
+
+    @lookup_cache
+    def lookup(conn):
+        calls.append(1)
+
+    monkeypatch.setenv("APP_LOOKUP_TTL", "0")
+    lookup(None)
+    lookup(None)
+    assert len(calls) == 2
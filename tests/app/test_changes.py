@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import datetime
+from app.changes import get_changes, get_version
+
+def test_no_cursor_resets(fake_conn):
+    fake_conn.results = [[(120, )]]
+    changes = get_changes(fake_conn)
+    assert changes["reset"]
+    assert changes["cursor"] == "120"
+
+def test_cursor_before_log_resets(fake_conn):
+    fake_conn.results = [[(120, )], [(100, )]]
+    assert get_changes(fake_conn, since=90)["reset"]
+
+def test_truncate_resets(fake_conn):
+    fake_conn.results = [[(120, )], [(100, )], [("nodes", 1, False), ("nodes", None, True)]]
+    assert get_changes(fake_conn, since=110)["reset"]
+
+def test_too_many_changes_reset(fake_conn):
+    fake_conn.results = [[(120, )], [(100, )], [("nodes", 1, False), ("edges", 2, False)]]
+    assert get_changes(fake_conn, since=110, max_changes=1)["reset"]
+    # stops listing changes as soon as there are too many
+    sql, params = fake_conn.executed[2]
+    assert "LIMIT %s" in sql
+    assert params == (110, 120, 2)
+
+def test_changes_with_tombstones(fake_conn):
+    node_row = (1, 0.5, 51.5, "Substation", "substation", None, None, "staged", 1514764800)
+    fake_conn.results = [
+        [(120, )],
+        [(100, )],
+        [("nodes", 1, False), ("nodes", 2, False), ("edges", 3, False)],
+        [node_row],
+        []
+    ]
+    changes = get_changes(fake_conn, since=110, area="uk")
+    assert not changes["reset"]
+    assert changes["cursor"] == "120"
+    assert [feature["properties"]["id"] for feature in changes["nodes"]["features"]] == [1]
+    assert changes["deleted_nodes"] == [2]
+    assert changes["edges"]["features"] == []
+    assert changes["deleted_edges"] == [3]
+
+    sql, params = fake_conn.executed[3]
+    assert "node_id = ANY(%s)" in sql
+    assert params == ["uk", [1, 2]]
+
+def test_version_is_latest_change(fake_conn):
+    changed_at = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+    fake_conn.results = [[(7, changed_at)]]
+    assert get_version(fake_conn) == (7, changed_at)
+    sql, _ = fake_conn.executed[0]
+    assert "count(" not in sql and "LIMIT 1" in sql
+
+def test_version_with_criticality(fake_conn):
+    changed_at = datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+    computed_at = changed_at + datetime.timedelta(days=1)
+    fake_conn.results = [[(7, changed_at)], [(computed_at, )]]
+    assert get_version(fake_conn, criticality=True) == (7, computed_at)
+    fake_conn.results = [[], [(None, )]]
+    assert get_version(fake_conn, criticality=True) == (None, None)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from app.columns import Categorical, StringColumn
+
+def build(builder_class, values):
+    builder = builder_class.Builder()
+    for value in values:
+        builder.append(value)
+    return builder.build()
+
+def test_string_column():
+    names = build(StringColumn, [u"Coombe", None, u"Løkken"])
+    assert len(names) == 3
+    assert list(names) == [u"Coombe", u"", u"Løkken"]
+    assert list(names.take([2, 0])) == [u"Løkken", u"Coombe"]
+    assert list(names.take([])) == []
+
+def test_categorical():
+    types = build(Categorical, ["substation", None, "water_tower", "substation"])
+    assert list(types) == ["substation", None, "water_tower", "substation"]
+    assert types.categories == ["substation", "water_tower"]
+    assert types.isin(["substation"]).tolist() == [True, False, False, True]
+    assert types.counts() == {"substation": 2, "water_tower": 1}
+    assert list(types.take([1, 2])) == [None, "water_tower"]
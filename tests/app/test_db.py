@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from app.db import ConnectionPool, PoolError
+import pytest
+
+class FakeConnection(object):
+    def __init__(self):
+        self.closed = 0
+
+    def get_transaction_status(self):
+        return 0
+
+    def close(self):
+        self.closed = 1
+
+def test_pool_reuses_connections():
+    pool = ConnectionPool(connect=FakeConnection, max_size=2)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    assert pool.getconn() is conn
+    assert pool.stats()["opened"] == 1
+
+def test_pool_max_size():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1, checkout_timeout=0)
+    pool.getconn()
+    with pytest.raises(PoolError):
+        pool.getconn()
+    assert pool.stats()["timeouts"] == 1
+
+def test_pool_closes_idle_connections():
+    pool = ConnectionPool(connect=FakeConnection, min_size=0, max_size=2, idle_timeout=0)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    assert conn.closed
+    assert pool.stats()["idle"] == 0
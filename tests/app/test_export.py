@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import datetime
+import io
+import json
+import pytest
+import app.export
+from app.export import ArrowWriter, ChunkSink, NODE_COLUMNS, export, export_columns, export_chunks
+
+ROWS = [
+    (1, "Substation", "substation", "uk", None, None, "staged", 1, "n1",
+     datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc), '{"voltage": "132kV"}',
+     memoryview(bytes.fromhex("0101000000000000000000f83f0000000000c04940"))),
+    (2, None, "water_tower", "uk", None, None, "approved", 1, "n2", None, None, None)
+]
+
+def test_export_columns():
+    columns, params = export_columns(None, "nodes", {})
+    assert [name for name, _, _ in columns] == [name for name, _, _ in NODE_COLUMNS]
+    assert params == []
+    with pytest.raises(ValueError):
+        export_columns(None, "edges", {}, flatten_properties=True)
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        list(export_chunks(None, "nodes", "shp"))
+
+def test_chunk_sink():
+    sink = ChunkSink()
+    sink.write(b"ab")
+    sink.write(b"c")
+    assert sink.tell() == 3
+    assert sink.drain() == b"abc"
+    assert sink.drain() == b""
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_arrow_writer_round_trip(fmt):
+    pyarrow = pytest.importorskip("pyarrow")
+    sink = ChunkSink()
+    writer = ArrowWriter(sink, NODE_COLUMNS, fmt, "Point")
+    writer.write(ROWS)
+    list(writer.finish())
+
+    data = pyarrow.BufferReader(sink.drain())
+    if fmt == "parquet":
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(data)
+        geo = json.loads(table.schema.metadata[b"geo"])
+        assert geo["columns"]["geometry"]["encoding"] == "WKB"
+    else:
+        import pyarrow.ipc
+        table = pyarrow.ipc.open_file(data).read_all()
+    assert table.column("node_id").to_pylist() == [1, 2]
+    assert table.column("node_name").to_pylist() == ["Substation", None]
+    assert table.column("geometry").to_pylist()[0] == bytes(ROWS[0][-1])
+
+def test_export_flattens_properties_in_batches(fake_conn):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+    rows = [row[:10] + ("132kV", ) + row[11:] for row in ROWS]
+    fake_conn.results = [[("voltage", )], rows]
+    out = io.BytesIO()
+    count = export(fake_conn, "nodes", "parquet", out, {"area": "uk"}, flatten_properties=True, batch_size=1)
+    assert count == 2
+
+    sql, params = fake_conn.executed[1]
+    assert "properties->>%s" in sql
+    assert params == ["voltage", "uk"]
+    out.seek(0)
+    table = pyarrow.parquet.read_table(out)
+    assert table.column("properties.voltage").to_pylist() == ["132kV", "132kV"]
+    assert "properties" not in table.column_names
+
+class FakeWriter(object):
+    def __init__(self, out):
+        self.out = out
+        self.closed = False
+
+    def write(self, rows):
+        self.out.write(b"rows")
+
+    def finish(self):
+        yield
+
+    def close(self):
+        self.closed = True
+
+def test_export_closes_writer_when_stopped(monkeypatch, fake_conn):
+    writers = []
+    def export_writer(out, columns, layer, fmt):
+        writers.append(FakeWriter(out))
+        return writers[-1]
+    monkeypatch.setattr(app.export, "export_writer", export_writer)
+    fake_conn.results = [ROWS]
+    chunks = export_chunks(fake_conn, "nodes", "fgb", batch_size=1)
+    assert next(chunks) == b"rows"
+    # as when the client disconnects from a streaming response
+    chunks.close()
+    assert writers[0].closed
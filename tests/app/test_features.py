@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import json
+from app.features import stream_feature_collection
+
+def test_stream_empty_collection():
+    text = "".join(stream_feature_collection([]))
+    assert json.loads(text) == {"type": "FeatureCollection", "features": []}
+
+def test_stream_features_in_chunks():
+    features = [{"type": "Feature", "geometry": None, "properties": {"id": i}} for i in range(5)]
+    chunks = list(stream_feature_collection(iter(features), features_per_chunk=2))
+    # opening, three chunks of features, closing
+    assert len(chunks) == 5
+    assert json.loads("".join(chunks))["features"] == features
+
+def test_stream_extra_members():
+    text = "".join(stream_feature_collection([], members=lambda: {"next_after_id": 3}))
+    assert json.loads(text) == {"type": "FeatureCollection", "features": [], "next_after_id": 3}
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import numpy
+import pytest
+from app.graph import DependencyGraph, edge_ranges, _merge
+
+def make_graph():
+    # 10 -> 20 -> 30 -> 40, 10 -> 30, 50 alone, edge 6 to an unknown node
+    types = ["substation", "school"]
+    sectors = ["electricity", "water"]
+    nodes = (numpy.array([30, 10, 20, 40, 50]), numpy.array([1, 0, 0, 1, 1]))
+    edges = (
+        numpy.array([1, 2, 3, 4, 6]),
+        numpy.array([10, 20, 30, 10, 40]),
+        numpy.array([20, 30, 40, 30, 99]),
+        numpy.array([0, 0, 1, 0, 1])
+    )
+    return DependencyGraph(nodes, edges, types, sectors)
+
+def test_csr():
+    graph = make_graph()
+    assert list(graph.node_ids) == [10, 20, 30, 40, 50]
+    assert list(graph.indptr) == [0, 2, 3, 4, 4, 4]
+    assert graph.edge_count() == 4
+
+def test_cascade():
+    cascade = make_graph().cascade(10)
+    assert list(cascade["node_id"]) == [20, 30, 40]
+    assert list(cascade["depth"]) == [1, 1, 2]
+    assert list(cascade["parent_id"]) == [10, 10, 30]
+
+def test_cascade_max_depth():
+    cascade = make_graph().cascade(10, max_depth=1)
+    assert list(cascade["node_id"]) == [20, 30]
+
+def test_cascade_dict():
+    cascade = make_graph().cascade_dict(20)
+    assert cascade["count"] == 2
+    assert cascade["max_depth"] == 2
+    assert cascade["sectors"] == ["electricity", "water"]
+    assert cascade["nodes"][1] == {
+        "node_id": 40, "depth": 2, "parent_id": 30, "type": "school", "sector": "water"}
+
+def test_cascade_leaf():
+    cascade = make_graph().cascade_dict(50)
+    assert cascade["count"] == 0
+    assert cascade["nodes"] == []
+
+def test_cascade_unknown_node():
+    with pytest.raises(KeyError):
+        make_graph().cascade(99)
+
+def test_edge_ranges():
+    assert list(edge_ranges(numpy.array([0, 5, 7]), numpy.array([2, 5, 9]))) == [0, 1, 7, 8]
+
+def test_merge():
+    ids, (values, ) = _merge(numpy.array([1, 2, 3]), (numpy.array([10, 20, 30]), ),
+                             numpy.array([2, 4]), (numpy.array([21, 40]), ))
+    assert list(ids) == [1, 3, 2, 4]
+    assert list(values) == [10, 30, 21, 40]
+
+def test_cascade_from_several_nodes():
+    cascade = make_graph().cascade([20, 40, 99])
+    assert list(cascade["node_id"]) == [30]
+    assert list(cascade["parent_id"]) == [20]
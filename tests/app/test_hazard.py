@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import json
+import numpy
+import pytest
+from app.graph import DependencyGraph
+from app.hazard import count_by, exposure_summary, footprint_geometries
+
+POLYGON = {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+
+def test_footprint_geometries():
+    collection = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": POLYGON, "properties": {}},
+            {"type": "Feature", "geometry": None, "properties": {}}
+        ]
+    }
+    assert footprint_geometries(collection) == [POLYGON]
+    assert footprint_geometries(POLYGON) == [POLYGON]
+
+def test_footprint_geometries_invalid():
+    with pytest.raises(ValueError):
+        footprint_geometries({"type": "Topology"})
+
+def test_count_by():
+    assert count_by(["a", "b", "a"]) == {"a": 2, "b": 1}
+    assert count_by([None, "a"]) == {"unknown": 1, "a": 1}
+
+def test_exposure_summary():
+    summary = exposure_summary(
+        [(1, "substation"), (2, "school")],
+        [(10, "electricity", 5.0), (11, "electricity", 2.5)])
+    assert summary["nodes"]["by_type"] == {"substation": 1, "school": 1}
+    assert summary["edges"]["by_sector"] == {"electricity": {"count": 2, "length": 7.5}}
+
+def test_exposure_summary_without_type_or_sector():
+    summary = exposure_summary([(1, None), (2, "school")], [(10, None, 1.0)])
+    assert summary["nodes"]["by_type"] == {"unknown": 1, "school": 1}
+    assert summary["edges"]["by_sector"] == {"unknown": {"count": 1, "length": 1.0}}
+    json.dumps(summary, sort_keys=True)
+
+def test_exposure_summary_cascade():
+    graph = DependencyGraph(
+        (numpy.array([1, 2, 3]), numpy.array([0, 1, 1])),
+        (numpy.array([1, 2]), numpy.array([1, 2]), numpy.array([2, 3]), numpy.array([0, 0])),
+        ["substation", "school"], ["electricity"])
+    summary = exposure_summary([(1, "substation")], graph=graph)
+    assert summary["cascade"]["count"] == 2
+    assert summary["cascade"]["by_type"] == {"school": 2}
+    assert summary["cascade"]["sectors"] == ["electricity"]
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import datetime
+import os
+import sys
+import pytest
+from app.job import job_command, job_dict, validate_args
+
+def test_validate_args():
+    args = validate_args("osm_import", {"path": "monaco.osm.pbf", "source": "osm_extract",
+                                        "area": "monaco", "workers": "4", "ways": True})
+    assert args == {"path": "monaco.osm.pbf", "source": "osm_extract", "area": "monaco",
+                    "workers": 4, "ways": True}
+
+@pytest.mark.parametrize("job_type,args", [
+    ("shell", {}),
+    ("osm_import", {"path": "monaco.osm.pbf", "source": "osm_extract"}),
+    ("criticality", {"threads": 4}),
+    ("criticality", {"workers": "many"}),
+    ("osm_import", {"path": "a", "source": "b", "area": "c", "ways": "yes"})
+])
+def test_validate_args_rejects(job_type, args):
+    with pytest.raises(ValueError):
+        validate_args(job_type, args)
+
+def test_job_command():
+    args = {"from_type": "water_treatment", "to_type": "hospital", "sector": "water",
+            "method": "kdtree", "max_distance": 5000.0}
+    assert job_command("dependencies", args) == [
+        sys.executable, "-m", "data_import.depend_on_nearest_of_type",
+        "water_treatment", "hospital", "water",
+        "--max-distance", "5000.0", "--method", "kdtree"
+    ]
+    assert job_command("osm_import", {"path": "a", "source": "b", "area": "c", "ways": True,
+                                      "upsert": False}) == [
+        sys.executable, "-m", "data_import.osm", "a", "b", "c", "--ways"
+    ]
+
+def test_job_command_scratch_files():
+    command = job_command("osm_import", {"path": "a", "source": "b", "area": "c", "ways": True},
+                          job_dir="/tmp/job_1")
+    assert command[-2:] == ["--coords-cache", os.path.join("/tmp/job_1", "coords.sqlite")]
+    assert "--coords-cache" not in job_command("criticality", {}, job_dir="/tmp/job_2")
+
+def test_job_dict_dates():
+    row = {"job_id": 1, "submitted_at": datetime.datetime(2018, 1, 1, 12),
+           "started_at": None, "heartbeat_at": None, "finished_at": None}
+    assert job_dict(row)["submitted_at"] == "2018-01-01T12:00:00"
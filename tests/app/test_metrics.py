@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from app.metrics import Histogram, Registry, Timings, current, finish_request, start_request, timed
+
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    lines = histogram.lines("latency", {"route": "/"})
+    assert lines == [
+        'latency_bucket{le="0.1",route="/"} 1',
+        'latency_bucket{le="1",route="/"} 2',
+        'latency_bucket{le="+Inf",route="/"} 3',
+        'latency_sum{route="/"} 5.55',
+        'latency_count{route="/"} 3'
+    ]
+
+def test_timed_outside_request():
+    assert current() is None
+    with timed("query"):
+        pass
+
+def test_request_timings():
+    observed = []
+    timings = start_request()
+    with timed("query"):
+        pass
+    timings.add("render", 0.002)
+    assert current() is timings
+    assert set(timings.phases) == {"query", "render"}
+    assert "render;dur=2.0" in timings.server_timing()
+
+    from app import metrics
+    metrics.add_observer(lambda *args: observed.append(args))
+    try:
+        finish_request("/nodes.json", "GET", 200)
+    finally:
+        metrics._observers.pop()
+    assert current() is None
+    assert observed[0][:3] == ("/nodes.json", "GET", 200)
+
+def test_registry_render():
+    registry = Registry()
+    timings = Timings()
+    timings.add("query", 0.01)
+    registry("/nodes.json", "GET", 200, 0.02, timings)
+    registry.observe_query(0.01)
+    text = registry.render()
+    assert 'app_request_duration_seconds_count{method="GET",route="/nodes.json",status="200"} 1' in text
+    assert 'app_request_phase_seconds_count{phase="query",route="/nodes.json"} 1' in text
+    assert "app_sql_duration_seconds_count 1" in text
+    assert "app_sql_slow_queries_total 0" in text
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import datetime
+import pytest
+from app.node import Node, NodeCollection, bulk_edit_nodes
+
+def test_set_status_transitions():
+    node = Node()
+    node.set_status("staged")
+    node.set_status("archived")
+    assert node.status == "staged"
+    node.set_status("approved")
+    assert node.status == "approved"
+    node.set_status("staged")
+    assert node.status == "approved"
+    node.set_status("archived")
+    assert node.status == "archived"
+
+def test_bulk_edit_requires_filter():
+    with pytest.raises(ValueError):
+        bulk_edit_nodes(None, status="approved")
+
+def test_bulk_edit_requires_change():
+    with pytest.raises(ValueError):
+        bulk_edit_nodes(None, area="uk")
+
+def test_bulk_edit_checks_fields():
+    with pytest.raises(ValueError):
+        bulk_edit_nodes(None, area="uk", fields={"status": "approved"})
+    with pytest.raises(ValueError):
+        bulk_edit_nodes(None, area="uk", status="deleted")
+
+def test_bulk_edit_requires_list_filters():
+    # a string would reach = ANY(%s) as a malformed array literal
+    with pytest.raises(ValueError):
+        bulk_edit_nodes(None, node_types="school", status="approved")
+
+def make_collection():
+    return NodeCollection.from_rows([
+        (1, -1.5, 51.5, "Substation", "substation", "supply", "good", "approved", 1514764800),
+        (2, 0.5, 52.5, None, "water_tower", None, None, "staged", 1514851200),
+        (3, -1.0, 51.0, "Tower", "water_tower", None, None, "staged", 1514937600),
+    ])
+
+def test_collection_rows():
+    nodes = make_collection()
+    assert len(nodes) == 3
+    node = nodes[0]
+    assert (node.id, node.name, node.type, node.status) == (1, "Substation", "substation", "approved")
+    assert node.last_updated == datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc)
+    assert node.as_geojson_feature_dict()["geometry"]["coordinates"] == [-1.5, 51.5]
+    assert nodes[-1].id == 3
+    assert [n.name for n in nodes] == ["Substation", "", "Tower"]
+
+def test_collection_filters():
+    nodes = make_collection()
+    staged = nodes[nodes.statuses.isin(["staged"])]
+    assert staged.ids.tolist() == [2, 3]
+    assert staged.names[1] == "Tower"
+    assert nodes[nodes.in_bbox((-2, 51, 0, 52))].ids.tolist() == [1, 3]
+    since = datetime.datetime(2018, 1, 2, tzinfo=datetime.timezone.utc)
+    assert nodes[nodes.updated_since(since)].ids.tolist() == [3]
+    assert nodes[1:].ids.tolist() == [2, 3]
+
+def test_delete_counts_lookups(fake_conn):
+    fake_conn.results = [[("substation", "uk")]]
+    node = Node()
+    node.id = 1
+    node.status = "staged"
+    node.delete(fake_conn)
+    counted = [params for _, params in fake_conn.executed_sql("sos_count_node")]
+    assert counted == [("substation", "uk", -1, None, None)]
+
+def test_save_counts_lookups(fake_conn):
+    fake_conn.results = [[("substation", "uk", 0.5, 51.5)]]
+    node = Node()
+    node.id = 1
+    node.type = "water_tower"
+    node.lon, node.lat = 1.5, 52.5
+    node.save(fake_conn)
+    counted = [params for _, params in fake_conn.executed_sql("sos_count_node")]
+    assert counted == [
+        ("substation", None, -1, None, None),
+        ("water_tower", None, 1, None, None),
+        (None, "uk", 0, 1.5, 52.5)
+    ]
+    assert fake_conn.executed_sql("sos_refresh_lookups") == []
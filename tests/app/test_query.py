@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import pytest
+from app.query import next_after_id, page_clause, where_clause
+
+def test_where_clause_skips_none():
+    sql, params = where_clause([("area = %s", None), ("type = ANY(%s)", ["a", "b"])])
+    assert sql == " WHERE type = ANY(%s)"
+    assert params == [["a", "b"]]
+
+def test_where_clause_expands_tuples():
+    sql, params = where_clause([("x BETWEEN %s AND %s", (1, 2)), ("y = %s", 3)])
+    assert sql == " WHERE x BETWEEN %s AND %s AND y = %s"
+    assert params == [1, 2, 3]
+
+def test_where_clause_empty():
+    assert where_clause([("area = %s", None)]) == ("", [])
+
+def test_page_clause():
+    assert page_clause("node_id") == ("", [])
+    assert page_clause("node_id", after_id=10) == (" ORDER BY node_id", [])
+    assert page_clause("node_id", limit=5) == (" ORDER BY node_id LIMIT %s", [5])
+
+def test_page_clause_rejects_limit_below_one():
+    with pytest.raises(ValueError):
+        page_clause("node_id", limit=0)
+
+def test_next_after_id():
+    assert next_after_id(42, 10, 10) == 42
+    assert next_after_id(42, 3, 10) is None
+    assert next_after_id(42, 3, None) is None
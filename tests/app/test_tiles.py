@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import psycopg2
+import pytest
+from app.tiles import WORLD_HALF_WIDTH, TilesUnavailable, get_edge_tile, get_node_tile, tile_bounds, valid_tile
+
+def test_world_tile_bounds():
+    assert tile_bounds(0, 0, 0) == (-WORLD_HALF_WIDTH, -WORLD_HALF_WIDTH, WORLD_HALF_WIDTH, WORLD_HALF_WIDTH)
+
+def test_tile_bounds_north_west():
+    xmin, ymin, xmax, ymax = tile_bounds(1, 0, 0)
+    assert (xmin, ymax) == (-WORLD_HALF_WIDTH, WORLD_HALF_WIDTH)
+    assert (xmax, ymin) == (0, 0)
+
+def test_valid_tile():
+    assert valid_tile(2, 3, 3)
+    assert not valid_tile(2, 4, 0)
+    assert not valid_tile(-1, 0, 0)
+
+def test_world_tile_searches_whole_world(fake_conn):
+    fake_conn.results = [[(b"", )]]
+    get_node_tile(fake_conn, 0, 0, 0)
+    sql, params = fake_conn.executed[0]
+    # a geography envelope spanning lon -180..180 would collapse
+    assert "::geography" not in sql
+    assert "n.location::geometry && bounds.search" in sql
+    xmin, ymin, xmax, ymax = params[4:8]
+    assert xmin < -WORLD_HALF_WIDTH and xmax > WORLD_HALF_WIDTH
+    assert ymin < -WORLD_HALF_WIDTH and ymax > WORLD_HALF_WIDTH
+
+class UndefinedFunction(psycopg2.ProgrammingError):
+    pgcode = "42883"
+
+def test_tiles_unavailable_without_st_asmvt(fake_conn):
+    fake_conn.results = [
+        UndefinedFunction("function st_asmvt(record, unknown, integer, unknown) does not exist")]
+    with pytest.raises(TilesUnavailable):
+        get_edge_tile(fake_conn, 0, 0, 0)
@@ -0,0 +1,9 @@
+from benchmarks.compare import compare
+
+def test_compare_flags_regressions():
+    base = {("get_nodes", 1000): {"median": 1.0}, ("get_edges", 1000): {"median": 2.0}}
+    head = {("get_nodes", 1000): {"median": 1.5}, ("get_edges", 1000): {"median": 1.0},
+            ("nodes_json", 1000): {"median": 1.0}}
+    rows, regressions = compare(base, head, threshold=0.1)
+    assert [row[0] for row in rows] == ["get_edges", "get_nodes"]
+    assert [row[0] for row in regressions] == ["get_nodes"]
@@ -0,0 +1,32 @@
+import xml.etree.ElementTree as ET
+from benchmarks.synthetic import DEFAULT_BBOX, generate_nodes, rule_tags, write_osm
+from data_import.rules import load_rules
+
+def test_generate_nodes_is_reproducible():
+    assert generate_nodes(50, seed=1) == generate_nodes(50, seed=1)
+    assert generate_nodes(50, seed=1) != generate_nodes(50, seed=2)
+
+def test_generated_nodes_in_bbox():
+    min_lon, min_lat, max_lon, max_lat = DEFAULT_BBOX
+    for _, _, (lon, lat) in generate_nodes(200):
+        assert min_lon <= lon <= max_lon
+        assert min_lat <= lat <= max_lat
+
+def test_match_fraction():
+    rules = load_rules()
+    nodes = generate_nodes(1000, match_fraction=0.5)
+    matched = [node for node in nodes if rules.classify(node[1])]
+    assert 400 < len(matched) < 600
+
+def test_rule_tags_satisfy_requirements():
+    rule = {"type": "tower", "tag": "man_made", "value": "tower",
+            "require": {"tower:type": "communication", "disused": False}}
+    assert rule_tags(rule) == {"man_made": "tower", "tower:type": "communication"}
+
+def test_write_osm(tmpdir):
+    path = str(tmpdir.join("synthetic.osm"))
+    nodes = generate_nodes(10)
+    write_osm(path, nodes)
+    elements = ET.parse(path).getroot().findall("node")
+    assert [int(element.get("id")) for element in elements] == [osmid for osmid, _, _ in nodes]
+    assert dict((tag.get("k"), tag.get("v")) for tag in elements[0].iter("tag")) == nodes[0][1]
@@ -0,0 +1,84 @@
+import pytest
+
+class FakeCursor(object):
+    """Cursor of a `FakeConnection`, which records what is run on it
+    """
+    def __init__(self, conn, name=None):
+        self.conn = conn
+        self.name = name
+        self.rows = []
+        self.rowcount = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append((sql, params))
+        result = self.conn.results.pop(0) if self.conn.results else []
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, int):
+            self.rows, self.rowcount = [], result
+        else:
+            self.rows = list(result)
+            self.rowcount = len(self.rows)
+
+    def copy_expert(self, sql, buf, size=8192):
+        self.conn.copied.append((sql, buf.read()))
+
+    def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def close(self):
+        pass
+
+class FakeConnection(object):
+    """Stands in for a psycopg2 connection
+
+    Each query takes the next result from `results`: a list of rows, a
+    number of rows affected by a statement which returns none, or an
+    exception to raise. Queries past the end of `results` return no rows.
+    Queries are recorded in `executed` as (sql, params), COPY in `copied`
+    as (sql, data).
+    """
+    def __init__(self, results=None):
+        self.results = list(results or [])
+        self.executed = []
+        self.copied = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, name=None):
+        return FakeCursor(self, name)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def executed_sql(self, fragment):
+        """Queries which contain `fragment`, as (sql, params)
+        """
+        return [(sql, params) for sql, params in self.executed if fragment in sql]
+
+@pytest.fixture
+def fake_conn():
+    return FakeConnection()
@@ -0,0 +1,61 @@
+from data_import.bulk import CopyWriter, copy_text_value, is_unique_violation, node_writer
+
+def test_copy_text_value():
+    assert copy_text_value(None) == "\\N"
+    assert copy_text_value(1) == "1"
+    assert copy_text_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+def test_copy_writer_batches(fake_conn):
+    writer = CopyWriter(fake_conn, "sos_i_nodes", ("ref_key", "node_name"), batch_size=2)
+    writer.add((1, "one"))
+    assert fake_conn.copied == []
+    writer.add((2, "two"))
+    writer.add((3, None))
+    writer.close()
+
+    assert fake_conn.copied == [
+        ("COPY sos_i_nodes (ref_key, node_name) FROM STDIN", "1\tone\n2\ttwo\n"),
+        ("COPY sos_i_nodes (ref_key, node_name) FROM STDIN", "3\t\\N\n"),
+    ]
+    assert writer.rows_written == 3
+
+def test_copy_writer_single_transaction(fake_conn):
+    writer = CopyWriter(fake_conn, "sos_i_nodes", ("ref_key",), batch_size=1,
+                        commit_each_batch=False)
+    writer.add((1,))
+    writer.add((2,))
+    assert fake_conn.commits == 0
+    writer.close()
+    assert fake_conn.commits == 1
+
+def test_node_upsert_keeps_last_row_of_each_key(fake_conn):
+    writer = node_writer(fake_conn, upsert=True)
+    writer.add((1, "old", "bank", "POINT(0 0)", None, 1, "uk"))
+    writer.add((1, "new", "bank", "POINT(0 0)", None, 1, "uk"))
+    writer.close()
+
+    (merge, _), = fake_conn.executed_sql("INSERT INTO sos_i_nodes")
+    assert "ORDER BY data_source_id, ref_key, type, seq DESC" in merge
+    assert "ON CONFLICT (data_source_id, ref_key, type)" in merge
+
+def test_node_copy_logs_one_reset_per_batch(fake_conn):
+    writer = node_writer(fake_conn, batch_size=2)
+    writer.add_many([(n, "node", "bank", "POINT(0 0)", None, 1, "uk") for n in range(3)])
+    writer.close()
+
+    assert len(fake_conn.copied) == 2
+    assert [sql for sql, _ in fake_conn.executed] == [
+        "ALTER TABLE sos_i_nodes DISABLE TRIGGER sos_i_nodes_log_change",
+        "ALTER TABLE sos_i_nodes ENABLE TRIGGER sos_i_nodes_log_change",
+        "INSERT INTO sos_i_changes (layer, operation) VALUES (%s, 'T')",
+    ] * 2
+
+class FakeDatabaseError(Exception):
+    def __init__(self, pgcode):
+        super(FakeDatabaseError, self).__init__()
+        self.pgcode = pgcode
+
+def test_is_unique_violation():
+    assert is_unique_violation(FakeDatabaseError("23505"))
+    assert not is_unique_violation(FakeDatabaseError("23503"))
+    assert not is_unique_violation(ValueError())
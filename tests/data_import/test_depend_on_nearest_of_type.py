@@ -0,0 +1,28 @@
+from data_import.depend_on_nearest_of_type import add_edges_to_nearest
+
+def test_add_edges_to_k_nearest(fake_conn):
+    fake_conn.results = [3]
+    assert add_edges_to_nearest(fake_conn, "substation", "school", "electricity", k=2) == 3
+    assert fake_conn.commits == 1
+
+    (sql, params), = fake_conn.executed
+    assert "ORDER BY from_nodes.location <-> to_nodes.location" in sql
+    assert "LIMIT %(k)s" in sql
+    assert "ST_DWithin" not in sql
+    assert params == {
+        "sector": "electricity",
+        "from_type": "substation",
+        "to_type": "school",
+        "k": 2,
+        "max_distance": None
+    }
+
+def test_add_edges_to_nearest_within_max_distance(fake_conn):
+    add_edges_to_nearest(fake_conn, "substation", "school", "electricity", max_distance=500.0)
+
+    (sql, params), = fake_conn.executed
+    assert "AND ST_DWithin(from_nodes.location, to_nodes.location, %(max_distance)s)" in sql
+    # the distance filter is inside the nearest node search, before its limit
+    assert sql.index("ST_DWithin") < sql.index("LIMIT %(k)s")
+    assert params["k"] == 1
+    assert params["max_distance"] == 500.0
@@ -0,0 +1,29 @@
+from data_import.nearest import capacity_limited_pairs, nearest_pairs
+import numpy
+
+FROM_LONLAT = numpy.array([[0.0, 0.0], [0.0, 1.0]])
+TO_LONLAT = numpy.array([[0.0, 0.1], [0.0, 0.2], [0.0, 0.9]])
+
+def test_nearest_pairs():
+    from_index, to_index, distance = nearest_pairs(FROM_LONLAT, TO_LONLAT)
+    assert list(from_index) == [0, 0, 1]
+    assert list(to_index) == [0, 1, 2]
+    # 0.1 degree of latitude is about 11km
+    assert abs(distance[0] - 11119.5) < 1
+
+def test_nearest_pairs_k_and_max_distance():
+    from_index, to_index, _ = nearest_pairs(FROM_LONLAT, TO_LONLAT, k=2, max_distance=50000)
+    assert list(from_index) == [0, 0, 1]
+
+    from_index, to_index, _ = nearest_pairs(FROM_LONLAT, TO_LONLAT, k=2)
+    assert list(to_index) == [0, 0, 1, 1, 2, 2]
+
+def test_capacity_limited_pairs():
+    from_index, to_index, _ = capacity_limited_pairs(FROM_LONLAT, TO_LONLAT, [1, 5], k=2)
+    # the closer of the first two takes the only place at from point 0
+    assert list(from_index) == [0, 1, 1]
+    assert list(to_index) == [0, 1, 2]
+
+def test_capacity_limited_pairs_unassigned():
+    from_index, to_index, _ = capacity_limited_pairs(FROM_LONLAT, TO_LONLAT, 1, k=1)
+    assert list(to_index) == [0, 2]
@@ -0,0 +1,44 @@
+from data_import import osc
+from data_import.osc import iter_node_changes
+import os
+
+def test_iter_node_changes():
+    input_filepath = os.path.join(os.path.dirname(__file__), "data", "bank.osc")
+    changes = list(iter_node_changes(input_filepath))
+    assert changes == [
+        ("modify", 1, {"amenity": "bank", "name": "Bank of Testing"}, (10.0, 50.0)),
+        ("create", 2, {"amenity": "school"}, (10.5, 50.5)),
+        ("delete", 4, {}, None),
+    ]
+
+class FakeRules(object):
+    def classify(self, tags):
+        return [tags["amenity"]] if "amenity" in tags else []
+
+class FakeNodeHandler(object):
+    def __init__(self):
+        self.saved = []
+
+    def nodes(self, nodes):
+        self.saved.extend(nodes)
+
+class FakeWriter(object):
+    def flush(self):
+        pass
+
+def test_change_handler_applies_last_version(monkeypatch):
+    retired = []
+    monkeypatch.setattr(osc, "retire_nodes", lambda conn, source, ref_keys, keep: (
+        retired.append((sorted(ref_keys), sorted(keep))) or (0, 0)))
+    node_handler = FakeNodeHandler()
+    handler = osc.ChangeHandler(None, node_handler, FakeWriter(), FakeRules(), 1)
+    handler.changes([
+        ("modify", 1, {"shop": "bakery"}, (0, 0)),
+        ("modify", 1, {"amenity": "bank"}, (0, 0)),
+        ("create", 2, {"amenity": "school"}, (1, 1)),
+        ("delete", 2, {}, None)
+    ])
+    handler.flush()
+
+    assert node_handler.saved == [(1, {"amenity": "bank"}, (0, 0))]
+    assert retired == [([1, 2], [(1, "bank")])]
@@ -0,0 +1,73 @@
+import io
+from data_import.pipeline import ClassifyingTagFilter, QueueNodeHandler, TYPES_TAG, stop_writer
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+from data_import.progress import Progress
+
+class FakeQueue(object):
+    def __init__(self):
+        self.items = []
+
+    def put(self, item, timeout=None):
+        self.items.append(item)
+
+def classify(tags):
+    if tags.get('amenity') == 'bank':
+        return ['bank']
+    return []
+
+def test_tag_filter_keeps_matching_nodes():
+    tags = {'amenity': 'bank', 'name': 'Bank of Testing', 'opening_hours': '24/7'}
+    ClassifyingTagFilter(classify)(tags)
+    assert tags == {'name': 'Bank of Testing', TYPES_TAG: 'bank'}
+
+def test_tag_filter_clears_other_nodes():
+    tags = {'amenity': 'bench'}
+    ClassifyingTagFilter(classify)(tags)
+    assert tags == {}
+
+def test_handler_sends_compact_batch():
+    row_queue = FakeQueue()
+    handler = QueueNodeHandler(row_queue, writer_process=None)
+    handler.nodes([
+        (1, {'name': 'Bank of Testing', TYPES_TAG: 'bank'}, (10.0, 50.0)),
+        (2, {}, (11.0, 51.0)),
+    ])
+    assert row_queue.items == [[(1, 'Bank of Testing', 'bank', 10.0, 50.0)]]
+
+def test_handler_counts_parsed_and_matched():
+    progress = Progress("nodes", interval=1000, out=io.StringIO())
+    handler = QueueNodeHandler(FakeQueue(), writer_process=None, progress=progress)
+    handler.nodes([
+        (1, {'name': 'Bank of Testing', TYPES_TAG: 'bank'}, (10.0, 50.0)),
+        (2, {'name': 'Bench'}, (11.0, 51.0)),
+    ])
+    assert progress.counts == {'parsed': 2, 'matched': 1}
+
+class FullQueue(object):
+    def put(self, item, timeout=None):
+        raise queue.Full()
+
+class FakeProcess(object):
+    def __init__(self, alive):
+        # answers to successive is_alive calls
+        self.alive = list(alive)
+        self.joined = False
+
+    def is_alive(self):
+        return self.alive.pop(0)
+
+    def join(self):
+        self.joined = True
+
+def test_stop_writer_after_writer_exited():
+    # neither a writer which had already exited, nor one which exits while
+    # the queue is full, raises in place of the parser's error
+    for alive in ([False], [True, False]):
+        writer_process = FakeProcess(alive)
+        handler = QueueNodeHandler(FullQueue(), writer_process, put_timeout=0)
+        stop_writer(handler, writer_process)
+        assert writer_process.joined
+        assert writer_process.alive == []
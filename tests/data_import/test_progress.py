@@ -0,0 +1,70 @@
+import io
+import json
+from data_import.progress import Profiler, Progress, file_offset, phase
+
+def test_counts_stages_in_report():
+    out = io.StringIO()
+    progress = Progress("nodes", interval=1000, out=out)
+    progress.parsed(10)
+    progress.matched(4)
+    progress.written(3, seconds=0.5)
+    progress.finish()
+    assert progress.count == 3
+    assert out.getvalue().startswith("nodes: 10 parsed, 4 matched, 3 written in ")
+    assert progress.summary()["phases"] == {"write": 0.5}
+
+def test_rate_of_last_stage():
+    progress = Progress("nodes", out=io.StringIO())
+    progress.parsed(100)
+    progress.matched(10)
+    assert progress.rate(now=progress._start + 10) == 1.0
+
+def test_eta_from_fraction_read():
+    progress = Progress("nodes", out=io.StringIO())
+    assert progress.eta(now=progress._start + 10, fraction=0.25) == 30
+    assert progress.eta() is None
+
+def test_file_offset(tmpdir):
+    path = str(tmpdir.join("extract.osm.pbf"))
+    with open(path, "wb") as extract:
+        extract.write(b"x" * 100)
+    assert file_offset(path) is None
+    with open(path, "rb", buffering=0) as extract:
+        extract.read(40)
+        offset = file_offset(path)
+    # /proc is only available on Linux
+    assert offset in (40, None)
+
+def test_reports_queue_size():
+    class FakeQueue(object):
+        def qsize(self):
+            return 7
+
+    out = io.StringIO()
+    progress = Progress("nodes", out=out)
+    progress.watch_queue("rows", FakeQueue())
+    progress.report()
+    assert out.getvalue().strip().endswith("rows queue 7")
+
+def test_phase_without_progress():
+    with phase(None, "classify"):
+        pass
+    progress = Progress(out=io.StringIO())
+    with phase(progress, "classify"):
+        pass
+    assert "classify" in progress.phases
+
+def test_profiler_writes_report(tmpdir):
+    path = str(tmpdir.join("import.prof"))
+    profiler = Profiler(path)
+    profiler.start()
+    progress = profiler.track(Progress("nodes", out=io.StringIO()))
+    progress.written(5)
+    profiler.add_summary({"label": "writer"})
+    profiler.finish()
+
+    with open(path + ".json") as report_file:
+        report = json.load(report_file)
+    assert [summary["label"] for summary in report["progress"]] == ["nodes", "writer"]
+    assert report["progress"][0]["counts"] == {"written": 5}
+    assert report["functions"]
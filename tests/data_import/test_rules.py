@@ -0,0 +1,29 @@
+from data_import.rules import RuleSet, load_rules
+
+def test_default_rules():
+    rules = load_rules()
+    assert rules.classify({'amenity': 'bank', 'name': 'Bank of Testing'}) == ['bank']
+    assert rules.classify({'man_made': 'water_works'}) == ['water_treatment']
+    assert rules.classify({'amenity': 'bench'}) == []
+
+def test_secondary_tag_predicate():
+    rules = load_rules()
+    assert rules.classify({'man_made': 'tower', 'tower:type': 'communication'}) == ['tower']
+    assert rules.classify({'man_made': 'tower', 'tower:type': 'cooling'}) == []
+    assert rules.classify({'man_made': 'tower'}) == []
+
+def test_predicate_forms():
+    rules = RuleSet([
+        {"type": "a", "tag": "k", "value": "v", "require": {"x": True}},
+        {"type": "b", "tag": "k", "value": "v", "require": {"x": False}},
+        {"type": "c", "tag": "k", "value": "v", "require": {"y": ["1", "2"]}},
+    ])
+    assert rules.classify({'k': 'v', 'x': 'anything'}) == ['a']
+    assert rules.classify({'k': 'v', 'y': '2'}) == ['b', 'c']
+
+def test_matches_in_rule_order():
+    rules = RuleSet([
+        {"type": "first", "tag": "amenity", "value": "bank"},
+        {"type": "second", "tag": "man_made", "value": "tower"},
+    ])
+    assert rules.classify({'man_made': 'tower', 'amenity': 'bank'}) == ['first', 'second']
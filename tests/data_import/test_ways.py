@@ -0,0 +1,58 @@
+from data_import.coords import CoordCache
+from data_import.rules import load_rules
+from data_import.bulk import CopyWriter, UpsertWriter
+from data_import.ways import WayHandler, centroid, edge_writer, join_rings
+
+class ListWriter(object):
+    def __init__(self):
+        self.rows = []
+
+    def add(self, row):
+        self.rows.append(row)
+
+def test_centroid_square():
+    square = [(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)]
+    assert centroid([square]) == (1.0, 1.0)
+    assert centroid([list(reversed(square))]) == (1.0, 1.0)
+
+def test_join_rings():
+    rings = join_rings([[(0, 0), (2, 0), (2, 2)], [(0, 0), (0, 2), (2, 2)]])
+    assert len(rings) == 1
+    assert rings[0][0] == rings[0][-1]
+    assert centroid(rings) == (1.0, 1.0)
+
+def test_ways_and_relations(tmpdir):
+    cache = CoordCache(str(tmpdir.join("coords.sqlite")))
+    handler = WayHandler(load_rules(kind="ways"), cache)
+    edges = ListWriter()
+    nodes = ListWriter()
+    handler.writers(edges, nodes)
+    handler.source(1)
+    handler.area("test")
+
+    handler.coords([(1, 0.0, 0.0), (2, 2.0, 0.0), (3, 2.0, 2.0), (4, 0.0, 2.0)])
+    handler.relations([
+        (10, {'type': 'multipolygon', 'power': 'substation'}, [(21, 'way', 'outer'), (22, 'way', 'outer')])
+    ])
+    handler.ways([
+        (20, {'power': 'line', 'name': 'Line'}, [1, 2, 3]),
+        (21, {}, [1, 2, 3]),
+        (22, {}, [3, 4, 1]),
+        (23, {'man_made': 'water_works'}, [1, 2, 3, 4, 1]),
+    ])
+    handler.finish_relations()
+    cache.close()
+
+    assert [row[:3] for row in edges.rows] == [("Line", "electricity", 20)]
+    assert edges.rows[0][4] == "LINESTRING(0.0 0.0, 2.0 0.0, 2.0 2.0)"
+    assert edges.rows[0][6] == "test"
+    assert [row[:4] for row in nodes.rows] == [
+        ("way/23", "", "water_treatment", "POINT(1.0 1.0)"),
+        ("relation/10", "", "electricity_sink", "POINT(1.0 1.0)"),
+    ]
+
+def test_edge_writer_upserts_on_ref_key():
+    assert type(edge_writer(None)) is CopyWriter
+    writer = edge_writer(None, upsert=True)
+    assert isinstance(writer, UpsertWriter)
+    assert writer.keys_table == "staging_sos_i_edges_keys"
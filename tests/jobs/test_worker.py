@@ -0,0 +1,49 @@
+import pytest
+from jobs import worker
+from jobs.worker import last_line, parse_limits, tail
+
+def test_tail(tmpdir):
+    path = str(tmpdir.join("job_1.log"))
+    with open(path, "wb") as log_file:
+        log_file.write(b"a" * 100 + b"\nnodes: 10 written in 1.0s (10 nodes/s)\n")
+    assert tail(path, max_bytes=10) == " nodes/s)\n"
+    assert last_line(tail(path)) == "nodes: 10 written in 1.0s (10 nodes/s)"
+
+def test_last_line():
+    assert last_line("") is None
+    assert last_line("one\rtwo\r") == "two"
+
+def test_parse_limits():
+    assert parse_limits(["osm_import=4", "criticality=1"]) == {"osm_import": 4, "criticality": 1}
+    with pytest.raises(ValueError):
+        parse_limits(["shell=1"])
+    with pytest.raises(ValueError):
+        parse_limits(["osm_import"])
+
+def test_job_which_cannot_start_is_failed(monkeypatch, tmpdir):
+    jobs = [{"job_id": 1, "job_type": "criticality", "args": {}}]
+    finished = []
+    monkeypatch.setattr(worker, "fail_stale_jobs", lambda conn, timeout: [])
+    monkeypatch.setattr(worker, "claim_job", lambda conn, name, limits, job_types: (
+        jobs.pop() if jobs else None))
+    monkeypatch.setattr(worker, "finish_job", lambda conn, job_id, status, exit_code=None, output=None: (
+        finished.append((job_id, status))))
+    monkeypatch.setattr(worker, "job_command", lambda job_type, args, job_dir: [
+        str(tmpdir.join("no-such-program"))])
+
+    running = worker.Worker(None, slots=1, log_dir=str(tmpdir), keep_changes=0).run_once()
+    assert running == 0
+    assert finished == [(1, "failed")]
+
+def test_prune_once_an_hour(monkeypatch, fake_conn):
+    pruned = []
+    monkeypatch.setattr(worker, "prune_changes", lambda conn, keep_days: pruned.append(keep_days))
+    job_worker = worker.Worker(fake_conn, slots=1, keep_changes=7)
+    job_worker.prune(now=0)
+    job_worker.prune(now=60)
+    job_worker.prune(now=worker.PRUNE_INTERVAL)
+    assert pruned == [7, 7]
+    assert fake_conn.commits == 2
+
+    worker.Worker(fake_conn, slots=1, keep_changes=0).prune(now=0)
+    assert pruned == [7, 7]